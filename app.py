@@ -24,7 +24,8 @@ from ui import (
     show_browse_items_page,
     show_my_ratings_page,
     show_admin_page,
-    show_item_detail_page
+    show_item_detail_page,
+    flush_events
 )
 from utils.config import APP_TITLE
 
@@ -72,6 +73,37 @@ def setup_logging():
     logging.info("Logging configured")
 
 
+def _current_user():
+    """
+    Get the logged in user, loading it at most once per login.
+    
+    The user is kept in session state, so reruns don't query the database.
+    Pages update this same instance when the user edits their profile.
+    
+    Returns:
+        The current user, or None if nobody is logged in
+    """
+    user_id = st.session_state.get("user_id")
+    if user_id is None:
+        st.session_state.pop("user_obj", None)
+        return None
+    
+    user = st.session_state.get("user_obj")
+    if user is None or user.id != user_id:
+        user = UserModel.find_by_id(user_id)
+        
+        # If user not found, clear session state
+        if not user:
+            st.session_state.pop("user_id", None)
+            st.session_state.pop("page", None)
+            st.session_state.pop("user_obj", None)
+            return None
+        
+        st.session_state["user_obj"] = user
+    
+    return user
+
+
 def main():
     """Main application entry point."""
     # Set up logging
@@ -106,19 +138,14 @@ def main():
         st.session_state["activity_observer"] = observer
         logger.info("Activity observer initialized")
     
+    # Record activity buffered by the previous run in one batch
+    flush_events()
+    
     # Get recommendation engine from session state
     engine = st.session_state.get("engine")
     
     # Get current user if logged in
-    current_user = None
-    if "user_id" in st.session_state:
-        user_id = st.session_state["user_id"]
-        current_user = UserModel.find_by_id(user_id)
-        
-        # If user not found, clear session state
-        if not current_user:
-            st.session_state.pop("user_id", None)
-            st.session_state.pop("page", None)
+    current_user = _current_user()
     
     # Navigation
     selected_page = show_sidebar_navigation(current_user)
@@ -141,7 +168,7 @@ def main():
         elif selected_page == "Recommendations" and current_user:
             show_recommendations_page(current_user, engine)
         elif selected_page == "Browse Items" and current_user:
-            show_browse_items_page(current_user)
+            show_browse_items_page(current_user, engine)
         elif selected_page == "My Ratings" and current_user:
             show_my_ratings_page(current_user)
         elif selected_page == "Admin" and current_user:
@@ -0,0 +1,14 @@
+-- Return the columns of every public table as one JSON object (table name -> column names)
+CREATE OR REPLACE FUNCTION public.get_schema_columns()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(jsonb_object_agg(table_name, cols), '{}'::jsonb)
+    FROM (
+        SELECT table_name, jsonb_agg(column_name ORDER BY ordinal_position) AS cols
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        GROUP BY table_name
+    ) s;
+$$;
@@ -0,0 +1,14 @@
+-- Return the average rating and the number of ratings of one item as a JSON object.
+-- Unrated items get an average of 0.
+CREATE OR REPLACE FUNCTION public.item_rating_stats(p_item_id integer)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'avg_rating', COALESCE(AVG(value), 0),
+        'num_ratings', COUNT(*)
+    )
+    FROM public.ratings
+    WHERE item_id = p_item_id;
+$$;
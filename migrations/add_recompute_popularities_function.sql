@@ -0,0 +1,27 @@
+-- Recompute the popularity score of every item from its ratings in one statement.
+-- Same formula as RecommendationEngine.update_item_popularity; unrated items get 0.
+CREATE OR REPLACE FUNCTION public.recompute_all_popularities()
+RETURNS integer
+LANGUAGE sql
+VOLATILE
+AS $$
+    WITH stats AS (
+        SELECT item_id, AVG(value) AS avg_rating, COUNT(*) AS num_ratings
+        FROM public.ratings
+        GROUP BY item_id
+    ), updated AS (
+        UPDATE public.items i
+        SET popularity_score = COALESCE(
+                LEAST(1.0, GREATEST(0.0,
+                    0.7 * s.avg_rating / 5.0 + 0.3 * LEAST(1.0, 0.1 * (1 + s.num_ratings) / 2.0)
+                )) * 5.0,
+                0.0
+            ),
+            updated_at = CURRENT_TIMESTAMP
+        FROM public.items j
+        LEFT JOIN stats s ON s.item_id = j.id
+        WHERE i.id = j.id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::integer FROM updated;
+$$;
@@ -5,24 +5,11 @@ This module defines the base model class that all data models will inherit from.
 It implements the Active Record pattern for database operations.
 """
 import logging
-import json
-from datetime import datetime
 from typing import Dict, List, Any, Optional, Type, TypeVar, Generic, ClassVar
 from pydantic import BaseModel as PydanticBaseModel
 
 logger = logging.getLogger(__name__)
 
-# Custom JSON encoder for handling datetime objects
-class DateTimeEncoder(json.JSONEncoder):
-    """
-    Custom JSON encoder that serializes datetime objects to ISO format strings.
-    Follows the Single Responsibility Principle by handling only datetime serialization.
-    """
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
 T = TypeVar('T', bound='BaseModel')
 
 
@@ -94,6 +81,51 @@ class BaseModel(PydanticBaseModel):
             logger.error(f"Error finding all {cls.__name__} records: {str(e)}")
             raise
     
+    @classmethod
+    def page(cls: Type[T], offset: int, limit: int) -> List[T]:
+        """
+        Find one page of records, ordered by ID.
+        
+        Args:
+            offset: The number of records to skip
+            limit: The maximum number of records to return
+            
+        Returns:
+            The records on the requested page
+        """
+        logger.info(f"Finding {cls.__name__} records {offset} to {offset + limit - 1}")
+        try:
+            response = (
+                cls._get_db().table(cls._table_name)
+                .select("*")
+                .order("id")
+                # Reason: the client's range() end is exclusive, it sends end - 1 itself
+                .range(offset, offset + limit)
+                .execute()
+            )
+            return [cls(**item) for item in response.data]
+        except Exception as e:
+            logger.error(f"Error finding a page of {cls.__name__} records: {str(e)}")
+            raise
+    
+    @classmethod
+    def count(cls) -> int:
+        """
+        Count the rows in the table without fetching them.
+        
+        Returns:
+            The number of rows
+        """
+        logger.info(f"Counting {cls.__name__} records")
+        try:
+            # Reason: the exact count comes back in the response header, so a
+            # single row is enough and the table is never transferred
+            response = cls._get_db().table(cls._table_name).select("id", count="exact").limit(1).execute()
+            return response.count or 0
+        except Exception as e:
+            logger.error(f"Error counting {cls.__name__} records: {str(e)}")
+            raise
+    
     @classmethod
     def find_by(cls: Type[T], **criteria) -> List[T]:
         """
@@ -131,9 +163,6 @@ class BaseModel(PydanticBaseModel):
         Returns:
             The saved model instance with updated ID if created
         """
-        # Get model data excluding ID for new records
-        data = self.model_dump(exclude={"id"} if self.id is None else {})
-        
         try:
             # Prepare data for the database
             data = self._prepare_data_for_db()
@@ -202,45 +231,19 @@ class BaseModel(PydanticBaseModel):
             logger.error(f"Error saving {self.__class__.__name__}: {str(e)}")
             raise
     
-    def _prepare_data_for_db(self, data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _prepare_data_for_db(self) -> Dict[str, Any]:
         """
         Prepare data for database storage by handling special types like datetime.
         
-        Args:
-            data: Dictionary containing model data (if None, will use model_dump)
-            
+        Serialization is delegated to Pydantic's JSON mode, which converts datetimes
+        to ISO 8601 strings (including inside nested dicts and lists) in pydantic-core.
+        
         Returns:
             Data dictionary with all values serialized for database storage
         """
-        # If no data provided, get it from the model
-        if data is None:
-            # Exclude ID for new records
-            exclude_fields = {"id"} if self.id is None else set()
-            data = self.model_dump(exclude=exclude_fields)
-        else:
-            # Make a copy to avoid modifying the input
-            data = {**data}
-        
-        # Process each field for serialization
-        result = {}
-        for key, value in data.items():
-            # Skip fields that start with underscore (private fields)
-            if key.startswith('_'):
-                continue
-                
-            # Handle datetime objects (convert to ISO format string)
-            if isinstance(value, datetime):
-                result[key] = value.isoformat()
-            # Handle nested dictionaries
-            elif isinstance(value, dict):
-                result[key] = self._prepare_data_for_db(value)
-            # Handle lists with potential datetime objects
-            elif isinstance(value, list):
-                result[key] = [item.isoformat() if isinstance(item, datetime) else item for item in value]
-            else:
-                result[key] = value
-                
-        return result
+        # Exclude ID for new records
+        exclude_fields = {"id"} if self.id is None else set()
+        return self.model_dump(mode="json", exclude=exclude_fields)
     
     def delete(self) -> bool:
         """
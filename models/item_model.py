@@ -4,13 +4,19 @@ Item Model Module.
 This module defines the Item data model with validation and database operations.
 """
 import logging
-from typing import Dict, List, Any, Optional, ClassVar
+import re
+from typing import Dict, List, Any, Optional, ClassVar, Tuple
 from datetime import datetime
 from pydantic import validator, Field
+import numpy as np
 from .base_model import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Reason: quotes and backslashes break out of a quoted PostgREST value, commas
+# and parens out of the "or" list, and *, % and _ are ilike wildcards
+_SEARCH_RESERVED = re.compile(r'[\\"*%_,()]+')
+
 
 class ItemModel(BaseModel):
     """
@@ -19,6 +25,9 @@ class ItemModel(BaseModel):
     Contains item information and features for content-based filtering.
     """
     _table_name: ClassVar[str] = "items"
+    # Reason: ids are sent in the query string, so large lookups are split
+    # into batches that stay well below common URL length limits
+    _id_batch_size: ClassVar[int] = 200
     
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
@@ -88,6 +97,136 @@ class ItemModel(BaseModel):
             logger.error(f"Error finding active items: {str(e)}")
             raise
     
+    @classmethod
+    def find_by_ids(cls, ids: List[int]) -> Dict[int, 'ItemModel']:
+        """
+        Find several items by ID with one query per batch of IDs.
+        
+        Args:
+            ids: The item IDs to look up
+            
+        Returns:
+            Dictionary mapping item ID to item, missing IDs are left out
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        logger.info(f"Finding {len(unique_ids)} items by ID")
+        try:
+            items = {}
+            for start in range(0, len(unique_ids), cls._id_batch_size):
+                batch = unique_ids[start:start + cls._id_batch_size]
+                response = cls._get_db().table(cls._table_name).select("*").in_("id", batch).execute()
+                for data in response.data:
+                    items[data["id"]] = cls(**data)
+            return items
+        except Exception as e:
+            logger.error(f"Error finding items by IDs: {str(e)}")
+            raise
+    
+    @classmethod
+    def all_ids(cls) -> np.ndarray:
+        """
+        Get the IDs of all items without hydrating the items.
+        
+        Returns:
+            1D int64 array of item IDs
+        """
+        logger.info("Finding all item IDs")
+        try:
+            response = cls._get_db().table(cls._table_name).select("id").execute()
+            return np.fromiter((row["id"] for row in response.data), dtype=np.int64, count=len(response.data))
+        except Exception as e:
+            logger.error(f"Error finding item IDs: {str(e)}")
+            raise
+    
+    @classmethod
+    def search(cls, category: Optional[str] = None, query: Optional[str] = None) -> List['ItemModel']:
+        """
+        Find items by category and a case-insensitive name/description match.
+        
+        Args:
+            category: The category to filter by, or None for all categories
+            query: Text to look for in the name or description, or None to skip
+            
+        Returns:
+            List of matching items
+        """
+        logger.info(f"Searching items (category={category}, query={query})")
+        try:
+            request = cls._get_db().table(cls._table_name).select("*")
+            if category is not None:
+                request = request.eq("category", category)
+            if query:
+                # Reason: reserved characters are widened to a wildcard, so
+                # they never reach the filter but the text around them still
+                # has to match in order
+                pattern = _SEARCH_RESERVED.sub("*", query).strip("*")
+                if not pattern:
+                    return []
+                # Reason: the client has no or_() builder, so the raw
+                # PostgREST "or" parameter is added to the request
+                request.params = request.params.add(
+                    "or", f'(name.ilike."*{pattern}*",description.ilike."*{pattern}*")'
+                )
+            response = request.execute()
+            return [cls(**item) for item in response.data]
+        except Exception as e:
+            logger.error(f"Error searching items: {str(e)}")
+            raise
+    
+    @classmethod
+    def distinct_categories(cls) -> List[str]:
+        """
+        Get the distinct categories of all active items.
+        
+        Only the category column is fetched, so no items are hydrated.
+        
+        Returns:
+            Sorted list of unique categories
+        """
+        logger.info("Finding distinct item categories")
+        try:
+            response = (
+                cls._get_db().table(cls._table_name)
+                .select("category")
+                .eq("is_active", True)
+                .execute()
+            )
+            return sorted({row["category"] for row in response.data})
+        except Exception as e:
+            logger.error(f"Error finding distinct item categories: {str(e)}")
+            raise
+    
+    @classmethod
+    def summary_rows(cls, offset: int = 0, limit: Optional[int] = None) -> List[Tuple[int, str, str, float, bool]]:
+        """
+        Get a lightweight summary of items for listings, ordered by ID.
+        
+        Args:
+            offset: The number of items to skip, used together with limit
+            limit: The maximum number of items to return, or None for all
+            
+        Returns:
+            List of (id, name, category, popularity_score, is_active) tuples
+        """
+        logger.info("Finding item summaries")
+        try:
+            request = (
+                cls._get_db().table(cls._table_name)
+                .select("id,name,category,popularity_score,is_active")
+                .order("id")
+            )
+            if limit is not None:
+                # Reason: the client's range() end is exclusive, it sends end - 1 itself
+                request = request.range(offset, offset + limit)
+            response = request.execute()
+            return [
+                (row["id"], row["name"], row["category"], row["popularity_score"], row["is_active"])
+                for row in response.data
+            ]
+        except Exception as e:
+            logger.error(f"Error finding item summaries: {str(e)}")
+            raise
+    
     def update_features(self, new_features: Dict[str, Any]) -> 'ItemModel':
         """
         Update item features.
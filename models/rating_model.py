@@ -105,6 +105,45 @@ class RatingModel(BaseModel):
             logger.error(f"Error finding rating by user and item: {str(e)}")
             raise
     
+    @classmethod
+    def upsert(cls, user_id: int, item_id: int, value: int) -> 'RatingModel':
+        """
+        Create a user's rating for an item, or update it if one exists.
+        
+        Uses the UNIQUE(user_id, item_id) constraint, so this is a single
+        query with no read-modify-write race.
+        
+        Args:
+            user_id: The ID of the user
+            item_id: The ID of the item
+            value: The rating value between 1 and 5
+            
+        Returns:
+            The stored rating
+            
+        Raises:
+            ValueError: If the rating value is out of range
+        """
+        if value < 1 or value > 5:
+            msg = f"Rating value must be between 1 and 5, got {value}"
+            logger.error(f"Rating validation failed: {msg}")
+            raise ValueError(msg)
+        
+        logger.info(f"Upserting rating by user {user_id} for item {item_id}")
+        try:
+            # created_at is left out so an update keeps the original rating date
+            data = {
+                "user_id": user_id,
+                "item_id": item_id,
+                "value": value,
+                "updated_at": datetime.utcnow().isoformat()
+            }
+            response = cls._get_db().table(cls._table_name).upsert(data, on_conflict="user_id,item_id").execute()
+            return cls(**response.data[0])
+        except Exception as e:
+            logger.error(f"Error upserting rating: {str(e)}")
+            raise
+    
     @classmethod
     def get_average_rating_for_item(cls, item_id: int) -> float:
         """
@@ -133,6 +172,29 @@ class RatingModel(BaseModel):
             logger.error(f"Error calculating average rating: {str(e)}")
             raise
     
+    @classmethod
+    def get_stats_for_item(cls, item_id: int) -> tuple[float, int]:
+        """
+        Get the average rating and the number of ratings for an item in one query.
+        
+        Both are aggregated in the database by the item_rating_stats function,
+        so no rating rows are transferred.
+        
+        Args:
+            item_id: The ID of the item
+            
+        Returns:
+            A tuple of (average rating, number of ratings), (0.0, 0) if unrated
+        """
+        logger.info(f"Getting rating stats for item {item_id}")
+        try:
+            response = cls._get_db().rpc("item_rating_stats", {"p_item_id": item_id}).execute()
+            stats = response.data or {}
+            return float(stats.get("avg_rating") or 0.0), int(stats.get("num_ratings") or 0)
+        except Exception as e:
+            logger.error(f"Error getting rating stats for item: {str(e)}")
+            raise
+    
     @classmethod
     def build_user_item_matrix(cls) -> tuple[list[int], list[int], list[list[float]]]:
         """
@@ -170,3 +232,24 @@ class RatingModel(BaseModel):
         except Exception as e:
             logger.error(f"Error building user-item matrix: {str(e)}")
             raise
+    
+    @classmethod
+    def recompute_all_popularities(cls) -> int:
+        """
+        Recompute the popularity score of every item on the database server.
+        
+        Runs the recompute_all_popularities() function, which aggregates the
+        ratings and updates all items in a single statement.
+        
+        Returns:
+            The number of items updated
+        """
+        logger.info("Recomputing popularity scores for all items")
+        try:
+            response = cls._get_db().rpc("recompute_all_popularities").execute()
+            updated = response.data or 0
+            logger.info(f"Recomputed popularity scores for {updated} items")
+            return updated
+        except Exception as e:
+            logger.error(f"Error recomputing item popularities: {str(e)}")
+            raise
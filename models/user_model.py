@@ -4,6 +4,7 @@ User Model Module.
 This module defines the User data model with validation and database operations.
 """
 import logging
+from functools import lru_cache
 from typing import Optional, List, Dict, Any, ClassVar, Union
 from datetime import datetime
 from pydantic import validator, EmailStr, Field, model_validator
@@ -13,6 +14,21 @@ from .base_model import BaseModel
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _format_datetime(value: datetime, fmt: str) -> str:
+    """
+    Format a datetime, caching the result per value and format.
+    
+    Args:
+        value: The datetime to format
+        fmt: strftime format string
+        
+    Returns:
+        The formatted datetime
+    """
+    return value.strftime(fmt)
+
+
 class UserModel(BaseModel):
     """
     User model representing system users.
@@ -66,6 +82,16 @@ class UserModel(BaseModel):
                 
         return data
     
+    @property
+    def last_login_str(self) -> str:
+        """Last login time formatted for display, or "Never"."""
+        return _format_datetime(self.last_login, '%Y-%m-%d %H:%M') if self.last_login else "Never"
+    
+    @property
+    def created_at_str(self) -> str:
+        """Account creation date formatted for display, or "Unknown"."""
+        return _format_datetime(self.created_at, '%Y-%m-%d') if self.created_at else "Unknown"
+    
     @classmethod
     def find_by_email(cls, email: str) -> Optional['UserModel']:
         """
@@ -104,6 +130,66 @@ class UserModel(BaseModel):
             logger.error(f"Error finding user by username: {str(e)}")
             raise
     
+    @classmethod
+    def find_by_username_or_email(cls, username: str, email: str) -> List[Dict[str, Any]]:
+        """
+        Find users that already use a username or an email, in one query.
+        
+        Args:
+            username: The username to look for
+            email: The email address to look for
+            
+        Returns:
+            List of matching rows with id, username and email, at most one per column
+        """
+        logger.info(f"Finding users with username {username} or email {email}")
+        try:
+            # Reason: PostgREST reserves quotes and backslashes inside a
+            # quoted filter value, neither is valid in a username or email
+            username_value = username.replace("\\", "").replace('"', "")
+            email_value = email.replace("\\", "").replace('"', "")
+            request = cls._get_db().table(cls._table_name).select("id,username,email").limit(2)
+            # Reason: the client has no or_() builder, so the raw
+            # PostgREST "or" parameter is added to the request
+            request.params = request.params.add(
+                "or", f'(username.eq."{username_value}",email.eq."{email_value}")'
+            )
+            return request.execute().data
+        except Exception as e:
+            logger.error(f"Error finding user by username or email: {str(e)}")
+            raise
+    
+    @classmethod
+    def is_admin(cls, user_id: Optional[int]) -> bool:
+        """
+        Check whether a user has admin privileges.
+        
+        The flag is matched in the database, so the user row is not loaded.
+        
+        Args:
+            user_id: The ID of the user, or None if nobody is logged in
+            
+        Returns:
+            True if the user exists and is flagged as an admin
+        """
+        if user_id is None:
+            return False
+        
+        logger.info(f"Checking admin privileges for user {user_id}")
+        try:
+            response = (
+                cls._get_db().table(cls._table_name)
+                .select("id")
+                .eq("id", user_id)
+                .eq("preferences->>is_admin", "true")
+                .limit(1)
+                .execute()
+            )
+            return bool(response.data)
+        except Exception as e:
+            logger.error(f"Error checking admin privileges: {str(e)}")
+            raise
+    
     def update_preferences(self, preferences: Dict[str, Any]) -> None:
         """Update user preferences."""
         self.preferences = preferences
@@ -24,7 +24,7 @@ logger = logging.getLogger(__name__)
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from utils.schema_manager import DatabaseSchemaManager
+from utils.schema_manager import get_schema_manager
 from utils.db_manager import DatabaseManager
 
 
@@ -35,7 +35,7 @@ def check_schema_status():
     
     # Initialize managers
     db_manager = DatabaseManager()
-    schema_manager = DatabaseSchemaManager()
+    schema_manager = get_schema_manager()
     
     print("Refreshing schema cache...")
     tables = schema_manager.refresh_schema_cache()
@@ -112,3 +112,61 @@ CREATE INDEX IF NOT EXISTS idx_ratings_item_id ON public.ratings(item_id);
 CREATE INDEX IF NOT EXISTS idx_items_category ON public.items(category);
 CREATE INDEX IF NOT EXISTS idx_users_email ON public.users(email);
 CREATE INDEX IF NOT EXISTS idx_users_username ON public.users(username);
+
+-- Return the columns of every public table as one JSON object (table name -> column names)
+CREATE OR REPLACE FUNCTION public.get_schema_columns()
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT COALESCE(jsonb_object_agg(table_name, cols), '{}'::jsonb)
+    FROM (
+        SELECT table_name, jsonb_agg(column_name ORDER BY ordinal_position) AS cols
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        GROUP BY table_name
+    ) s;
+$$;
+
+-- Recompute the popularity score of every item from its ratings in one statement.
+-- Same formula as RecommendationEngine.update_item_popularity; unrated items get 0.
+CREATE OR REPLACE FUNCTION public.recompute_all_popularities()
+RETURNS integer
+LANGUAGE sql
+VOLATILE
+AS $$
+    WITH stats AS (
+        SELECT item_id, AVG(value) AS avg_rating, COUNT(*) AS num_ratings
+        FROM public.ratings
+        GROUP BY item_id
+    ), updated AS (
+        UPDATE public.items i
+        SET popularity_score = COALESCE(
+                LEAST(1.0, GREATEST(0.0,
+                    0.7 * s.avg_rating / 5.0 + 0.3 * LEAST(1.0, 0.1 * (1 + s.num_ratings) / 2.0)
+                )) * 5.0,
+                0.0
+            ),
+            updated_at = CURRENT_TIMESTAMP
+        FROM public.items j
+        LEFT JOIN stats s ON s.item_id = j.id
+        WHERE i.id = j.id
+        RETURNING 1
+    )
+    SELECT COUNT(*)::integer FROM updated;
+$$;
+
+-- Return the average rating and the number of ratings of one item as a JSON object.
+-- Unrated items get an average of 0.
+CREATE OR REPLACE FUNCTION public.item_rating_stats(p_item_id integer)
+RETURNS jsonb
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'avg_rating', COALESCE(AVG(value), 0),
+        'num_ratings', COUNT(*)
+    )
+    FROM public.ratings
+    WHERE item_id = p_item_id;
+$$;
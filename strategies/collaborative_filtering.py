@@ -3,7 +3,9 @@ Collaborative Filtering Strategy Module.
 
 This module implements the collaborative filtering recommendation algorithm using the Strategy pattern.
 """
+import heapq
 import logging
+from operator import attrgetter, itemgetter
 import numpy as np
 from typing import List, Dict, Any, Tuple, Optional
 from models.rating_model import RatingModel
@@ -22,6 +24,12 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
     on similar users' preferences.
     """
     
+    __slots__ = (
+        "_similarity_method", "_user_ids", "_item_ids",
+        "_ratings_matrix", "_user_similarity_matrix",
+        "_ratings_array", "_item_norms", "_item_index"
+    )
+    
     def __init__(self, similarity_method: str = "cosine"):
         """
         Initialize collaborative filtering strategy.
@@ -35,6 +43,9 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
         self._item_ids = []
         self._ratings_matrix = []
         self._user_similarity_matrix = None
+        self._ratings_array = np.zeros((0, 0), dtype=np.float32)
+        self._item_norms = np.zeros(0, dtype=np.float32)
+        self._item_index = {}
         logger.info(f"Initialized CollaborativeFilteringStrategy with {similarity_method} similarity")
     
     def train(self, data: Any = None) -> None:
@@ -58,7 +69,15 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
             # Calculate user similarity matrix
             self._user_similarity_matrix = self._calculate_similarity_matrix(ratings_array)
             
-            self._is_trained = True
+            # Reason: item similarity vectors are requested once per candidate, so the
+            # float32 ratings, their column norms and the item -> column index are built once here
+            self._ratings_array = np.asarray(self._ratings_matrix, dtype=np.float32).reshape(
+                len(self._user_ids), len(self._item_ids)
+            )
+            self._item_norms = np.linalg.norm(self._ratings_array, axis=0)
+            self._item_index = {item_id: index for index, item_id in enumerate(self._item_ids)}
+            
+            self.is_trained = True
             logger.info(f"Collaborative filtering model trained with {len(self._user_ids)} users and {len(self._item_ids)} items")
         except Exception as e:
             logger.error(f"Error training collaborative filtering model: {str(e)}")
@@ -79,6 +98,15 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
         # Get the number of users
         n_users = ratings_matrix.shape[0]
         
+        # Reason: Cosine over co-rated items reduces to two matrix products, so skip the pairwise loop
+        if self._similarity_method == "cosine" and ratings_matrix.ndim == 2:
+            # Reason: the result is the shared scratch buffer, which the next call overwrites
+            # in place; the model keeps its own copy so a retrain can't change it under readers
+            similarity_matrix = self.cosine_similarity_matrix(ratings_matrix, mask=ratings_matrix > 0).copy()
+            # A user is perfectly similar to themselves
+            np.fill_diagonal(similarity_matrix, 1.0)
+            return similarity_matrix
+        
         # Initialize similarity matrix
         similarity_matrix = np.zeros((n_users, n_users))
         
@@ -309,11 +337,9 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
                 if similarity_sum > 0:
                     predicted_ratings[item_id] = weighted_ratings / similarity_sum
             
-            # Filter already rated items and sort by predicted rating
+            # Filter already rated items and take the n best predicted ratings
             filtered_ratings = self.filter_already_rated(user_id, predicted_ratings)
-            sorted_items = sorted(
-                filtered_ratings.items(), key=lambda x: x[1], reverse=True
-            )[:n]
+            sorted_items = heapq.nlargest(n, filtered_ratings.items(), key=itemgetter(1))
             
             # Get item details for recommendations
             recommendations = []
@@ -351,10 +377,8 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
             # Use popular items as fallback
             items = ItemModel.find_all()
             
-            # Sort by popularity score
-            sorted_items = sorted(
-                items, key=lambda item: item.popularity_score, reverse=True
-            )[:n]
+            # Take the n most popular items without sorting them all
+            sorted_items = heapq.nlargest(n, items, key=attrgetter("popularity_score"))
             
             recommendations = []
             for item in sorted_items:
@@ -442,7 +466,8 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
         Returns:
             A similarity score between 0 and 1
         """
-        logger.info(f"Calculating similarity between items {item_id1} and {item_id2}")
+        # Reason: called once per item pair, so it logs at debug level with lazy formatting
+        logger.debug("Calculating similarity between items %s and %s", item_id1, item_id2)
         self.check_trained()
         
         try:
@@ -469,3 +494,45 @@ class CollaborativeFilteringStrategy(BaseRecommendationStrategy):
         except Exception as e:
             logger.error(f"Error calculating item similarity: {str(e)}")
             return 0.0
+    
+    def get_similarity_vector(self, item_id: int, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Calculate the rating similarity between one item and many others at once.
+        
+        Cosine similarity is vectorized; other methods use the per-pair calculation.
+        
+        Args:
+            item_id: The ID of the item to compare against
+            item_ids: 1D array of the IDs of the other items
+            
+        Returns:
+            1D float32 array of similarity scores between 0 and 1, aligned with item_ids
+        """
+        if self._similarity_method != "cosine":
+            return super().get_similarity_vector(item_id, item_ids)
+        
+        self.check_trained()
+        similarities = np.zeros(len(item_ids), dtype=np.float32)
+        
+        item_index = self._item_index
+        query_index = item_index.get(item_id)
+        if query_index is None or not self._user_ids:
+            return similarities
+        
+        # Columns of the ratings matrix for the candidates that were in the training data
+        positions = []
+        columns = []
+        for position, other_id in enumerate(item_ids):
+            column = item_index.get(int(other_id))
+            if column is not None:
+                positions.append(position)
+                columns.append(column)
+        if not columns:
+            return similarities
+        
+        query = self._ratings_array[:, query_index]
+        candidates = self._ratings_array[:, columns]
+        norms = self._item_norms[columns] * self._item_norms[query_index]
+        scores = np.divide(query @ candidates, norms, out=np.zeros(len(columns), dtype=np.float32), where=norms > 0)
+        similarities[positions] = np.clip(scores, 0.0, 1.0)
+        return similarities
@@ -3,13 +3,15 @@ Content-Based Filtering Strategy Module.
 
 This module implements content-based filtering recommendation algorithm using the Strategy pattern.
 """
+import heapq
 import logging
+from operator import attrgetter, itemgetter
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from models.item_model import ItemModel
 from models.user_model import UserModel
 from models.rating_model import RatingModel
-from .recommendation_strategy import BaseRecommendationStrategy
+from .recommendation_strategy import BaseRecommendationStrategy, SIMILARITY_MATRIX_MAX_ITEMS
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +23,14 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
     Implements a recommendation algorithm based on item features and user preferences.
     """
     
+    __slots__ = ("_item_features", "_user_profiles", "_normalized_features")
+    
     def __init__(self):
         """Initialize the content-based filtering strategy."""
         super().__init__()
         self._item_features = {}  # Dict mapping item_id to feature vector
         self._user_profiles = {}  # Dict mapping user_id to preference vector
+        self._normalized_features = None  # Unit-length feature blocks, built on first use
         logger.info("Initialized ContentBasedFilteringStrategy")
     
     def train(self, data: Any = None) -> None:
@@ -37,13 +42,16 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
         """
         logger.info("Training content-based filtering model")
         try:
+            # Item features may change, so the cached features and similarities are rebuilt on next use
+            self.invalidate_similarity_matrix()
+            
             # Extract item features
             self._extract_item_features()
             
             # Build user profiles
             self._build_user_profiles()
             
-            self._is_trained = True
+            self.is_trained = True
             logger.info(f"Content-based filtering model trained with {len(self._item_features)} items and {len(self._user_profiles)} user profiles")
         except Exception as e:
             logger.error(f"Error training content-based filtering model: {str(e)}")
@@ -269,10 +277,8 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
             # Filter already rated items
             filtered_scores = self.filter_already_rated(user_id, item_scores)
             
-            # Sort by similarity score
-            sorted_items = sorted(
-                filtered_scores.items(), key=lambda x: x[1], reverse=True
-            )[:n]
+            # Take the n most similar items without sorting them all
+            sorted_items = heapq.nlargest(n, filtered_scores.items(), key=itemgetter(1))
             
             # Get item details for recommendations
             recommendations = []
@@ -310,10 +316,8 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
             # Use popular items as fallback
             items = ItemModel.find_all()
             
-            # Sort by popularity score
-            sorted_items = sorted(
-                items, key=lambda item: item.popularity_score, reverse=True
-            )[:n]
+            # Take the n most popular items without sorting them all
+            sorted_items = heapq.nlargest(n, items, key=attrgetter("popularity_score"))
             
             recommendations = []
             for item in sorted_items:
@@ -407,10 +411,18 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
         Returns:
             A similarity score between 0 and 1
         """
-        logger.info(f"Calculating similarity between items {item_id1} and {item_id2}")
+        # Reason: called once per item pair, so it logs at debug level with lazy formatting
+        logger.debug("Calculating similarity between items %s and %s", item_id1, item_id2)
         self.check_trained()
         
         try:
+            cached = self.get_similarity_matrix()
+            if cached is not None:
+                item_index, similarity = cached
+                row = item_index.get(item_id1)
+                column = item_index.get(item_id2)
+                return 0.0 if row is None or column is None else float(similarity[row, column])
+            
             # Check if both items have features
             if item_id1 not in self._item_features or item_id2 not in self._item_features:
                 return 0.0
@@ -424,3 +436,126 @@ class ContentBasedFilteringStrategy(BaseRecommendationStrategy):
         except Exception as e:
             logger.error(f"Error calculating item similarity: {str(e)}")
             return 0.0
+    
+    def get_similarity_vector(self, item_id: int, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Calculate the feature similarity between one item and many others at once.
+        
+        Args:
+            item_id: The ID of the item to compare against
+            item_ids: 1D array of the IDs of the other items
+            
+        Returns:
+            1D float32 array of similarity scores between 0 and 1, aligned with item_ids
+        """
+        self.check_trained()
+        similarities = np.zeros(len(item_ids), dtype=np.float32)
+        
+        cached = self.get_similarity_matrix()
+        if cached is not None:
+            # One row of the cached matrix, gathered at the candidates' positions
+            item_index, similarity = cached
+            row = item_index.get(item_id)
+            if row is None:
+                return similarities
+            columns = np.fromiter(
+                (item_index.get(int(other_id), -1) for other_id in item_ids),
+                dtype=np.int64,
+                count=len(item_ids)
+            )
+            known = columns >= 0
+            similarities[known] = similarity[row, columns[known]]
+            return similarities
+        
+        item_positions, blocks, _ = self._get_normalized_features()
+        position = item_positions.get(item_id)
+        if position is None:
+            return similarities
+        group, row = position
+        block = blocks[group]
+        
+        # Cosine similarity against every item of the same feature length in one
+        # BLAS matrix-vector product over the unit-length rows
+        scores = block @ block[row]
+        
+        # Only items whose feature vectors line up with the query can be compared
+        rows = np.fromiter(
+            (
+                other[1] if other is not None and other[0] == group else -1
+                for other in map(item_positions.get, item_ids.tolist())
+            ),
+            dtype=np.int64,
+            count=len(item_ids)
+        )
+        known = rows >= 0
+        similarities[known] = np.clip(scores[rows[known]], 0.0, 1.0)
+        return similarities
+    
+    def invalidate_similarity_matrix(self) -> None:
+        """Drop the cached similarity matrix and normalized features so they are rebuilt on next use."""
+        super().invalidate_similarity_matrix()
+        self._normalized_features = None
+    
+    def _get_normalized_features(self) -> Tuple[Dict[int, Tuple[int, int]], List[np.ndarray], List[List[int]]]:
+        """
+        Get the item feature vectors scaled to unit length, grouped by vector length.
+        
+        Each group is one C-contiguous float32 block, so a similarity row is a
+        single matrix-vector product. All-zero vectors stay zero.
+        
+        Returns:
+            A tuple containing:
+            - Dictionary mapping item ID to its (group, row) position
+            - List of the (rows, features) float32 block of each group
+            - List of the item IDs in each group, in row order
+        """
+        if self._normalized_features is None:
+            item_positions: Dict[int, Tuple[int, int]] = {}
+            group_of_shape: Dict[Tuple[int, ...], int] = {}
+            group_rows: List[List[np.ndarray]] = []
+            group_ids: List[List[int]] = []
+            for item_id, features in self._item_features.items():
+                group = group_of_shape.setdefault(features.shape, len(group_rows))
+                if group == len(group_rows):
+                    group_rows.append([])
+                    group_ids.append([])
+                item_positions[item_id] = (group, len(group_rows[group]))
+                group_rows[group].append(features)
+                group_ids[group].append(item_id)
+            
+            blocks = []
+            for rows in group_rows:
+                matrix = np.ascontiguousarray(np.vstack(rows), dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                blocks.append(np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0))
+            
+            self._normalized_features = (item_positions, blocks, group_ids)
+        return self._normalized_features
+    
+    def _build_similarity_matrix(self) -> Optional[Tuple[Dict[int, int], np.ndarray]]:
+        """
+        Build the cosine similarity matrix of all items with features.
+        
+        Items whose feature vectors have different lengths can't be compared and
+        get a similarity of 0, so each group of equal-length vectors is computed
+        with one matrix product.
+        
+        Returns:
+            A tuple of the item ID to row index mapping and the (N, N) float32
+            similarity matrix, or None if there are too many items to cache
+        """
+        n_items = len(self._item_features)
+        if n_items > SIMILARITY_MATRIX_MAX_ITEMS:
+            logger.info(f"Not caching item similarities for {n_items} items")
+            return None
+        
+        logger.debug(f"Building item similarity matrix for {n_items} items")
+        item_index = {item_id: index for index, item_id in enumerate(self._item_features)}
+        similarity = np.zeros((n_items, n_items), dtype=np.float32)
+        
+        _, blocks, group_ids = self._get_normalized_features()
+        for block, ids in zip(blocks, group_ids):
+            indices = [item_index[item_id] for item_id in ids]
+            similarity[np.ix_(indices, indices)] = np.clip(self._gemm_nt(block, block), 0.0, 1.0)
+        
+        return item_index, similarity
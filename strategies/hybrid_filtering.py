@@ -3,8 +3,11 @@ Hybrid Filtering Strategy Module.
 
 This module implements a hybrid recommendation algorithm that combines multiple strategies.
 """
+import heapq
 import logging
+from operator import itemgetter
 from typing import List, Dict, Any, Tuple
+import numpy as np
 from .recommendation_strategy import BaseRecommendationStrategy
 from .collaborative_filtering import CollaborativeFilteringStrategy
 from .content_based_filtering import ContentBasedFilteringStrategy
@@ -21,6 +24,8 @@ class HybridFilteringStrategy(BaseRecommendationStrategy):
     to provide more accurate and diverse recommendations.
     """
     
+    __slots__ = ("_strategies",)
+    
     def __init__(self, strategies: List[Tuple[BaseRecommendationStrategy, float]] = None):
         """
         Initialize the hybrid filtering strategy.
@@ -57,7 +62,7 @@ class HybridFilteringStrategy(BaseRecommendationStrategy):
                 if not strategy.is_trained:
                     strategy.train(data)
             
-            self._is_trained = True
+            self.is_trained = True
             logger.info("Hybrid filtering model trained successfully")
         except Exception as e:
             logger.error(f"Error training hybrid filtering model: {str(e)}")
@@ -126,12 +131,8 @@ class HybridFilteringStrategy(BaseRecommendationStrategy):
                 rec["score"] = weighted_score
                 rec["recommendation_type"] = "hybrid"
             
-            # Sort by weighted score and take top n
-            sorted_recommendations = sorted(
-                all_recommendations.values(), 
-                key=lambda x: x["score"],
-                reverse=True
-            )[:n]
+            # Take the top n by weighted score
+            sorted_recommendations = heapq.nlargest(n, all_recommendations.values(), key=itemgetter("score"))
             
             logger.info(f"Generated {len(sorted_recommendations)} hybrid recommendations for user {user_id}")
             return sorted_recommendations
@@ -242,3 +243,30 @@ class HybridFilteringStrategy(BaseRecommendationStrategy):
         except Exception as e:
             logger.error(f"Error calculating hybrid item similarity: {str(e)}")
             return 0.0
+    
+    def get_similarity_vector(self, item_id: int, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Calculate the weighted similarity between one item and many others at once.
+        
+        Args:
+            item_id: The ID of the item to compare against
+            item_ids: 1D array of the IDs of the other items
+            
+        Returns:
+            1D float32 array of weighted similarity scores between 0 and 1, aligned with item_ids
+        """
+        self.check_trained()
+        
+        total_similarity = np.zeros(len(item_ids), dtype=np.float32)
+        total_weight = 0.0
+        for strategy, weight in self._strategies:
+            try:
+                total_similarity += weight * strategy.get_similarity_vector(item_id, item_ids)
+                total_weight += weight
+            except Exception:
+                # Skip if a strategy fails
+                pass
+        
+        if total_weight == 0:
+            return np.zeros(len(item_ids), dtype=np.float32)
+        return total_similarity / np.float32(total_weight)
@@ -5,10 +5,15 @@ This module defines the interface and base classes for recommendation algorithms
 """
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from scipy.linalg.blas import sgemm
 
 logger = logging.getLogger(__name__)
 
+# Item count above which the (N, N) item similarity matrix isn't cached (5000 items ~ 100 MB)
+SIMILARITY_MATRIX_MAX_ITEMS = 5000
+
 
 class RecommendationStrategy(ABC):
     """
@@ -18,6 +23,8 @@ class RecommendationStrategy(ABC):
     Follows the Strategy design pattern to make algorithms interchangeable.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def train(self, data: Any) -> None:
         """
@@ -70,6 +77,36 @@ class RecommendationStrategy(ABC):
             A similarity score between 0 and 1
         """
         pass
+    
+    def get_similarity_vector(self, item_id: int, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Calculate the similarity between one item and many others at once.
+        
+        Strategies override this with a vectorized implementation; the default
+        falls back to one get_similarity call per item.
+        
+        Args:
+            item_id: The ID of the item to compare against
+            item_ids: 1D array of the IDs of the other items
+            
+        Returns:
+            1D float32 array of similarity scores between 0 and 1, aligned with item_ids
+        """
+        return np.fromiter(
+            (self.get_similarity(item_id, int(other_id)) for other_id in item_ids),
+            dtype=np.float32,
+            count=len(item_ids)
+        )
+    
+    def get_similarity_matrix(self) -> Optional[Tuple[Dict[int, int], np.ndarray]]:
+        """
+        Get the precomputed similarity matrix of all items known to the strategy.
+        
+        Returns:
+            A tuple of the item ID to row index mapping and the (N, N) float32
+            similarity matrix, or None if the strategy doesn't precompute one
+        """
+        return None
 
 
 class BaseRecommendationStrategy(RecommendationStrategy):
@@ -79,11 +116,19 @@ class BaseRecommendationStrategy(RecommendationStrategy):
     Implements common methods and utilities that specific strategies can inherit.
     """
     
+    __slots__ = (
+        "_cls_name", "is_trained", "_sim_out",
+        "_item_similarity", "_item_similarity_built"
+    )
+    
     def __init__(self):
         """Initialize the strategy with default values."""
-        self._is_trained = False
-        self._training_data = None
-        logger.info(f"Initialized {self.__class__.__name__}")
+        self._cls_name = type(self).__name__
+        self.is_trained = False
+        self._sim_out: Optional[np.ndarray] = None
+        self._item_similarity: Optional[Tuple[Dict[int, int], np.ndarray]] = None
+        self._item_similarity_built = False
+        logger.info(f"Initialized {self._cls_name}")
     
     def check_trained(self):
         """
@@ -92,20 +137,42 @@ class BaseRecommendationStrategy(RecommendationStrategy):
         Raises:
             RuntimeError: If the strategy has not been trained
         """
-        if not self._is_trained:
-            msg = f"{self.__class__.__name__} has not been trained"
+        if not self.is_trained:
+            msg = f"{self._cls_name} has not been trained"
             logger.error(msg)
             raise RuntimeError(msg)
     
-    @property
-    def is_trained(self) -> bool:
+    def get_similarity_matrix(self) -> Optional[Tuple[Dict[int, int], np.ndarray]]:
         """
-        Check if the strategy has been trained.
+        Get the item similarity matrix, building it on first use.
+        
+        The matrix stays cached until invalidate_similarity_matrix() is called,
+        which strategies do whenever they are trained.
+        
+        Returns:
+            A tuple of the item ID to row index mapping and the (N, N) float32
+            similarity matrix, or None if the strategy doesn't build one
+        """
+        self.check_trained()
+        if not self._item_similarity_built:
+            self._item_similarity = self._build_similarity_matrix()
+            self._item_similarity_built = True
+        return self._item_similarity
+    
+    def invalidate_similarity_matrix(self) -> None:
+        """Drop the cached item similarity matrix so it is rebuilt on next use."""
+        self._item_similarity = None
+        self._item_similarity_built = False
+    
+    def _build_similarity_matrix(self) -> Optional[Tuple[Dict[int, int], np.ndarray]]:
+        """
+        Build the item similarity matrix; strategies that can precompute one override this.
         
         Returns:
-            True if the strategy has been trained, False otherwise
+            A tuple of the item ID to row index mapping and the (N, N) float32
+            similarity matrix, or None if no matrix is built
         """
-        return self._is_trained
+        return None
     
     def normalize_scores(self, scores: Dict[int, float]) -> Dict[int, float]:
         """
@@ -133,10 +200,72 @@ class BaseRecommendationStrategy(RecommendationStrategy):
             for item_id, score in scores.items()
         }
     
+    def _gemm_nt(self, a: np.ndarray, b: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Compute ``a @ b.T`` in single precision through BLAS sgemm.
+        
+        Args:
+            a: 2D array of shape (N, D)
+            b: 2D array of shape (M, D)
+            out: Optional Fortran-ordered float32 buffer of shape (N, M) to write into
+            
+        Returns:
+            The (N, M) product, stored in ``out`` when provided
+        """
+        a = np.ascontiguousarray(a, dtype=np.float32)
+        b = np.ascontiguousarray(b, dtype=np.float32)
+        
+        # The transposed views of C-ordered inputs are Fortran-ordered, so BLAS reads them without copying
+        if out is None:
+            return sgemm(1.0, a=a.T, b=b.T, trans_a=True)
+        return sgemm(1.0, a=a.T, b=b.T, trans_a=True, c=out, beta=0.0, overwrite_c=True)
+    
+    def cosine_similarity_matrix(self, matrix: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calculate pairwise cosine similarity between the rows of a matrix.
+        
+        The dot products are computed with a single sgemm call into a preallocated
+        buffer that is reused across calls with the same number of rows.
+        
+        Args:
+            matrix: 2D array whose rows are the vectors to compare
+            mask: Optional 0/1 array of the same shape. When given, the norms for each
+                  pair only include the entries present in both rows (e.g. co-rated items)
+            
+        Returns:
+            2D float32 array of similarities clipped to [0, 1]. The array is the shared
+            buffer, so callers that keep it across calls must copy it.
+        """
+        m = np.ascontiguousarray(matrix, dtype=np.float32)
+        n_rows = m.shape[0]
+        
+        if self._sim_out is None or self._sim_out.shape != (n_rows, n_rows):
+            self._sim_out = np.empty((n_rows, n_rows), dtype=np.float32, order="F")
+        
+        similarity = self._gemm_nt(m, m, out=self._sim_out)
+        
+        if mask is None:
+            squared_norms = np.einsum("ij,ij->i", m, m)
+            denominator = np.sqrt(np.outer(squared_norms, squared_norms))
+        else:
+            # Entry (i, j) is the squared norm of row i restricted to the entries present in row j
+            squared_norms = self._gemm_nt(m * m, mask)
+            denominator = np.sqrt(squared_norms * squared_norms.T)
+        
+        # Avoid division by zero for empty rows or rows with nothing in common
+        np.divide(similarity, denominator, out=similarity, where=denominator > 0)
+        similarity[denominator <= 0] = 0.0
+        
+        # Ensure the result is between 0 and 1
+        np.clip(similarity, 0.0, 1.0, out=similarity)
+        return similarity
+    
     def filter_already_rated(self, user_id: int, item_scores: Dict[int, float]) -> Dict[int, float]:
         """
         Remove items the user has already rated from recommendations.
         
+        Candidates are looked up in the sorted rated-item array with one binary search.
+        
         Args:
             user_id: The ID of the user
             item_scores: Dictionary mapping item IDs to scores
@@ -144,15 +273,64 @@ class BaseRecommendationStrategy(RecommendationStrategy):
         Returns:
             Dictionary with already rated items removed
         """
-        from models.rating_model import RatingModel
+        rated_sorted = self._get_rated_item_ids(user_id)
+        if not item_scores:
+            return {}
         
-        # Get items the user has already rated
-        user_ratings = RatingModel.find_by_user(user_id)
-        rated_item_ids = {rating.item_id for rating in user_ratings}
+        candidate_ids = np.fromiter(item_scores.keys(), dtype=np.int64, count=len(item_scores))
+        keep = self._unrated_mask(rated_sorted, candidate_ids)
         
-        # Remove rated items
         return {
             item_id: score
-            for item_id, score in item_scores.items()
-            if item_id not in rated_item_ids
+            for (item_id, score), unrated in zip(item_scores.items(), keep)
+            if unrated
         }
+    
+    def _get_rated_item_ids(self, user_id: int) -> np.ndarray:
+        """
+        Get the IDs of the items a user has rated.
+        
+        Args:
+            user_id: The ID of the user
+            
+        Returns:
+            Sorted, de-duplicated int64 array of rated item IDs
+        """
+        from models.rating_model import RatingModel
+        
+        user_ratings = RatingModel.find_by_user(user_id)
+        return np.unique(np.fromiter(
+            (rating.item_id for rating in user_ratings), dtype=np.int64, count=len(user_ratings)
+        ))
+    
+    def _unrated_mask(self, rated_sorted: np.ndarray, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Compute which candidate items the user has not rated.
+        
+        Args:
+            rated_sorted: Sorted array of the user's rated item IDs
+            item_ids: 1D int64 array of candidate item IDs
+            
+        Returns:
+            Boolean array, True where the item has not been rated
+        """
+        if len(rated_sorted) == 0 or len(item_ids) == 0:
+            return np.ones(len(item_ids), dtype=bool)
+        
+        return ~self._sorted_contains(rated_sorted, item_ids)
+    
+    @staticmethod
+    def _sorted_contains(rated_sorted: np.ndarray, item_ids: np.ndarray) -> np.ndarray:
+        """
+        Test membership of item IDs in a sorted array with binary search.
+        
+        Args:
+            rated_sorted: Non-empty sorted array of item IDs
+            item_ids: 1D array of item IDs to look up
+            
+        Returns:
+            Boolean array, True where the item ID is present
+        """
+        idx = np.searchsorted(rated_sorted, item_ids)
+        # Reason: IDs beyond the last element get idx == len, which must not index out of bounds
+        return rated_sorted[np.minimum(idx, len(rated_sorted) - 1)] == item_ids
@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the unit tests.
+
+Test modules import this as a sibling module, the same way they run
+as scripts from the tests directory.
+"""
+import unittest
+import logging
+from typing import Any, Tuple
+from unittest.mock import patch, MagicMock
+
+
+class QuietTestCase(unittest.TestCase):
+    """Base test case that silences logging and undoes its patches after each test."""
+
+    def setUp(self):
+        """Suppress logging until the test case finishes."""
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def start_patch(self, target: str, **kwargs: Any) -> MagicMock:
+        """
+        Patch target for the rest of the test case.
+
+        Args:
+            target: Dotted path of the object to patch
+            **kwargs: Passed on to unittest.mock.patch
+
+        Returns:
+            The mock that replaces target
+        """
+        patcher = patch(target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+
+def mock_db(*chained: str) -> Tuple[MagicMock, MagicMock]:
+    """
+    Build a mock database client whose table() returns a mock query.
+
+    Args:
+        *chained: Query builder methods that return the query itself
+
+    Returns:
+        Tuple of (client, query)
+    """
+    query = MagicMock()
+    for method in chained:
+        getattr(query, method).return_value = query
+    db = MagicMock()
+    db.table.return_value = query
+    return db, query
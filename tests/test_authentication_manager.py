@@ -5,6 +5,7 @@ Unit tests for AuthenticationManager class.
 This test suite validates the password hashing, user registration, and
 login functionality in the AuthenticationManager class.
 """
+import asyncio
 import unittest
 import os
 import sys
@@ -22,9 +23,17 @@ class TestAuthenticationManager(unittest.TestCase):
     """Test cases for AuthenticationManager functionality.
     
     Verifies proper implementation of the Singleton design pattern and
-    secure password handling using PBKDF2 with salt.
+    secure password handling using Argon2id, with legacy PBKDF2 hashes
+    still accepted.
     """
     
+    test_password_static = "SecurePass123"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Hash the shared test password once, since password hashing is deliberately slow."""
+        cls._cached_hash = AuthenticationManager.hash_password(cls.test_password_static)
+    
     def setUp(self):
         """Set up test environment before each test case."""
         # Suppress logging during tests
@@ -32,7 +41,7 @@ class TestAuthenticationManager(unittest.TestCase):
         
         self.test_username = "testuser"
         self.test_email = "test@example.com"
-        self.test_password = "SecurePass123"
+        self.test_password = self.test_password_static
         self.test_first_name = "Test"
         self.test_last_name = "User"
     
@@ -71,14 +80,97 @@ class TestAuthenticationManager(unittest.TestCase):
         # Verify incorrect password fails
         self.assertFalse(AuthenticationManager.verify_password(password_hash, "WrongPassword"))
     
+    def _legacy_hash(self, password):
+        """Build a hash in the legacy algorithm$iterations$salt$hash PBKDF2 format."""
+        salt = "0123456789abcdef"
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 1000).hex()
+        return f"pbkdf2_sha256$1000${salt}${digest}"
+    
+    def test_argon2_hash_format(self):
+        """Test that new hashes are Argon2id and don't need rehashing."""
+        self.assertTrue(self._cached_hash.startswith("$argon2id$"))
+        self.assertFalse(AuthenticationManager.needs_rehash(self._cached_hash))
+    
+    def test_legacy_password_verification(self):
+        """Test that legacy PBKDF2 hashes still verify and are flagged for rehashing."""
+        legacy_hash = self._legacy_hash(self.test_password)
+        
+        self.assertTrue(AuthenticationManager.verify_password(legacy_hash, self.test_password))
+        self.assertFalse(AuthenticationManager.verify_password(legacy_hash, "WrongPassword"))
+        self.assertTrue(AuthenticationManager.needs_rehash(legacy_hash))
+        
+        # Malformed hashes never verify
+        self.assertFalse(AuthenticationManager.verify_password("pbkdf2_sha256$many$salt$hash", self.test_password))
+        self.assertFalse(AuthenticationManager.verify_password("not-a-hash", self.test_password))
+        self.assertFalse(AuthenticationManager.verify_password(
+            legacy_hash[:-2] + "zz", self.test_password
+        ))
+        self.assertFalse(AuthenticationManager.verify_password(
+            legacy_hash.replace("pbkdf2_sha256", "pbkdf2_sha1", 1), self.test_password
+        ))
+    
+    def test_verification_cache(self):
+        """Test that repeating an identical check within the TTL skips hashing."""
+        legacy_hash = self._legacy_hash("CachedPass123")
+        
+        with patch('utils.auth.hashlib.pbkdf2_hmac', wraps=hashlib.pbkdf2_hmac) as mock_pbkdf2:
+            self.assertTrue(AuthenticationManager.verify_password(legacy_hash, "CachedPass123"))
+            self.assertTrue(AuthenticationManager.verify_password(legacy_hash, "CachedPass123"))
+            self.assertEqual(mock_pbkdf2.call_count, 1)
+            
+            # A different password is a different cache entry
+            self.assertFalse(AuthenticationManager.verify_password(legacy_hash, "OtherPass123"))
+            self.assertEqual(mock_pbkdf2.call_count, 2)
+    
+    def test_verify_batch(self):
+        """Test that batch verification keeps the order of its input."""
+        legacy_hash = self._legacy_hash(self.test_password)
+        
+        results = AuthenticationManager.verify_batch([
+            (self._cached_hash, self.test_password),
+            (legacy_hash, "WrongPassword"),
+            (legacy_hash, self.test_password),
+        ])
+        
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(AuthenticationManager.verify_batch([]), [])
+    
+    def test_native_pbkdf2_check(self):
+        """Test that a pure Python PBKDF2 fails startup only when native is required."""
+        from utils import auth
+        
+        def fallback_pbkdf2(*args):
+            pass
+        fallback_pbkdf2.__module__ = "hashlib"
+        
+        with patch.object(auth.hashlib, 'pbkdf2_hmac', fallback_pbkdf2):
+            with patch.object(auth, 'REQUIRE_NATIVE_PBKDF2', False):
+                auth._check_native_pbkdf2()
+            with patch.object(auth, 'REQUIRE_NATIVE_PBKDF2', True):
+                with self.assertRaises(RuntimeError):
+                    auth._check_native_pbkdf2()
+    
+    @patch('models.user_model.UserModel')
+    def test_login_upgrades_legacy_hash(self, mock_user_model):
+        """Test that logging in with a legacy hash stores an Argon2id hash."""
+        mock_user = MagicMock()
+        mock_user.password_hash = self._legacy_hash(self.test_password)
+        mock_user_model.find_by_username.return_value = mock_user
+        
+        success, _, _ = AuthenticationManager.login_user(self.test_username, self.test_password)
+        
+        self.assertTrue(success)
+        self.assertTrue(mock_user.password_hash.startswith("$argon2id$"))
+        self.assertTrue(AuthenticationManager.verify_password(mock_user.password_hash, self.test_password))
+        mock_user.update_last_login.assert_called_once()
+    
     @patch('models.user_model.UserModel')
     def test_register_user(self, mock_user_model):
         """Test user registration with lazy import of UserModel."""
         # Setup mocks
         mock_user = MagicMock()
         mock_user.id = 1
-        mock_user_model.find_by_username.return_value = None
-        mock_user_model.find_by_email.return_value = None
+        mock_user_model.find_by_username_or_email.return_value = []
         mock_user_model.return_value = mock_user
         
         # Register a new user
@@ -108,7 +200,9 @@ class TestAuthenticationManager(unittest.TestCase):
     def test_register_existing_username(self, mock_user_model):
         """Test registration fails with existing username."""
         # Setup mocks for existing username
-        mock_user_model.find_by_username.return_value = MagicMock()
+        mock_user_model.find_by_username_or_email.return_value = [
+            {'id': 2, 'username': self.test_username, 'email': 'other@example.com'}
+        ]
         
         # Attempt to register
         success, message, user = AuthenticationManager.register_user(
@@ -119,6 +213,24 @@ class TestAuthenticationManager(unittest.TestCase):
         self.assertFalse(success)
         self.assertEqual(message, "Username already exists")
         self.assertIsNone(user)
+    
+    @patch('models.user_model.UserModel')
+    def test_register_existing_email(self, mock_user_model):
+        """Test registration fails with existing email."""
+        mock_user_model.find_by_username_or_email.return_value = [
+            {'id': 2, 'username': 'otheruser', 'email': self.test_email}
+        ]
+        
+        success, message, user = AuthenticationManager.register_user(
+            self.test_username, self.test_email, self.test_password
+        )
+        
+        self.assertFalse(success)
+        self.assertEqual(message, "Email already exists")
+        self.assertIsNone(user)
+        mock_user_model.find_by_username_or_email.assert_called_once_with(
+            self.test_username, self.test_email
+        )
         
         # Verify no user was created or saved
         mock_user_model.assert_not_called()
@@ -128,7 +240,7 @@ class TestAuthenticationManager(unittest.TestCase):
         """Test user login by username."""
         # Setup mock user with correct password hash
         mock_user = MagicMock()
-        mock_user.password_hash = AuthenticationManager.hash_password(self.test_password)
+        mock_user.password_hash = self._cached_hash
         mock_user_model.find_by_username.return_value = mock_user
         mock_user_model.find_by_email.return_value = None
         
@@ -148,7 +260,7 @@ class TestAuthenticationManager(unittest.TestCase):
         """Test user login by email."""
         # Setup mock user with correct password hash
         mock_user = MagicMock()
-        mock_user.password_hash = AuthenticationManager.hash_password(self.test_password)
+        mock_user.password_hash = self._cached_hash
         mock_user_model.find_by_email.return_value = mock_user
         
         # Attempt login
@@ -164,7 +276,7 @@ class TestAuthenticationManager(unittest.TestCase):
         """Test login fails with invalid credentials."""
         # Setup mock user with correct password hash
         mock_user = MagicMock()
-        mock_user.password_hash = AuthenticationManager.hash_password(self.test_password)
+        mock_user.password_hash = self._cached_hash
         mock_user_model.find_by_username.return_value = mock_user
         
         # Attempt login with wrong password
@@ -177,6 +289,21 @@ class TestAuthenticationManager(unittest.TestCase):
         
         # Verify last login was not updated
         mock_user.update_last_login.assert_not_called()
+    
+    @patch('models.user_model.UserModel')
+    def test_login_user_async(self, mock_user_model):
+        """Test that the async login returns the same result as the sync one."""
+        mock_user = MagicMock()
+        mock_user.password_hash = self._cached_hash
+        mock_user_model.find_by_username.return_value = mock_user
+        
+        success, message, user = asyncio.run(
+            AuthenticationManager.login_user_async(self.test_username, self.test_password)
+        )
+        
+        self.assertTrue(success)
+        self.assertEqual(message, "Login successful")
+        self.assertEqual(user, mock_user)
 
 
 if __name__ == '__main__':
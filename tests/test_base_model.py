@@ -88,10 +88,9 @@ class TestBaseModelSerialization(unittest.TestCase):
         self.assertTrue(isinstance(serialized_data['updated_at'], str))
         self.assertEqual(serialized_data['date_field'], None)  # None should remain None
         
-        # Verify the datetime format is ISO 8601
-        expected_dt_str = self.test_datetime.isoformat()
-        self.assertEqual(serialized_data['created_at'], expected_dt_str)
-        self.assertEqual(serialized_data['updated_at'], expected_dt_str)
+        # Verify the datetime format is ISO 8601 and round-trips exactly
+        self.assertEqual(datetime.fromisoformat(serialized_data['created_at']), self.test_datetime)
+        self.assertEqual(datetime.fromisoformat(serialized_data['updated_at']), self.test_datetime)
     
     def test_dict_representation(self):
         """Test that the model can be properly converted to a dictionary."""
@@ -104,18 +103,59 @@ class TestBaseModelSerialization(unittest.TestCase):
         self.assertTrue(isinstance(model_dict['updated_at'], datetime))
         self.assertIsNone(model_dict['date_field'])
         
+    @patch('utils.db_manager.DatabaseManager')
+    def test_count(self, mock_db_manager):
+        """Test that count reads the exact count without fetching rows."""
+        mock_query = MagicMock()
+        mock_query.select.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.execute.return_value = MagicMock(count=42)
+        mock_db_manager.return_value.client.table.return_value = mock_query
+        
+        self.assertEqual(self.TestModel.count(), 42)
+        mock_db_manager.return_value.client.table.assert_called_once_with("test_table")
+        mock_query.select.assert_called_once_with("id", count="exact")
+        
+    @patch('utils.db_manager.DatabaseManager')
+    def test_page(self, mock_db_manager):
+        """Test that a page is fetched as an end-exclusive, id-ordered range."""
+        mock_query = MagicMock()
+        mock_query.select.return_value = mock_query
+        mock_query.order.return_value = mock_query
+        mock_query.range.return_value = mock_query
+        mock_query.execute.return_value = MagicMock(data=[{"id": 26, "name": "Test"}])
+        mock_db_manager.return_value.client.table.return_value = mock_query
+        
+        records = self.TestModel.page(25, 25)
+        
+        self.assertEqual([record.id for record in records], [26])
+        mock_query.order.assert_called_once_with("id")
+        mock_query.range.assert_called_once_with(25, 50)
+        
+    @patch('postgrest._sync.request_builder.SyncQueryRequestBuilder.execute', autospec=True)
+    @patch('utils.db_manager.DatabaseManager')
+    def test_page_range_header(self, mock_db_manager, mock_execute):
+        """Test that the real query builder requests exactly one page of rows."""
+        from postgrest import SyncPostgrestClient
+        
+        mock_db_manager.return_value.client = SyncPostgrestClient("http://localhost")
+        mock_db_manager.return_value.client.table = mock_db_manager.return_value.client.from_
+        mock_execute.return_value = MagicMock(data=[])
+        
+        self.TestModel.page(25, 25)
+        
+        request = mock_execute.call_args[0][0]
+        # Range is inclusive on the wire: rows 25 through 49 are 25 rows
+        self.assertEqual(request.headers["Range"], "25-49")
+        
     def test_json_serialization(self):
         """Test that the model can be serialized to JSON."""
-        # Convert to dict and then serialize
-        model_dict = self.model.model_dump()
-        
-        # This should raise an error without our custom serialization
+        # Plain model_dump keeps datetime objects, which json cannot serialize
         with self.assertRaises(TypeError):
-            json.dumps(model_dict)
+            json.dumps(self.model.model_dump())
             
-        # Now with our custom serializer
-        from models.base_model import DateTimeEncoder
-        json_str = json.dumps(model_dict, cls=DateTimeEncoder)
+        # Pydantic's JSON mode serializes datetimes natively
+        json_str = self.model.model_dump_json()
         
         # Deserialize and check
         deserialized = json.loads(json_str)
@@ -125,6 +165,5 @@ class TestBaseModelSerialization(unittest.TestCase):
         self.assertTrue(isinstance(deserialized['updated_at'], str))
         self.assertIsNone(deserialized['date_field'])
 
-
 if __name__ == '__main__':
     unittest.main()
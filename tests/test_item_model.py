@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ItemModel query helpers.
+
+This test suite validates the lightweight item queries that fetch only
+the columns they need instead of hydrating full ItemModel objects.
+"""
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.item_model import ItemModel
+from helpers import QuietTestCase, mock_db
+
+
+class TestItemModel(QuietTestCase):
+    """Test cases for ItemModel query helpers."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+
+        # Any chained query builder call returns the same mock query
+        self.db, self.query = mock_db("select", "eq", "in_", "ilike", "range", "order", "limit")
+        self.mock_get_db = self.start_patch('models.item_model.ItemModel._get_db', return_value=self.db)
+
+    def test_find_by_ids(self):
+        """Test that items are fetched in batches and keyed by ID."""
+        self.query.execute.side_effect = [
+            MagicMock(data=[{"id": 1, "name": "Dune", "category": "books"}]),
+            MagicMock(data=[{"id": 3, "name": "Alien", "category": "movies"}]),
+        ]
+
+        with patch.object(ItemModel, '_id_batch_size', 2):
+            items = ItemModel.find_by_ids([1, 2, 1, 3])
+
+        self.assertEqual({item_id: item.name for item_id, item in items.items()}, {1: "Dune", 3: "Alien"})
+        self.assertEqual(
+            [call.args for call in self.query.in_.call_args_list],
+            [("id", [1, 2]), ("id", [3])]
+        )
+
+    def test_find_by_ids_empty(self):
+        """Test that no query is issued for an empty ID list."""
+
+        self.assertEqual(ItemModel.find_by_ids([]), {})
+        self.db.table.assert_not_called()
+
+    def test_search(self):
+        """Test that category and text filters are pushed to the query."""
+        self.query.execute.return_value = MagicMock(data=[
+            {"id": 1, "name": "Dune", "category": "books"}
+        ])
+
+        params = self.query.params
+        items = ItemModel.search("books", 'du"ne')
+
+        self.assertEqual([item.name for item in items], ["Dune"])
+        self.query.eq.assert_called_once_with("category", "books")
+        params.add.assert_called_once_with(
+            "or", '(name.ilike."*du*ne*",description.ilike."*du*ne*")'
+        )
+
+    def test_search_reserved_characters(self):
+        """Test that filter syntax and wildcards never reach the or parameter."""
+        self.query.execute.return_value = MagicMock(data=[])
+
+        params = self.query.params
+        ItemModel.search(query='a,b).eq(id,1) 100%_\\x*')
+
+        params.add.assert_called_once_with(
+            "or", '(name.ilike."*a*b*.eq*id*1* 100*x*",description.ilike."*a*b*.eq*id*1* 100*x*")'
+        )
+
+    def test_search_only_reserved_characters(self):
+        """Test that a query made only of reserved characters matches nothing."""
+
+        self.assertEqual(ItemModel.search(query='%*,()'), [])
+        self.query.execute.assert_not_called()
+
+    def test_search_without_filters(self):
+        """Test that no filters are applied when none are given."""
+        self.query.execute.return_value = MagicMock(data=[])
+
+        self.assertEqual(ItemModel.search(), [])
+        self.query.eq.assert_not_called()
+        self.query.params.add.assert_not_called()
+
+    def test_distinct_categories(self):
+        """Test that categories are de-duplicated and sorted."""
+        self.query.execute.return_value = MagicMock(data=[
+            {"category": "books"}, {"category": "movies"}, {"category": "books"}
+        ])
+
+        self.assertEqual(ItemModel.distinct_categories(), ["books", "movies"])
+        self.query.select.assert_called_once_with("category")
+        self.query.eq.assert_called_once_with("is_active", True)
+
+    def test_all_ids(self):
+        """Test that only the id column is fetched, as an integer array."""
+        self.query.execute.return_value = MagicMock(data=[{"id": 3}, {"id": 1}, {"id": 2}])
+
+        ids = ItemModel.all_ids()
+
+        self.assertEqual(ids.tolist(), [3, 1, 2])
+        self.assertEqual(ids.dtype.kind, "i")
+        self.query.select.assert_called_once_with("id")
+
+    def test_summary_rows(self):
+        """Test that summaries are returned as plain tuples."""
+        self.query.execute.return_value = MagicMock(data=[
+            {"id": 1, "name": "Dune", "category": "books", "popularity_score": 4.5, "is_active": True}
+        ])
+
+        self.assertEqual(ItemModel.summary_rows(), [(1, "Dune", "books", 4.5, True)])
+        self.query.range.assert_not_called()
+
+    def test_summary_rows_page(self):
+        """Test that a page of summaries is requested with an end-exclusive range."""
+        self.query.execute.return_value = MagicMock(data=[])
+
+        ItemModel.summary_rows(offset=50, limit=25)
+
+        self.query.order.assert_called_once_with("id")
+        self.query.range.assert_called_once_with(50, 75)
+
+    @patch('postgrest._sync.request_builder.SyncQueryRequestBuilder.execute', autospec=True)
+    def test_summary_rows_range_header(self, mock_execute):
+        """Test that the real query builder requests exactly one page of summaries."""
+        from postgrest import SyncPostgrestClient
+
+        client = SyncPostgrestClient("http://localhost")
+        self.mock_get_db.return_value = MagicMock(table=client.from_)
+        mock_execute.return_value = MagicMock(data=[])
+
+        ItemModel.summary_rows(offset=50, limit=25)
+
+        request = mock_execute.call_args[0][0]
+        # Range is inclusive on the wire: rows 50 through 74 are 25 rows
+        self.assertEqual(request.headers["Range"], "50-74")
+
+
+if __name__ == '__main__':
+    unittest.main()
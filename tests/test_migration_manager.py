@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MigrationManager.
+
+This test suite validates how SQL migration files are recorded
+in the schema_migrations table.
+"""
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch, MagicMock
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.migration_manager import MigrationManager
+from helpers import QuietTestCase, mock_db
+
+
+class TestMigrationManager(QuietTestCase):
+    """Test cases for MigrationManager."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+
+        self.directory = tempfile.TemporaryDirectory()
+        for name in ("001_first.sql", "002_second.sql", "003_third.sql"):
+            with open(os.path.join(self.directory.name, name), "w") as file:
+                file.write(f"-- {name}\n")
+        self.addCleanup(self.directory.cleanup)
+
+        self.db, self.query = mock_db("select", "eq")
+        self.start_patch('utils.migration_manager.DatabaseManager').return_value.client = self.db
+
+    def test_run_migrations_in_directory(self):
+        """Test that unapplied migrations are recorded with a single insert."""
+        self.query.execute.return_value = MagicMock(data=[{"name": "001_first.sql"}])
+
+        results = MigrationManager().run_migrations_in_directory(self.directory.name)
+
+        self.assertEqual(results, {
+            "001_first.sql": True,
+            "002_second.sql": True,
+            "003_third.sql": True,
+        })
+        self.query.insert.assert_called_once()
+        records = self.query.insert.call_args[0][0]
+        self.assertEqual([r["name"] for r in records], ["002_second.sql", "003_third.sql"])
+        self.assertEqual(records[0]["sql_executed"], "-- 002_second.sql\n")
+
+    def test_run_migrations_all_applied(self):
+        """Test that nothing is inserted when every migration is applied."""
+        self.query.execute.return_value = MagicMock(data=[
+            {"name": "001_first.sql"}, {"name": "002_second.sql"}, {"name": "003_third.sql"}
+        ])
+
+        results = MigrationManager().run_migrations_in_directory(self.directory.name)
+
+        self.assertTrue(all(results.values()))
+        self.query.insert.assert_not_called()
+
+    def test_run_migrations_insert_fails(self):
+        """Test that a failed insert marks the whole batch as failed."""
+        self.query.execute.return_value = MagicMock(data=[])
+        self.query.insert.return_value.execute.side_effect = Exception("boom")
+
+        results = MigrationManager().run_migrations_in_directory(self.directory.name)
+
+        self.assertEqual(set(results), {"001_first.sql", "002_second.sql", "003_third.sql"})
+        self.assertFalse(any(results.values()))
+
+    def test_apply_migration(self):
+        """Test that a new migration file is recorded with its SQL."""
+        self.query.execute.return_value = MagicMock(data=[])
+        path = os.path.join(self.directory.name, "002_second.sql")
+
+        self.assertTrue(MigrationManager().apply_migration(path))
+
+        self.query.eq.assert_called_once_with("name", "002_second.sql")
+        record = self.query.insert.call_args[0][0]
+        self.assertEqual(record["sql_executed"], "-- 002_second.sql\n")
+
+    def test_apply_migration_already_applied(self):
+        """Test that an applied migration is skipped without reading the file."""
+        self.query.execute.return_value = MagicMock(data=[{"name": "001_first.sql"}])
+        path = os.path.join(self.directory.name, "001_first.sql")
+
+        with patch.object(MigrationManager, '_read_sql') as mock_read:
+            self.assertTrue(MigrationManager().apply_migration(path))
+            mock_read.assert_not_called()
+        self.query.insert.assert_not_called()
+
+    def test_read_empty_migration(self):
+        """Test that an empty migration file reads as empty SQL."""
+        path = os.path.join(self.directory.name, "004_empty.sql")
+        open(path, "w").close()
+
+        self.assertEqual(MigrationManager._read_sql(path), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Unit tests for UserActivityObserver.
+
+This test suite validates how user activity events are recorded,
+both one at a time and in batches.
+"""
+import unittest
+import os
+import sys
+import threading
+import datetime
+from unittest.mock import patch
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.observer import Subject, UserActivityObserver, wait_for_notifications
+from helpers import QuietTestCase
+
+
+class TestUserActivityObserver(QuietTestCase):
+    """Test cases for UserActivityObserver."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+        self.observer = UserActivityObserver()
+
+    def test_update(self):
+        """Test that a single event is recorded with its data."""
+        self.observer.update(None, "user_login", {"user_id": 1})
+
+        activities = self.observer.get_user_activities(1)
+        self.assertEqual(len(activities), 1)
+        self.assertEqual(activities[0]["event_type"], "user_login")
+        self.assertIsInstance(activities[0]["timestamp"], datetime.datetime)
+        self.assertEqual(activities[0]["timestamp"].tzinfo, datetime.timezone.utc)
+
+    def test_user_activities_newest_first(self):
+        """Test that user activities are returned newest first and limited."""
+        for item_id in range(5):
+            self.observer.update(None, "item_viewed", {"user_id": 1, "item_id": item_id})
+        self.observer.update(None, "item_viewed", {"user_id": 2, "item_id": 9})
+
+        activities = self.observer.get_user_activities(1, limit=3)
+        self.assertEqual([a["item_id"] for a in activities], [4, 3, 2])
+        self.assertEqual(self.observer.get_user_activities(3), [])
+
+    def test_activity_keeps_event_data(self):
+        """Test that extra event data is returned with the activity."""
+        self.observer.update(None, "recommendation_clicked", {
+            "user_id": 1, "item_id": 7, "recommendation_type": "hybrid"
+        })
+
+        activity = self.observer.get_user_activities(1)[0]
+        self.assertEqual(activity["item_id"], 7)
+        self.assertEqual(activity["recommendation_type"], "hybrid")
+        self.assertFalse(hasattr(self.observer, "__dict__"))
+
+    def test_update_many(self):
+        """Test that a batch of events is recorded in order."""
+        self.observer.update_many(None, [
+            ("user_login", {"user_id": 1}),
+            ("rating_created", {"user_id": 1, "item_id": 5, "rating_value": 4}),
+            ("rating_created", {"user_id": 2, "item_id": 5, "rating_value": 2}),
+        ])
+
+        self.assertEqual(self.observer.get_event_count("user_login"), 1)
+        self.assertEqual(self.observer.get_event_count("rating_created"), 2)
+        self.assertEqual(len(self.observer.get_user_activities(1)), 2)
+
+    def test_event_count_after_clear(self):
+        """Test that event counts are reset with the activities."""
+        self.observer.update(None, "rating_created", {"user_id": 1})
+        self.observer.update(None, "rating_created", {"user_id": 2})
+        self.assertEqual(self.observer.get_event_count("rating_created"), 2)
+        self.assertEqual(self.observer.get_event_count("unknown_event"), 0)
+
+        self.observer.clear_activities()
+
+        self.assertEqual(self.observer.get_event_count("rating_created"), 0)
+        self.assertEqual(self.observer.get_user_activities(1), [])
+
+    @patch('utils.observer.MAX_ACTIVITY_LOG', 2)
+    def test_activity_log_is_bounded(self):
+        """Test that the oldest activities are dropped once the log is full."""
+        observer = UserActivityObserver()
+        for item_id in range(3):
+            observer.update(None, "item_viewed", {"user_id": 1, "item_id": item_id})
+
+        self.assertEqual([a.item_id for a in observer._activities], [1, 2])
+        # Counts match the activities still in the log
+        self.assertEqual(observer.get_event_count("item_viewed"), 2)
+        observer.update(None, "user_login", {"user_id": 1})
+        observer.update(None, "user_login", {"user_id": 1})
+        self.assertEqual(observer.get_event_count("item_viewed"), 0)
+        self.assertEqual(observer.get_event_count("user_login"), 2)
+
+    def test_concurrent_updates_are_counted(self):
+        """Test that updates from several threads are all recorded."""
+        def record():
+            for _ in range(500):
+                self.observer.update(None, "item_viewed", {"user_id": 1})
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.observer.get_event_count("item_viewed"), 2000)
+        self.assertEqual(len(self.observer._activities), 2000)
+
+    @patch('utils.observer.MAX_ACTIVITY_LOG', 3)
+    def test_user_index_follows_log(self):
+        """Test that users whose activities all left the log are dropped from the index."""
+        observer = UserActivityObserver()
+        observer.update(None, "user_login", {"user_id": 1})
+        observer.update(None, "item_viewed", {"item_id": 5})
+        for user_id in (2, 3, 2):
+            observer.update(None, "user_login", {"user_id": user_id})
+
+        self.assertEqual(observer.get_user_activities(1), [])
+        self.assertEqual(set(observer._by_user), {2, 3})
+        self.assertEqual(len(observer.get_user_activities(2)), 2)
+
+    def test_update_many_empty(self):
+        """Test that an empty batch records nothing."""
+        self.observer.update_many(None, [])
+
+        self.assertEqual(self.observer.get_event_count("user_login"), 0)
+
+
+class TestSubject(QuietTestCase):
+    """Test cases for attaching and notifying observers."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+        self.subject = Subject()
+        self.observer = UserActivityObserver()
+
+    def test_attach_once(self):
+        """Test that attaching the same observer twice notifies it once."""
+        self.subject.attach(self.observer)
+        self.subject.attach(self.observer)
+
+        self.subject.notify("user_login", {"user_id": 1})
+        wait_for_notifications()
+
+        self.assertEqual(self.observer.get_event_count("user_login"), 1)
+
+    def test_detach(self):
+        """Test that a detached observer is no longer notified."""
+        self.subject.attach(self.observer)
+        self.subject.detach(self.observer)
+        self.subject.detach(self.observer)
+
+        self.subject.notify("user_login", {"user_id": 1})
+        wait_for_notifications()
+
+        self.assertEqual(self.observer.get_event_count("user_login"), 0)
+
+        # It can be attached again afterwards
+        self.subject.attach(self.observer)
+        self.subject.notify("user_login", {"user_id": 1})
+        wait_for_notifications()
+        self.assertEqual(self.observer.get_event_count("user_login"), 1)
+
+    def test_notify_runs_in_background(self):
+        """Test that observers are updated off the caller's thread."""
+        threads = []
+
+        class RecordingObserver(UserActivityObserver):
+            __slots__ = ()
+
+            def update(self, subject, event_type, data):
+                threads.append(threading.current_thread())
+                super().update(subject, event_type, data)
+
+        observer = RecordingObserver()
+        self.subject.attach(observer)
+        self.subject.notify("user_login", {"user_id": 1})
+        wait_for_notifications()
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(observer.get_event_count("user_login"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for RatingModel database helpers.
+
+This test suite validates how ratings are written and queried.
+"""
+import unittest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.rating_model import RatingModel
+from helpers import QuietTestCase, mock_db
+
+
+class TestRatingModel(QuietTestCase):
+    """Test cases for RatingModel database helpers."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+
+        self.db, self.query = mock_db()
+        self.mock_get_db = self.start_patch('models.rating_model.RatingModel._get_db', return_value=self.db)
+
+    def test_upsert(self):
+        """Test that a rating is written with a single upsert on user and item."""
+        self.query.upsert.return_value.execute.return_value = MagicMock(data=[
+            {"id": 7, "user_id": 1, "item_id": 2, "value": 4}
+        ])
+
+        rating = RatingModel.upsert(1, 2, 4)
+
+        self.assertEqual((rating.id, rating.value), (7, 4))
+        data, = self.query.upsert.call_args.args
+        self.assertEqual((data["user_id"], data["item_id"], data["value"]), (1, 2, 4))
+        # The original rating date must survive an update
+        self.assertNotIn("created_at", data)
+        self.assertEqual(self.query.upsert.call_args.kwargs, {"on_conflict": "user_id,item_id"})
+
+    def test_upsert_rejects_invalid_value(self):
+        """Test that out of range values are rejected before any query."""
+        with self.assertRaises(ValueError):
+            RatingModel.upsert(1, 2, 6)
+        self.mock_get_db.assert_not_called()
+
+    def test_get_stats_for_item(self):
+        """Test that average and count are aggregated by one database call."""
+        self.db.rpc.return_value.execute.return_value = MagicMock(
+            data={"avg_rating": 4.0, "num_ratings": 3}
+        )
+
+        self.assertEqual(RatingModel.get_stats_for_item(2), (4.0, 3))
+        self.db.rpc.assert_called_once_with("item_rating_stats", {"p_item_id": 2})
+        self.db.table.assert_not_called()
+
+        self.db.rpc.return_value.execute.return_value = MagicMock(
+            data={"avg_rating": 0, "num_ratings": 0}
+        )
+        self.assertEqual(RatingModel.get_stats_for_item(3), (0.0, 0))
+
+    def test_recompute_all_popularities(self):
+        """Test that all popularities are recomputed with one database call."""
+        self.db.rpc.return_value.execute.return_value = MagicMock(data=15)
+
+        self.assertEqual(RatingModel.recompute_all_popularities(), 15)
+        self.db.rpc.assert_called_once_with("recompute_all_popularities")
+        self.db.table.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
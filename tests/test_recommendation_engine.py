@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Unit tests for RecommendationEngine.
+
+This test suite validates the post-processing applied to recommendations
+before they are handed to the UI.
+"""
+import unittest
+import os
+import sys
+import pickle
+import threading
+import time
+from unittest.mock import patch, MagicMock
+import numpy as np
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.recommendation_engine import RecommendationEngine, _select_diverse, _make_popularity_function
+from utils.recommendation_result import RecommendationResult
+from helpers import QuietTestCase
+
+
+class TestRecommendationEngine(QuietTestCase):
+    """Test cases for RecommendationEngine functionality."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+        self.engine = RecommendationEngine()
+
+    def test_post_process_formats_scores(self):
+        """Test that every recommendation gets consistent fields and a formatted score."""
+        processed = self.engine._post_process_recommendations([
+            {"item_id": 1, "score": 0.876},
+            {"item_id": 2}
+        ])
+
+        self.assertEqual(processed[0]["score_percent"], "87.6%")
+        self.assertEqual(processed[1]["score"], 0.0)
+        self.assertEqual(processed[1]["recommendation_type"], "unknown")
+
+    def test_post_process_drops_duplicates(self):
+        """Test that duplicate items are removed, keeping the first occurrence."""
+        processed = self.engine._post_process_recommendations([
+            {"item_id": 1, "score": 0.9},
+            {"item_id": 2, "score": 0.8},
+            {"item_id": 1, "score": 0.5}
+        ])
+
+        self.assertEqual([rec["item_id"] for rec in processed], [1, 2])
+        self.assertEqual(processed[0]["score"], 0.9)
+
+    def test_post_process_keeps_strategy_fields(self):
+        """Test that processed recommendations behave like the strategy dictionaries."""
+        processed = self.engine._post_process_recommendations([
+            {"item_id": 1, "score": 0.5, "name": "Book", "recommendation_type": "hybrid"}
+        ])
+        rec = processed[0]
+
+        self.assertEqual(rec["name"], "Book")
+        self.assertEqual(rec.get("description"), None)
+        self.assertIn("score_percent", rec)
+        self.assertIn("name", rec)
+        self.assertNotIn("description", rec)
+        self.assertEqual(dict(rec), {
+            "item_id": 1, "score": 0.5, "recommendation_type": "hybrid",
+            "score_percent": "50.0%", "name": "Book"
+        })
+
+        # Fields can be added, and the result survives a pickle round trip
+        rec["_shape"] = (False, True, True)
+        copy = pickle.loads(pickle.dumps(processed))
+        self.assertEqual(copy[0]["_shape"], (False, True, True))
+        self.assertEqual(len(copy), 1)
+
+    @patch('utils.recommendation_engine.ItemModel.all_ids')
+    @patch('utils.recommendation_engine.ItemModel.find_by_ids')
+    def test_get_similar_items(self, mock_find_by_ids, mock_all_ids):
+        """Test that the most similar other items are returned in order."""
+        mock_all_ids.return_value = np.arange(1, 6)
+        mock_find_by_ids.side_effect = lambda ids: {
+            item_id: MagicMock(id=item_id, description="", category="Books") for item_id in ids
+        }
+        strategy = MagicMock()
+        strategy.get_similarity_vector.side_effect = lambda item_id, ids: np.array(
+            [{2: 0.2, 3: 0.9, 4: 0.0, 5: 0.5}[i] for i in ids], dtype=np.float32
+        )
+        self.engine._default_strategy = strategy
+
+        results = self.engine.get_similar_items(1, n=2)
+
+        self.assertEqual([r["item_id"] for r in results], [3, 5])
+        self.assertAlmostEqual(results[0]["similarity"], 0.9, places=6)
+        self.assertEqual(results[0]["similarity_percent"], "90.0%")
+        ids = strategy.get_similarity_vector.call_args[0][1]
+        self.assertNotIn(1, ids)
+        # Only the returned items are loaded
+        mock_find_by_ids.assert_called_once_with([3, 5])
+
+        # Items with no similarity are never returned
+        self.assertEqual([r["item_id"] for r in self.engine.get_similar_items(1, n=10)], [3, 5, 2])
+
+    def test_select_diverse(self):
+        """Test that diversity pushes a near-duplicate of the top pick down."""
+        scores = np.array([0.9, 0.85, 0.5])
+        similarity = np.array([
+            [1.0, 1.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ])
+
+        np.testing.assert_array_equal(_select_diverse(scores, similarity, 2, 0.0), [0, 1])
+        np.testing.assert_array_equal(_select_diverse(scores, similarity, 2, 0.5), [0, 2])
+        np.testing.assert_array_equal(_select_diverse(scores, similarity, 5, 0.5), [0, 2, 1])
+
+    def test_get_diverse_recommendations(self):
+        """Test that diverse recommendations are picked from three times as many candidates."""
+        candidates = [{"item_id": i, "score": 1.0 - i / 10} for i in range(1, 7)]
+        strategy = MagicMock()
+        # Items 1 and 2 are identical, every other pair is unrelated
+        strategy.get_similarity_vector.side_effect = lambda item_id, ids: np.array(
+            [1.0 if i == item_id or {i, item_id} == {1, 2} else 0.0 for i in ids], dtype=np.float32
+        )
+        self.engine._default_strategy = strategy
+
+        processed = self.engine._post_process_recommendations(candidates)
+        with patch.object(self.engine, 'recommend', return_value=processed) as mock_recommend:
+            selected = self.engine.get_diverse_recommendations(1, n=2, diversity_factor=0.5)
+
+        mock_recommend.assert_called_once_with(1, n=6)
+        self.assertEqual([rec["item_id"] for rec in selected], [1, 3])
+
+    @patch('utils.recommendation_engine.ItemModel.find_by_id')
+    @patch('utils.recommendation_engine.RatingModel.get_stats_for_item')
+    def test_update_item_popularity(self, mock_stats, mock_find_by_id):
+        """Test that popularity combines the average rating and the rating count."""
+        mock_stats.return_value = (4.0, 3)
+
+        self.engine.update_item_popularity(7)
+
+        mock_stats.assert_called_once_with(7)
+        # 0.7 * 4 / 5 + 0.3 * min(1, 0.1 * 4 / 2) = 0.62, scaled to 0-5
+        score, = mock_find_by_id.return_value.update_popularity.call_args.args
+        self.assertAlmostEqual(score, 3.1)
+
+    def test_apply_filters(self):
+        """Test that results and plain lists are filtered the same way."""
+        records = [
+            {"item_id": 1, "score": 0.9, "category": "Books"},
+            {"item_id": 2, "score": 0.4, "category": "Books"},
+            {"item_id": 3, "score": 0.8, "category": "Movies"},
+            {"item_id": 4, "score": 0.7},
+        ]
+        filters = {"category": ["Books", "Music"], "min_score": 0.5}
+
+        filtered = self.engine._apply_filters(RecommendationResult.from_records(records), filters)
+        self.assertIsInstance(filtered, RecommendationResult)
+        self.assertEqual([rec["item_id"] for rec in filtered], [1])
+
+        filtered = self.engine._apply_filters(records, filters)
+        self.assertEqual([rec["item_id"] for rec in filtered], [1])
+
+        filtered = self.engine._apply_filters(RecommendationResult.from_records(records), {"category": "Movies"})
+        self.assertEqual([rec["item_id"] for rec in filtered], [3])
+
+    @patch('utils.recommendation_engine.RecommendationFactory.create_strategy')
+    def test_get_strategy_trains_once(self, mock_create):
+        """Test that concurrent first requests for a strategy train it only once."""
+        strategy = MagicMock(is_trained=False)
+        # Reason: a slow train() widens the window in which a second thread could start training
+        strategy.train.side_effect = lambda: time.sleep(0.05)
+        mock_create.return_value = strategy
+
+        threads = [threading.Thread(target=self.engine.get_strategy, args=("hybrid",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_create.assert_called_once_with("hybrid")
+        strategy.train.assert_called_once()
+        self.assertIs(self.engine.get_strategy("hybrid"), strategy)
+
+    @patch('utils.recommendation_engine.UserModel.find_by_id')
+    def test_recommend_uses_default_strategy(self, mock_find_user):
+        """Test that calls without a strategy override go to the default strategy."""
+        strategy = MagicMock()
+        strategy.recommend.return_value = [{"item_id": 4, "score": 0.7}, {"item_id": 2, "score": 0.6}]
+
+        with patch.object(self.engine, 'get_strategy', return_value=strategy) as mock_get_strategy:
+            results = self.engine.recommend(1, n=2)
+
+        # The engine wasn't initialized, so the default strategy is fetched on first use
+        mock_get_strategy.assert_called_once_with("hybrid")
+        strategy.recommend.assert_called_once_with(1, n=2)
+        self.assertEqual([rec["item_id"] for rec in results], [4, 2])
+
+    def test_popularity_function(self):
+        """Test the popularity formula at its edges."""
+        popularity = _make_popularity_function()
+
+        self.assertEqual(popularity(0.0, 0), 0.0)
+        self.assertAlmostEqual(popularity(4.0, 3), 3.1)
+        # Many top ratings reach the maximum
+        self.assertAlmostEqual(popularity(5.0, 100), 5.0)
+
+        # The weights are taken from the arguments
+        self.assertAlmostEqual(_make_popularity_function(rating_weight=1.0, count_weight=0.0)(3.0, 1), 3.0)
+
+    @patch('utils.recommendation_engine.UserModel.find_by_id', return_value=None)
+    def test_recommend_unknown_user(self, mock_find_user):
+        """Test that an unknown user gets an empty result of the usual type."""
+        results = self.engine.recommend(99)
+
+        self.assertIsInstance(results, RecommendationResult)
+        self.assertEqual(len(results), 0)
+        self.assertEqual(results, RecommendationResult.empty())
+
+    def test_result_equality(self):
+        """Test that results with the same recommendations compare equal."""
+        records = [{"item_id": 1, "score": 0.9, "name": "Book"}, {"item_id": 2, "score": 0.5}]
+        first = self.engine._post_process_recommendations([dict(rec) for rec in records])
+        second = self.engine._post_process_recommendations([dict(rec) for rec in records])
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, first.take([1, 0]))
+        self.assertNotEqual(first, RecommendationResult.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for RecommendationFactory.
+
+This test suite validates how strategies are created and shared
+across callers.
+"""
+import unittest
+import os
+import sys
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.recommendation_factory import RecommendationFactory
+from strategies.collaborative_filtering import CollaborativeFilteringStrategy
+from strategies.content_based_filtering import ContentBasedFilteringStrategy
+from strategies.hybrid_filtering import HybridFilteringStrategy
+from helpers import QuietTestCase
+
+
+class TestRecommendationFactory(QuietTestCase):
+    """Test cases for RecommendationFactory."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+        RecommendationFactory.clear_cache()
+        self.addCleanup(RecommendationFactory.clear_cache)
+
+    def test_create_strategy_is_shared(self):
+        """Test that the same type and arguments return the same instance."""
+        first = RecommendationFactory.create_strategy("collaborative", similarity_method="pearson")
+        second = RecommendationFactory.create_strategy("collaborative", similarity_method="pearson")
+        other = RecommendationFactory.create_strategy("collaborative")
+
+        self.assertIsInstance(first, CollaborativeFilteringStrategy)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_unhashable_arguments_bypass_cache(self):
+        """Test that unhashable arguments always create a new instance."""
+        strategies = [(ContentBasedFilteringStrategy(), 1.0)]
+
+        first = RecommendationFactory.create_strategy("hybrid", strategies=strategies)
+        second = RecommendationFactory.create_strategy("hybrid", strategies=strategies)
+
+        self.assertIsInstance(first, HybridFilteringStrategy)
+        self.assertIsNot(first, second)
+
+    def test_clear_cache(self):
+        """Test that clearing the cache creates fresh instances."""
+        first = RecommendationFactory.create_strategy("content-based")
+        RecommendationFactory.clear_cache()
+
+        self.assertIsNot(first, RecommendationFactory.create_strategy("content-based"))
+
+    def test_unknown_strategy(self):
+        """Test that unknown strategy types are rejected."""
+        with self.assertRaises(ValueError):
+            RecommendationFactory.create_strategy("unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BaseRecommendationStrategy helpers.
+
+This test suite validates score normalization and the filtering of items
+a user has already rated.
+"""
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock
+import numpy as np
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.recommendation_strategy import BaseRecommendationStrategy
+from strategies.collaborative_filtering import CollaborativeFilteringStrategy
+from strategies.content_based_filtering import ContentBasedFilteringStrategy
+from helpers import QuietTestCase
+
+
+class DummyStrategy(BaseRecommendationStrategy):
+    """Minimal concrete strategy used to exercise the base class helpers."""
+
+    def train(self, data=None):
+        self.is_trained = True
+
+    def recommend(self, user_id, n=10, **kwargs):
+        return []
+
+    def explain(self, user_id, item_id):
+        return ""
+
+    def get_similarity(self, item_id1, item_id2):
+        return 0.0
+
+
+def _ratings_for(item_ids):
+    """Build mock rating objects for the given item IDs."""
+    return [MagicMock(item_id=item_id) for item_id in item_ids]
+
+
+class TestBaseRecommendationStrategy(QuietTestCase):
+    """Test cases for BaseRecommendationStrategy shared functionality."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+        self.strategy = DummyStrategy()
+
+    def test_normalize_scores(self):
+        """Test that scores are scaled into the [0, 1] range."""
+        normalized = self.strategy.normalize_scores({1: 2.0, 2: 4.0, 3: 3.0})
+        self.assertEqual(normalized, {1: 0.0, 2: 1.0, 3: 0.5})
+
+        # Identical scores collapse to 1.0
+        self.assertEqual(self.strategy.normalize_scores({1: 3.0, 2: 3.0}), {1: 1.0, 2: 1.0})
+
+    def test_cosine_similarity_matrix(self):
+        """Test pairwise cosine similarity, with and without a co-occurrence mask."""
+        matrix = np.array([[1.0, 0.0, 2.0], [2.0, 0.0, 4.0], [0.0, 3.0, 0.0]])
+
+        similarity = self.strategy.cosine_similarity_matrix(matrix)
+        np.testing.assert_allclose(similarity[0, 1], 1.0, rtol=1e-6)
+        self.assertEqual(similarity[0, 2], 0.0)
+
+        # With a mask, norms only cover entries present in both rows
+        masked = self.strategy.cosine_similarity_matrix(
+            np.array([[5.0, 1.0, 0.0], [5.0, 0.0, 3.0]]),
+            mask=np.array([[1.0, 1.0, 0.0], [1.0, 0.0, 1.0]])
+        )
+        np.testing.assert_allclose(masked[0, 1], 1.0, rtol=1e-6)
+
+    @patch('models.rating_model.RatingModel.find_by_user')
+    def test_filter_already_rated_small(self, mock_find_by_user):
+        """Test filtering against a small rating history."""
+        mock_find_by_user.return_value = _ratings_for([1, 3])
+
+        filtered = self.strategy.filter_already_rated(7, {1: 0.9, 2: 0.8, 3: 0.7, 4: 0.6})
+
+        self.assertEqual(filtered, {2: 0.8, 4: 0.6})
+        mock_find_by_user.assert_called_once_with(7)
+
+    @patch('models.rating_model.RatingModel.find_by_user')
+    def test_filter_already_rated_large(self, mock_find_by_user):
+        """Test filtering against a large rating history."""
+        rated = list(range(0, 8192, 2))
+        mock_find_by_user.return_value = _ratings_for(rated)
+
+        item_scores = {item_id: 1.0 for item_id in range(8192)}
+        filtered = self.strategy.filter_already_rated(7, item_scores)
+
+        # Exactly the unrated (odd) items must survive
+        self.assertEqual(set(filtered), set(range(1, 8192, 2)))
+
+    @patch('models.rating_model.RatingModel.find_by_user')
+    def test_filter_sees_new_ratings(self, mock_find_by_user):
+        """Test that a newly rated item is filtered on the next call."""
+        rated = list(range(4096))
+        mock_find_by_user.return_value = _ratings_for(rated)
+        new_item = 20000
+
+        self.assertIn(new_item, self.strategy.filter_already_rated(7, {new_item: 1.0}))
+
+        mock_find_by_user.return_value = _ratings_for(rated + [new_item])
+        self.assertEqual(self.strategy.filter_already_rated(7, {new_item: 1.0}), {})
+
+
+class TestSimilarityVector(QuietTestCase):
+    """Test cases for the vectorized item similarity of each strategy."""
+
+    def test_content_based_matches_pairwise(self):
+        """Test that the vectorized feature similarity matches get_similarity."""
+        strategy = ContentBasedFilteringStrategy()
+        strategy._item_features = {
+            1: np.array([1.0, 2.0, 0.0]),
+            2: np.array([2.0, 4.0, 0.0]),
+            3: np.array([0.0, 0.0, 0.0]),
+            4: np.array([-1.0, 1.0, 3.0]),
+            5: np.array([1.0, 1.0]),
+        }
+        strategy.is_trained = True
+        ids = np.array([2, 3, 4, 5, 6])
+
+        expected = [strategy.get_similarity(1, int(i)) for i in ids]
+        np.testing.assert_allclose(strategy.get_similarity_vector(1, ids), expected, rtol=1e-6)
+
+    @patch('strategies.content_based_filtering.SIMILARITY_MATRIX_MAX_ITEMS', 0)
+    def test_content_based_without_matrix(self):
+        """Test that large catalogs compute similarity rows from the normalized features."""
+        strategy = ContentBasedFilteringStrategy()
+        strategy._item_features = {
+            1: np.array([1.0, 2.0, 0.0]),
+            2: np.array([2.0, 4.0, 0.0]),
+            3: np.array([0.0, 0.0, 0.0]),
+            4: np.array([-1.0, 1.0, 3.0]),
+            5: np.array([1.0, 1.0]),
+        }
+        strategy.is_trained = True
+        ids = np.array([2, 3, 4, 5, 6])
+
+        self.assertIsNone(strategy.get_similarity_matrix())
+        expected = [strategy.get_similarity(1, int(i)) for i in ids]
+        np.testing.assert_allclose(strategy.get_similarity_vector(1, ids), expected, rtol=1e-6)
+
+    def test_content_based_similarity_matrix(self):
+        """Test that the cached similarity matrix matches the feature cosine similarity."""
+        strategy = ContentBasedFilteringStrategy()
+        features = {
+            1: np.array([1.0, 2.0, 0.0]),
+            2: np.array([2.0, 4.0, 1.0]),
+            3: np.array([0.0, 0.0, 0.0]),
+            4: np.array([1.0, 1.0]),
+        }
+        strategy._item_features = features
+        strategy.is_trained = True
+
+        item_index, similarity = strategy.get_similarity_matrix()
+        for id1, features1 in features.items():
+            for id2, features2 in features.items():
+                expected = (
+                    strategy._calculate_item_similarity(features1, features2)
+                    if features1.shape == features2.shape else 0.0
+                )
+                self.assertAlmostEqual(similarity[item_index[id1], item_index[id2]], expected, places=5)
+
+        # The matrix is built once and rebuilt after invalidation
+        self.assertIs(strategy.get_similarity_matrix()[1], similarity)
+        strategy.invalidate_similarity_matrix()
+        self.assertIsNot(strategy.get_similarity_matrix()[1], similarity)
+
+    def test_collaborative_matches_pairwise(self):
+        """Test that the vectorized rating similarity matches get_similarity."""
+        strategy = CollaborativeFilteringStrategy()
+        strategy.train(([1, 2, 3], [10, 20, 30], [
+            [5, 4, 0],
+            [3, 0, 1],
+            [0, 2, 5],
+        ]))
+        ids = np.array([20, 30, 40])
+
+        expected = [strategy.get_similarity(10, int(i)) for i in ids]
+        np.testing.assert_allclose(strategy.get_similarity_vector(10, ids), expected, rtol=1e-6)
+
+    def test_collaborative_vector_uses_trained_arrays(self):
+        """Test that similarity vectors are served from the arrays built in train()."""
+        strategy = CollaborativeFilteringStrategy()
+        strategy.train(([1, 2], [10, 20, 30], [[5, 4, 0], [3, 0, 1]]))
+        expected = [strategy.get_similarity(10, 20), strategy.get_similarity(10, 30)]
+        # Reason: the list-of-lists is no longer read once the model is trained
+        strategy._ratings_matrix = None
+
+        np.testing.assert_allclose(strategy.get_similarity_vector(10, np.array([20, 30])), expected, rtol=1e-6)
+
+    def test_collaborative_retrain_keeps_old_matrix(self):
+        """Test that retraining doesn't overwrite a similarity matrix still in use."""
+        strategy = CollaborativeFilteringStrategy()
+        strategy.train(([1, 2], [10, 20], [[5, 4], [4, 5]]))
+        before = strategy._user_similarity_matrix
+        snapshot = before.copy()
+
+        strategy.train(([1, 2], [10, 20], [[5, 0], [0, 5]]))
+
+        np.testing.assert_array_equal(before, snapshot)
+        self.assertIsNot(strategy._user_similarity_matrix, before)
+
+    def test_default_uses_pairwise(self):
+        """Test that strategies without a vectorized path fall back to get_similarity."""
+        strategy = DummyStrategy()
+        similarities = strategy.get_similarity_vector(1, np.array([2, 3]))
+        self.assertEqual(similarities.dtype, np.float32)
+        np.testing.assert_array_equal(similarities, [0.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DatabaseSchemaManager.
+
+This test suite validates how the table/column cache is loaded
+from the database.
+"""
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock
+
+# Add project root to path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import SCHEMA_CACHE_TTL
+from utils.schema_manager import DatabaseSchemaManager, get_schema_manager
+from helpers import QuietTestCase, mock_db
+
+
+class TestDatabaseSchemaManager(QuietTestCase):
+    """Test cases for DatabaseSchemaManager."""
+
+    def setUp(self):
+        """Set up test environment before each test case."""
+        super().setUp()
+
+        self.db, _ = mock_db()
+        self.start_patch('utils.schema_manager.DatabaseManager').return_value.client = self.db
+
+        self.manager = DatabaseSchemaManager()
+
+    def test_get_schema_manager_is_shared(self):
+        """Test that the accessor creates one shared manager on first use."""
+        with patch('utils.schema_manager._schema_manager', None):
+            manager = get_schema_manager()
+            self.assertIsInstance(manager, DatabaseSchemaManager)
+            self.assertIs(get_schema_manager(), manager)
+
+    def test_refresh_uses_rpc(self):
+        """Test that the schema is loaded with one RPC call."""
+        self.db.rpc.return_value.execute.return_value = MagicMock(data={
+            "users": ["id", "username"], "items": ["id", "name"]
+        })
+
+        tables = self.manager.refresh_schema_cache()
+
+        self.assertEqual(tables["users"], ["id", "username"])
+        self.db.rpc.assert_called_once_with("get_schema_columns")
+        self.db.table.assert_not_called()
+
+    def test_refresh_falls_back_to_columns_query(self):
+        """Test that the column rows are aggregated when the RPC is unavailable."""
+        self.db.rpc.return_value.execute.side_effect = Exception("function not found")
+        query = self.db.table.return_value
+        query.select.return_value = query
+        query.eq.return_value = query
+        query.execute.return_value = MagicMock(data=[
+            {"table_name": "users", "column_name": "id"},
+            {"table_name": "users", "column_name": "username"},
+            {"table_name": "items", "column_name": "id"},
+        ])
+
+        tables = self.manager.refresh_schema_cache()
+
+        self.assertEqual(tables, {"users": ["id", "username"], "items": ["id"]})
+        self.db.table.assert_called_once_with("information_schema.columns")
+
+    def test_missing_table_is_cached(self):
+        """Test that a missing table refreshes the schema once per TTL."""
+        self.db.rpc.return_value.execute.return_value = MagicMock(data={"users": ["id"]})
+
+        self.assertEqual(self.manager.get_table_columns("users"), ["id"])
+        self.assertEqual(self.manager.get_table_columns("users"), ["id"])
+        self.assertEqual(self.db.rpc.call_count, 1)
+
+        # The first lookup of an unknown table refreshes, later ones don't
+        self.assertEqual(self.manager.get_table_columns("userz"), [])
+        self.assertEqual(self.manager.get_table_columns("userz"), [])
+        self.assertEqual(self.db.rpc.call_count, 2)
+
+    @patch('utils.schema_manager.time.monotonic')
+    def test_cache_expires(self, mock_monotonic):
+        """Test that the schema is fetched again once the TTL has passed."""
+        self.db.rpc.return_value.execute.return_value = MagicMock(data={"users": ["id"]})
+        mock_monotonic.return_value = 1000.0
+        self.manager.get_table_columns("items")
+        self.manager.get_table_columns("items")
+        self.assertEqual(self.db.rpc.call_count, 1)
+
+        # After the TTL the table is looked up again, and now exists
+        self.db.rpc.return_value.execute.return_value = MagicMock(data={"users": ["id"], "items": ["id"]})
+        mock_monotonic.return_value = 1000.0 + SCHEMA_CACHE_TTL
+        self.assertEqual(self.manager.get_table_columns("items"), ["id"])
+        self.assertEqual(self.db.rpc.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -62,7 +62,67 @@ class TestUserModel(unittest.TestCase):
         # The password should be None after initialization
         # as it's transient and only used for hashing
         self.assertIsNone(user.password)
-    
+
+    def test_formatted_dates(self):
+        """Test the display strings for login and creation dates."""
+        from datetime import datetime
+
+        hashed_data = self.user_data.copy()
+        hashed_data['password_hash'] = 'existing_hash_value'
+        del hashed_data['password']
+        user = UserModel(**hashed_data, created_at=datetime(2025, 7, 22, 12, 30))
+
+        self.assertEqual(user.created_at_str, "2025-07-22")
+        self.assertEqual(user.last_login_str, "Never")
+
+        # Updating the field is reflected immediately
+        user.last_login = datetime(2025, 7, 23, 8, 5)
+        self.assertEqual(user.last_login_str, "2025-07-23 08:05")
+
+        # Display strings are not part of the serialized model
+        self.assertNotIn('last_login_str', user.model_dump())
+
+    @patch('models.base_model.BaseModel._get_db')
+    def test_is_admin(self, mock_get_db):
+        """Test that the admin flag is checked in the query."""
+        mock_query = MagicMock()
+        mock_query.select.return_value = mock_query
+        mock_query.eq.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_get_db.return_value.table.return_value = mock_query
+        
+        mock_query.execute.return_value = MagicMock(data=[{'id': 1}])
+        self.assertTrue(UserModel.is_admin(1))
+        mock_query.eq.assert_any_call("preferences->>is_admin", "true")
+        
+        mock_query.execute.return_value = MagicMock(data=[])
+        self.assertFalse(UserModel.is_admin(2))
+        
+        # No query is made when nobody is logged in
+        mock_get_db.reset_mock()
+        self.assertFalse(UserModel.is_admin(None))
+        mock_get_db.assert_not_called()
+
+    @patch('models.base_model.BaseModel._get_db')
+    def test_find_by_username_or_email(self, mock_get_db):
+        """Test that username and email are checked in one query."""
+        mock_query = MagicMock()
+        mock_query.select.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_get_db.return_value.table.return_value = mock_query
+        params = mock_query.params
+        mock_query.execute.return_value = MagicMock(data=[
+            {'id': 1, 'username': 'testuser', 'email': 'test@example.com'}
+        ])
+        
+        rows = UserModel.find_by_username_or_email('testuser', 'test@example.com')
+        
+        self.assertEqual(rows[0]['username'], 'testuser')
+        params.add.assert_called_once_with(
+            "or", '(username.eq."testuser",email.eq."test@example.com")'
+        )
+        mock_query.execute.assert_called_once()
+
     @patch('utils.auth.AuthenticationManager')
     def test_lazy_import_usage(self, mock_auth_manager):
         """Test that AuthenticationManager is lazily imported."""
@@ -2,29 +2,35 @@
 UI Package.
 
 This package contains the user interface components for the recommendation system.
+Submodules are imported lazily on first attribute access, so importing the package
+does not pull in Streamlit until a UI function is actually used.
 """
-from .components import (
-    show_header,
-    show_user_profile,
-    show_recommendation_card,
-    show_item_details,
-    show_sidebar_navigation,
-    show_filter_sidebar,
-    show_error,
-    show_success,
-    show_info
-)
-from .pages import (
-    show_home_page,
-    show_login_page,
-    show_register_page,
-    show_profile_page,
-    show_recommendations_page,
-    show_browse_items_page,
-    show_my_ratings_page,
-    show_admin_page,
-    show_item_detail_page
-)
+import importlib
+from typing import Any
+
+# Map each exported name to the submodule that defines it
+_EXPORTS = {
+    'show_header': 'components',
+    'show_user_profile': 'components',
+    'show_recommendation_card': 'components',
+    'show_item_details': 'components',
+    'show_sidebar_navigation': 'components',
+    'show_filter_sidebar': 'components',
+    'show_error': 'components',
+    'show_success': 'components',
+    'show_info': 'components',
+    'show_toast': 'components',
+    'show_home_page': 'pages',
+    'show_login_page': 'pages',
+    'show_register_page': 'pages',
+    'show_profile_page': 'pages',
+    'show_recommendations_page': 'pages',
+    'show_browse_items_page': 'pages',
+    'show_my_ratings_page': 'pages',
+    'show_admin_page': 'pages',
+    'show_item_detail_page': 'pages',
+    'flush_events': 'pages'
+}
 
 __all__ = [
     'show_header',
@@ -36,6 +42,7 @@ __all__ = [
     'show_error',
     'show_success',
     'show_info',
+    'show_toast',
     'show_home_page',
     'show_login_page',
     'show_register_page',
@@ -44,5 +51,34 @@ __all__ = [
     'show_browse_items_page',
     'show_my_ratings_page',
     'show_admin_page',
-    'show_item_detail_page'
+    'show_item_detail_page',
+    'flush_events'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve exported UI functions lazily (PEP 562).
+
+    Args:
+        name: The attribute being accessed
+
+    Returns:
+        The requested function from its submodule
+
+    Raises:
+        AttributeError: If the name is not exported by this package
+    """
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
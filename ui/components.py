@@ -3,15 +3,58 @@ UI Components Module.
 
 This module provides reusable UI components for the Streamlit interface.
 """
+import html
 import logging
+import string
+from functools import lru_cache
+import pandas as pd
 import streamlit as st
-from typing import Dict, Any, List, Callable, Optional
-from utils.config import THEME_COLOR, DEFAULT_AVATAR
-from models.user_model import UserModel
-from models.item_model import ItemModel
+from typing import Dict, Any, List, Callable, Optional, Tuple, TYPE_CHECKING
+from utils.config import THEME_COLOR
+
+# Models are only needed for type hints, so don't import them at runtime
+if TYPE_CHECKING:
+    from models.user_model import UserModel
+    from models.item_model import ItemModel
 
 logger = logging.getLogger(__name__)
 
+# Stylesheet for recommendation cards, injected once per script run by show_header
+_ITEM_CARD_CSS = """
+<style>
+.item-card {
+    padding: 1.5rem;
+    border-radius: 0.5rem;
+    background-color: white;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    margin-bottom: 1rem;
+}
+</style>
+"""
+
+# Card markup, filled with HTML-escaped item fields
+_CARD_FIELDS = ("name", "category", "description")
+_CARD_ROW_TMPL = string.Template("<p><b>$label:</b> $value</p>")
+
+# Card templates specialized on whether the item has a description
+_CARD_TMPLS = {
+    True: string.Template(
+        "<div class='item-card'><h3>$name</h3><p><b>Category:</b> $category</p>"
+        "<p><b>Description:</b> $description</p></div>"
+    ),
+    False: string.Template(
+        "<div class='item-card'><h3>$name</h3><p><b>Category:</b> $category</p></div>"
+    ),
+}
+
+# Attribute value types shown in item detail tables
+_SCALAR_TYPES = (int, float, str, bool)
+
+
+def _inject_card_css() -> None:
+    """Inject the recommendation card stylesheet into the page."""
+    st.html(_ITEM_CARD_CSS)
+
 
 def show_header(title: str, subtitle: Optional[str] = None) -> None:
     """
@@ -21,43 +64,65 @@ def show_header(title: str, subtitle: Optional[str] = None) -> None:
         title: The main title text
         subtitle: Optional subtitle text
     """
-    st.markdown(f"<h1 style='color:{THEME_COLOR}'>{title}</h1>", unsafe_allow_html=True)
+    # Every page starts with a header, so the shared card stylesheet ships with it
+    _inject_card_css()
     
-    if subtitle:
-        st.markdown(f"<h3>{subtitle}</h3>", unsafe_allow_html=True)
+    st.markdown(_header_html(title, subtitle), unsafe_allow_html=True)
     
     st.markdown("---")
 
 
-def show_user_profile(user: UserModel) -> None:
+@lru_cache(maxsize=64)
+def _header_html(title: str, subtitle: Optional[str]) -> str:
+    """
+    Build the header HTML for a title and optional subtitle.
+    
+    Args:
+        title: The main title text
+        subtitle: Optional subtitle text
+        
+    Returns:
+        The header markup, shared across reruns for the same arguments
+    """
+    header = f"<h1 style='color:{THEME_COLOR}'>{title}</h1>"
+    if subtitle:
+        header += f"<h3>{subtitle}</h3>"
+    return header
+
+
+def show_user_profile(user: "UserModel") -> None:
     """
     Display user profile information.
     
     Args:
         user: The user model to display
     """
+    # Build the profile text as one markdown block to render it in a single element
+    lines = []
+    
+    if user.first_name or user.last_name:
+        name = f"{user.first_name or ''} {user.last_name or ''}".strip()
+        lines.append(f"**Name:** {name}")
+        
+    lines.append(f"**Email:** {user.email}")
+    
+    if user.last_login:
+        lines.append(f"**Last Login:** {user.last_login_str}")
+    
+    lines.append(f"**Member Since:** {user.created_at_str}")
+    
+    # Without a profile image, skip the avatar column and show an inline icon instead
+    if not user.profile_image:
+        st.markdown("\n\n".join([f"### 👤 {user.username}"] + lines))
+        return
+    
     col1, col2 = st.columns([1, 3])
     
     with col1:
-        # Display user profile image if available, otherwise use default avatar
-        image_to_display = user.profile_image if user.profile_image else DEFAULT_AVATAR
-        st.image(image_to_display, width=100)
+        st.image(user.profile_image, width=100)
         
     with col2:
-        st.markdown(f"### {user.username}")
-        
-        if user.first_name or user.last_name:
-            name = f"{user.first_name or ''} {user.last_name or ''}".strip()
-            st.markdown(f"**Name:** {name}")
-            
-        st.markdown(f"**Email:** {user.email}")
-        
-        if user.last_login:
-            last_login_str = user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else "Never"
-            st.markdown(f"**Last Login:** {last_login_str}")
-        
-        created_at_str = user.created_at.strftime('%Y-%m-%d') if user.created_at else "Unknown"
-        st.markdown(f"**Member Since:** {created_at_str}")
+        st.markdown("\n\n".join([f"### {user.username}"] + lines))
 
 
 def show_recommendation_card(item: Dict[str, Any], 
@@ -66,69 +131,186 @@ def show_recommendation_card(item: Dict[str, Any],
     """
     Display a recommendation card for an item.
     
+    The card is rendered as a Streamlit fragment, so interacting with its widgets
+    reruns only this card rather than the whole page.
+    
     Args:
         item: Dictionary containing item details
         on_click: Optional callback when the item is clicked
         on_rate: Optional callback when the item is rated
     """
-    # Create a card with shadow and border
-    st.markdown("""
-    <style>
-    .item-card {
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        background-color: white;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        margin-bottom: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    _render_card(item, on_click, on_rate)
+
+
+@st.fragment
+def _render_card(item: Dict[str, Any],
+                 on_click: Optional[Callable] = None,
+                 on_rate: Optional[Callable] = None) -> None:
+    """
+    Render the body of a recommendation card.
     
+    Args:
+        item: Dictionary containing item details
+        on_click: Optional callback when the item is clicked
+        on_rate: Optional callback when the item is rated
+    """
+    # Reason: the shape is kept in a local rather than written back to the item,
+    # since items are shared with st.cache_data; it is three membership checks,
+    # and the same item can be shown with or without a score on different pages
+    has_description, has_score, has_type = _card_shape(item)
+    
+    # The card stylesheet is injected once per page by show_header
     with st.container():
-        st.markdown('<div class="item-card">', unsafe_allow_html=True)
-        
-        # Item name and category
-        st.markdown(f"### {item['name']}")
-        st.markdown(f"**Category:** {item['category']}")
-        
-        # Description (if available)
-        if item.get('description'):
-            st.markdown(f"**Description:** {item['description']}")
+        # Item name, category and description (if available) as a single HTML block,
+        # emitted with st.html since it needs no markdown processing
+        st.html(_card_html(item, has_description=has_description))
         
-        # Score and recommendation type
-        col1, col2 = st.columns(2)
+        # Score, recommendation type and interaction widgets share one row
+        col1, col2, col3, col4 = st.columns(4)
+        match_cell, type_cell = _META_CELLS[has_score, has_type]
         with col1:
-            if 'score_percent' in item:
-                st.markdown(f"**Match:** {item['score_percent']}")
-            elif 'score' in item:
-                st.markdown(f"**Match:** {item['score'] * 100:.1f}%")
+            match_cell(item)
         
         with col2:
-            if 'recommendation_type' in item:
-                st.markdown(f"**Type:** {item['recommendation_type'].title()}")
+            type_cell(item)
         
-        # Buttons for interaction
-        button_col1, button_col2 = st.columns(2)
-        
-        with button_col1:
+        with col3:
             if on_click and st.button("View Details", key=f"view_{item['item_id']}"):
                 on_click(item['item_id'])
         
-        with button_col2:
+        with col4:
             if on_rate:
-                rating = st.select_slider(
-                    "Rate this item",
-                    options=[1, 2, 3, 4, 5],
-                    value=3,
-                    key=f"rate_{item['item_id']}"
-                )
-                if st.button("Submit Rating", key=f"submit_{item['item_id']}"):
-                    on_rate(item['item_id'], rating)
+                _rating_widget(item['item_id'], on_rate, key=f"rate_{item['item_id']}")
+
+
+def _card_shape(item: Dict[str, Any]) -> Tuple[bool, bool, bool]:
+    """
+    Describe which optional parts a card for this item has.
+    
+    Args:
+        item: Dictionary containing item details
         
-        st.markdown('</div>', unsafe_allow_html=True)
+    Returns:
+        Tuple of (has description, has score, has recommendation type)
+    """
+    # Recommendations always expose score_percent (formatted when read); browsed items carry no score at all
+    return bool(item.get('description')), 'score_percent' in item, 'recommendation_type' in item
+
+
+def _match_cell(item: Dict[str, Any]) -> None:
+    """Display the match percentage of a recommendation."""
+    st.html(_CARD_ROW_TMPL.substitute(label="Match", value=html.escape(str(item['score_percent']))))
+
+
+def _type_cell(item: Dict[str, Any]) -> None:
+    """Display the strategy type of a recommendation."""
+    st.html(_CARD_ROW_TMPL.substitute(
+        label="Type", value=html.escape(str(item['recommendation_type']).title())
+    ))
+
+
+def _empty_cell(item: Dict[str, Any]) -> None:
+    """Leave a card cell empty."""
+
 
+# Cell renderers for the (match, type) columns, keyed by (has score, has type)
+_META_CELLS = {
+    (True, True): (_match_cell, _type_cell),
+    (True, False): (_match_cell, _empty_cell),
+    (False, True): (_empty_cell, _type_cell),
+    (False, False): (_empty_cell, _empty_cell),
+}
 
-def show_item_details(item: ItemModel) -> None:
+
+def _card_html(item: Dict[str, Any], has_description: Optional[bool] = None) -> str:
+    """
+    Build the HTML for the text part of a recommendation card.
+    
+    Args:
+        item: Dictionary containing item details
+        has_description: Whether the item has a description, if already known
+        
+    Returns:
+        The card HTML with all item fields escaped
+    """
+    if has_description is None:
+        has_description = bool(item.get('description'))
+    
+    values = tuple(str(item.get(field) or "") for field in _CARD_FIELDS)
+    return _card_html_for(values, has_description)
+
+
+@lru_cache(maxsize=256)
+def _card_html_for(values: Tuple[str, ...], has_description: bool) -> str:
+    """
+    Build card HTML from the raw card field values.
+    
+    Cached, so reruns showing the same items reuse the escaped HTML.
+    
+    Args:
+        values: The item's values for each of _CARD_FIELDS
+        has_description: Whether the item has a description
+        
+    Returns:
+        The card HTML with all item fields escaped
+    """
+    # Escape all user-controlled fields in one place
+    safe = {field: html.escape(value) for field, value in zip(_CARD_FIELDS, values)}
+    return _CARD_TMPLS[has_description].substitute(safe)
+
+
+def _rating_widget(item_id: int, on_rate: Callable, key: str) -> None:
+    """
+    Display a star rating widget that calls on_rate when a new rating is picked.
+    
+    Args:
+        item_id: The ID of the item being rated
+        on_rate: Callback receiving the item ID and a 1-5 rating
+        key: Widget key
+    """
+    # Star feedback returns a 0-based index, or None until the user picks a value
+    rating = st.feedback("stars", key=key)
+    submitted_key = f"{key}_submitted"
+    # Reason: The widget keeps its value across reruns, so only submit when it changes
+    if rating is not None and st.session_state.get(submitted_key) != rating:
+        st.session_state[submitted_key] = rating
+        on_rate(item_id, rating + 1)
+
+
+@st.cache_data
+def _attributes_df(item_id: int, attributes: tuple, label: str) -> pd.DataFrame:
+    """
+    Build a two-column table of an item's scalar attributes.
+    
+    Cached per item so reruns on the same item page skip rebuilding it.
+    
+    Args:
+        item_id: The ID of the item the attributes belong to
+        attributes: Sorted tuple of scalar (name, value) pairs
+        label: Header for the attribute name column
+        
+    Returns:
+        DataFrame with the attribute name and value columns
+    """
+    return pd.DataFrame([(key, str(value)) for key, value in attributes], columns=[label, "Value"])
+
+
+def _scalar_items(attributes: Dict[str, Any]) -> tuple:
+    """
+    Select the scalar entries of an attribute dictionary.
+    
+    Args:
+        attributes: Item features or metadata
+        
+    Returns:
+        Sorted tuple of (name, value) pairs whose values are scalars
+    """
+    return tuple(sorted(
+        (key, value) for key, value in attributes.items() if isinstance(value, _SCALAR_TYPES)
+    ))
+
+
+def show_item_details(item: "ItemModel") -> None:
     """
     Display detailed information about an item.
     
@@ -146,13 +328,10 @@ def show_item_details(item: ItemModel) -> None:
     
     # Display features as a table
     if item.features:
-        feature_data = []
-        for key, value in item.features.items():
-            if isinstance(value, (int, float, str, bool)):
-                feature_data.append({"Feature": key, "Value": value})
+        feature_df = _attributes_df(item.id, _scalar_items(item.features), "Feature")
         
-        if feature_data:
-            st.table(feature_data)
+        if not feature_df.empty:
+            st.dataframe(feature_df, hide_index=True, use_container_width=True)
         else:
             st.markdown("No feature details available")
     else:
@@ -162,32 +341,29 @@ def show_item_details(item: ItemModel) -> None:
     if item.metadata:
         st.markdown("### Additional Information")
         
-        meta_data = []
-        for key, value in item.metadata.items():
-            if isinstance(value, (int, float, str, bool)):
-                meta_data.append({"Attribute": key, "Value": value})
+        meta_df = _attributes_df(item.id, _scalar_items(item.metadata), "Attribute")
         
-        if meta_data:
-            st.table(meta_data)
+        if not meta_df.empty:
+            st.dataframe(meta_df, hide_index=True, use_container_width=True)
 
 
-def show_sidebar_navigation(user: Optional[UserModel] = None) -> str:
+@lru_cache(maxsize=4)
+def _build_pages(is_logged_in: bool, is_admin: bool) -> tuple:
     """
-    Display sidebar navigation menu.
+    Build the navigation page list for a kind of user.
     
     Args:
-        user: Optional user model for personalized navigation
+        is_logged_in: Whether a user is logged in
+        is_admin: Whether the user has admin privileges
         
     Returns:
-        The selected navigation page
+        Tuple of page names, shared across reruns
     """
-    st.sidebar.markdown(f"## Navigation")
-    
     # Default pages
     pages = ["Home"]
     
     # Pages available when logged in
-    if user:
+    if is_logged_in:
         pages.extend([
             "Recommendations", 
             "Browse Items", 
@@ -198,17 +374,39 @@ def show_sidebar_navigation(user: Optional[UserModel] = None) -> str:
         pages.extend(["Login", "Register"])
     
     # Add admin pages if user has admin privileges
-    if user and user.preferences.get("is_admin", False):
+    if is_admin:
         pages.append("Admin")
     
+    return tuple(pages)
+
+
+def _logout() -> None:
+    """Log the current user out by clearing their session."""
+    st.session_state.pop("user_id", None)
+    st.session_state.pop("user_obj", None)
+    st.session_state.pop("_is_admin", None)
+
+
+def show_sidebar_navigation(user: Optional["UserModel"] = None) -> str:
+    """
+    Display sidebar navigation menu.
+    
+    Args:
+        user: Optional user model for personalized navigation
+        
+    Returns:
+        The selected navigation page
+    """
+    st.sidebar.markdown(f"## Navigation")
+    
+    pages = _build_pages(user is not None, bool(user and user.preferences.get("is_admin", False)))
+    
     # Create a radio button for page selection
     selected_page = st.sidebar.radio("Go to", pages)
     
-    # Show logout button if logged in
+    # Show logout button if logged in; the callback runs before the rerun it triggers
     if user:
-        if st.sidebar.button("Logout"):
-            st.session_state.pop("user_id", None)
-            st.rerun()
+        st.sidebar.button("Logout", on_click=_logout)
     
     return selected_page
 
@@ -287,6 +485,20 @@ def show_success(message: str) -> None:
     st.success(message)
 
 
+def show_toast(message: str, icon: Optional[str] = None) -> None:
+    """
+    Display a transient notification that disappears on its own.
+    
+    Prefer this over show_success/show_info for confirmations that don't need
+    to stay on the page.
+    
+    Args:
+        message: The message to display
+        icon: Optional emoji shown next to the message
+    """
+    st.toast(message, icon=icon)
+
+
 def show_info(message: str) -> None:
     """
     Display an info message.
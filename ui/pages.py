@@ -3,9 +3,18 @@ UI Pages Module.
 
 This module provides page handlers for the Streamlit interface.
 """
+import base64
+import io
+import json
 import logging
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import pandas as pd
 import streamlit as st
-from typing import Dict, Any, List, Optional
+from PIL import Image
+from typing import Dict, Any, Final, List, Mapping, Optional, Tuple
 from models.user_model import UserModel
 from models.item_model import ItemModel
 from models.rating_model import RatingModel
@@ -15,11 +24,213 @@ from utils.observer import UserActivityObserver
 from utils.config import APP_TITLE, APP_DESCRIPTION, AVAILABLE_STRATEGIES
 from .components import (
     show_header, show_user_profile, show_recommendation_card,
-    show_item_details, show_filter_sidebar, show_error, show_success, show_info
+    show_item_details, show_filter_sidebar, show_error, show_info, show_toast
 )
 
 logger = logging.getLogger(__name__)
 
+# Largest width/height a stored profile image is scaled down to
+_PROFILE_IMAGE_SIZE = (512, 512)
+
+# Strategy keys in display order and each key's position in that order
+_STRATEGY_KEYS = tuple(AVAILABLE_STRATEGIES)
+_STRATEGY_INDEX = {key: i for i, key in enumerate(_STRATEGY_KEYS)}
+
+# Read-only descriptions of each strategy type
+_STRATEGY_DESCRIPTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "collaborative": "Recommends items based on what similar users have liked",
+    "content-based": "Recommends items with features similar to what you've liked in the past",
+    "hybrid": "Combines multiple strategies for more balanced recommendations"
+})
+
+# Row counts offered for paged admin tables
+_PAGE_SIZES = (25, 50, 100)
+
+# Most activity events kept per session between observer flushes
+_EVENT_BUFFER_SIZE = 64
+
+# Shared worker threads for updates the user doesn't need to wait for
+_BACKGROUND = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+
+def _enqueue_event(event_type: str, data: Dict[str, Any]) -> None:
+    """
+    Buffer an activity event for the observer.
+    
+    Events are handed to the observer in one batch by ``flush_events``.
+    
+    Args:
+        event_type: The type of event that occurred
+        data: Additional data about the event
+    """
+    # Reason: bounded so a session that never flushes can't grow without limit
+    buffer = st.session_state.setdefault("_event_buffer", deque(maxlen=_EVENT_BUFFER_SIZE))
+    buffer.append((event_type, data))
+
+
+def flush_events() -> None:
+    """Hand all buffered activity events to the activity observer at once."""
+    buffer = st.session_state.get("_event_buffer")
+    observer = st.session_state.get("activity_observer")
+    if not buffer or observer is None:
+        return
+    
+    events = list(buffer)
+    buffer.clear()
+    observer.update_many(None, events)
+
+
+def _rate_item(user_id: int, item_id: int, value: int, engine: RecommendationEngine) -> None:
+    """
+    Save a user's rating for an item and refresh everything that depends on it.
+    
+    Args:
+        user_id: The ID of the rating user
+        item_id: The ID of the rated item
+        value: The rating value between 1 and 5
+        engine: The recommendation engine instance
+    """
+    # Create or update rating
+    RatingModel.upsert(user_id, item_id, value)
+    
+    # Notify observers of rating event
+    _enqueue_event("rating_created", {
+        "user_id": user_id,
+        "item_id": item_id,
+        "rating_value": value
+    })
+    
+    # Update item popularity
+    _update_popularity_in_background(engine, item_id)
+    _load_counts_cached.clear()
+    _cached_explanation.clear()
+    
+    # New ratings change the recommendations
+    _get_recs.clear()
+    
+    show_toast(f"Rating saved: {value}/5", "✅")
+
+
+def _update_popularity_in_background(engine: RecommendationEngine, item_id: int) -> None:
+    """
+    Recompute an item's popularity without blocking the current run.
+    
+    Args:
+        engine: The recommendation engine instance
+        item_id: The ID of the rated item
+    """
+    _BACKGROUND.submit(_update_popularity, engine, item_id)
+
+
+def _update_popularity(engine: RecommendationEngine, item_id: int) -> None:
+    """
+    Recompute an item's popularity and drop the item listings that show it.
+    
+    Args:
+        engine: The recommendation engine instance
+        item_id: The ID of the rated item
+    """
+    try:
+        engine.update_item_popularity(item_id)
+        # Reason: cleared after the update, otherwise a rerun racing the
+        # worker could cache the old score again
+        _search_items_cached.clear()
+        _load_item_summaries_cached.clear()
+    except Exception as e:
+        logger.error(f"Error updating popularity for item {item_id}: {str(e)}")
+
+
+def _encode_profile_image(image_bytes: bytes) -> str:
+    """
+    Downscale an uploaded profile image and encode it as base64.
+    
+    Args:
+        image_bytes: The raw uploaded image
+        
+    Returns:
+        The base64 encoded image
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        # Reason: only the avatar size is ever displayed, so shrinking large
+        # uploads first keeps both the encoding and the stored row small
+        if image.width > _PROFILE_IMAGE_SIZE[0] or image.height > _PROFILE_IMAGE_SIZE[1]:
+            image_format = image.format
+            image.thumbnail(_PROFILE_IMAGE_SIZE)
+            buffer = io.BytesIO()
+            image.save(buffer, format=image_format)
+            image_bytes = buffer.getvalue()
+    
+    return base64.b64encode(image_bytes).decode()
+
+
+@st.cache_data(ttl=60)
+def _search_items_cached(category: Optional[str], query: Optional[str]) -> Tuple[ItemModel, ...]:
+    """
+    Search items by category and name/description.
+    
+    Call ``_search_items_cached.clear()`` after changing items.
+    
+    Args:
+        category: The category to filter by, or None for all categories
+        query: Search text, or None to skip text matching
+        
+    Returns:
+        Matching items
+    """
+    return tuple(ItemModel.search(category, query))
+
+
+@st.cache_data(ttl=60)
+def _load_categories_cached() -> Tuple[str, ...]:
+    """
+    Load the sorted distinct categories of active items.
+    
+    Returns:
+        Sorted unique categories
+    """
+    return tuple(ItemModel.distinct_categories())
+
+
+@st.cache_data(ttl=60)
+def _load_item_summaries_cached(offset: int, limit: int) -> Tuple[Tuple[int, str, str, float, bool], ...]:
+    """
+    Load one page of item summary rows for the admin dashboard.
+    
+    Args:
+        offset: The number of items to skip
+        limit: The page size
+        
+    Returns:
+        (id, name, category, popularity_score, is_active) tuples
+    """
+    return tuple(ItemModel.summary_rows(offset, limit))
+
+
+@st.cache_data(ttl=60)
+def _load_users_page_cached(offset: int, limit: int) -> Tuple[UserModel, ...]:
+    """
+    Load one page of users for the admin dashboard.
+    
+    Args:
+        offset: The number of users to skip
+        limit: The page size
+        
+    Returns:
+        The users on the page
+    """
+    return tuple(UserModel.page(offset, limit))
+
+
+@st.cache_data(ttl=30)
+def _load_counts_cached() -> Tuple[int, int, int]:
+    """
+    Count users, items and ratings for the admin dashboard.
+    
+    Returns:
+        A tuple of (user count, item count, rating count)
+    """
+    return UserModel.count(), ItemModel.count(), RatingModel.count()
+
 
 def show_home_page() -> None:
     """Display the home page."""
@@ -40,8 +251,7 @@ def show_home_page() -> None:
     """)
     
     # Display available strategies
-    for strategy_key, strategy_name in AVAILABLE_STRATEGIES.items():
-        st.markdown(f"* **{strategy_name}**: {_get_strategy_description(strategy_key)}")
+    st.markdown(_strategy_list_markdown())
     
     # Show call to action
     if "user_id" not in st.session_state:
@@ -74,16 +284,15 @@ def show_login_page() -> None:
                 success, message, user = AuthenticationManager.login_user(username_email, password)
                 
                 if success and user:
-                    # Store user ID in session state
+                    # Store user in session state
                     st.session_state["user_id"] = user.id
+                    st.session_state["user_obj"] = user
                     
                     # Notify observers of login event
-                    if "activity_observer" in st.session_state:
-                        observer = st.session_state["activity_observer"]
-                        observer.update(None, "user_login", {"user_id": user.id})
+                    _enqueue_event("user_login", {"user_id": user.id})
                     
                     # Redirect to recommendations page
-                    show_success(message)
+                    show_toast(message, "✅")
                     st.session_state["page"] = "Recommendations"
                     st.rerun()
                 else:
@@ -125,16 +334,17 @@ def show_register_page() -> None:
                 )
                 
                 if success and user:
-                    # Store user ID in session state
+                    # Store user in session state
                     st.session_state["user_id"] = user.id
+                    st.session_state["user_obj"] = user
+                    _load_users_page_cached.clear()
+                    _load_counts_cached.clear()
                     
                     # Notify observers of registration event
-                    if "activity_observer" in st.session_state:
-                        observer = st.session_state["activity_observer"]
-                        observer.update(None, "user_registered", {"user_id": user.id})
+                    _enqueue_event("user_registered", {"user_id": user.id})
                     
                     # Redirect to recommendations page
-                    show_success(message)
+                    show_toast(message, "✅")
                     st.session_state["page"] = "Recommendations"
                     st.rerun()
                 else:
@@ -170,12 +380,8 @@ def show_profile_page(user: UserModel) -> None:
         if st.form_submit_button("Upload Image"):
             if uploaded_image is not None:
                 try:
-                    # Read image as bytes
-                    image_bytes = uploaded_image.read()
-                    
-                    # Convert to base64 for storage
-                    import base64
-                    encoded_image = base64.b64encode(image_bytes).decode()
+                    # Downscale and convert to base64 for storage
+                    encoded_image = _encode_profile_image(uploaded_image.getvalue())
                     
                     # Update user model with profile image data using the OOP method
                     image_data = f"data:image/{uploaded_image.type.split('/')[-1]};base64,{encoded_image}"
@@ -186,7 +392,7 @@ def show_profile_page(user: UserModel) -> None:
                     
                     # Log the update
                     logger.info(f"Updated profile image for user {user.id}")
-                    show_success("Profile image updated successfully")
+                    show_toast("Profile image updated successfully", "✅")
                 except Exception as e:
                     logger.error(f"Error uploading profile image: {str(e)}")
                     show_error(f"Failed to upload image: {str(e)}")
@@ -211,11 +417,9 @@ def show_profile_page(user: UserModel) -> None:
         # Preferred recommendation strategy
         preferred_strategy = st.selectbox(
             "Preferred Recommendation Strategy",
-            list(AVAILABLE_STRATEGIES.keys()),
-            format_func=lambda x: AVAILABLE_STRATEGIES[x],
-            index=list(AVAILABLE_STRATEGIES.keys()).index(
-                preferences.get("preferred_strategy", "hybrid")
-            )
+            _STRATEGY_KEYS,
+            format_func=AVAILABLE_STRATEGIES.__getitem__,
+            index=_STRATEGY_INDEX.get(preferences.get("preferred_strategy", "hybrid"), 0)
         )
         
         # Save preferences
@@ -230,7 +434,7 @@ def show_profile_page(user: UserModel) -> None:
             # Save to database
             user.update_preferences(updated_preferences)
             
-            show_success("Preferences saved")
+            show_toast("Preferences saved", "✅")
     
     # Account settings
     st.markdown("### Account Settings")
@@ -255,7 +459,7 @@ def show_profile_page(user: UserModel) -> None:
                     user.password_hash = new_hash
                     user.save()
                     
-                    show_success("Password changed successfully")
+                    show_toast("Password changed successfully", "✅")
                 else:
                     show_error("Current password is incorrect")
 
@@ -271,31 +475,22 @@ def show_recommendations_page(user: UserModel, engine: RecommendationEngine) ->
     show_header("Your Recommendations", f"Personalized for {user.username}")
     
     # Get all categories
-    categories = [item.category for item in ItemModel.find_all()]
-    unique_categories = list(set(categories))
+    unique_categories = _load_categories_cached()
     
     # Show filters in sidebar
-    filters = show_filter_sidebar(unique_categories)
+    filters = show_filter_sidebar(list(unique_categories))
     
     # Show a loading message while generating recommendations
     with st.spinner("Generating personalized recommendations..."):
         try:
-            # Check if we should use diverse recommendations
-            if filters.get("diversity", 0) > 0:
-                recommendations = engine.get_diverse_recommendations(
-                    user.id,
-                    n=filters.get("count", 10),
-                    strategy_type=filters.get("strategy", "hybrid"),
-                    diversity_factor=filters.get("diversity", 0.3)
-                )
-            else:
-                # Use regular recommendations
-                recommendations = engine.recommend(
-                    user.id,
-                    n=filters.get("count", 10),
-                    strategy_type=filters.get("strategy", "hybrid"),
-                    filters={"category": filters.get("category")} if "category" in filters else None
-                )
+            recommendations = _get_recs(
+                engine,
+                user.id,
+                filters.get("count", 10),
+                filters.get("strategy", "hybrid"),
+                filters.get("diversity", 0),
+                tuple(filters["category"]) if "category" in filters else None
+            )
             
             if not recommendations:
                 show_info("No recommendations found. Try adjusting your filters or rating more items.")
@@ -308,43 +503,14 @@ def show_recommendations_page(user: UserModel, engine: RecommendationEngine) ->
                     st.session_state["page"] = "ItemDetail"
                     
                     # Notify observers of recommendation click
-                    if "activity_observer" in st.session_state:
-                        observer = st.session_state["activity_observer"]
-                        observer.update(None, "recommendation_clicked", {
-                            "user_id": user.id,
-                            "item_id": item_id
-                        })
+                    _enqueue_event("recommendation_clicked", {
+                        "user_id": user.id,
+                        "item_id": item_id
+                    })
                     
                     st.rerun()
                 
-                def rate_item(item_id, rating_value):
-                    # Create or update rating
-                    rating = RatingModel.find_by_user_and_item(user.id, item_id)
-                    
-                    if rating:
-                        rating.value = rating_value
-                        rating.save()
-                    else:
-                        rating = RatingModel(
-                            user_id=user.id,
-                            item_id=item_id,
-                            value=rating_value
-                        )
-                        rating.save()
-                    
-                    # Notify observers of rating event
-                    if "activity_observer" in st.session_state:
-                        observer = st.session_state["activity_observer"]
-                        observer.update(None, "rating_created", {
-                            "user_id": user.id,
-                            "item_id": item_id,
-                            "rating_value": rating_value
-                        })
-                    
-                    # Update item popularity
-                    engine.update_item_popularity(item_id)
-                    
-                    show_success(f"Rating saved: {rating_value}/5")
+                rate_item = partial(_rate_item, user.id, engine=engine)
                 
                 # Display recommendations
                 for rec in recommendations:
@@ -355,38 +521,77 @@ def show_recommendations_page(user: UserModel, engine: RecommendationEngine) ->
             show_error(f"Error: {str(e)}")
 
 
-def show_browse_items_page(user: UserModel) -> None:
+@st.cache_data(ttl=120, show_spinner=False)
+def _get_recs(
+    _engine: RecommendationEngine,
+    user_id: int,
+    count: int,
+    strategy: str,
+    diversity: float,
+    categories: Optional[Tuple[str, ...]]
+) -> List[Dict[str, Any]]:
+    """
+    Generate recommendations for a user, cached per set of filter values.
+    
+    Call ``_get_recs.clear()`` after saving a rating.
+    
+    Args:
+        _engine: The recommendation engine instance (not hashed)
+        user_id: The ID of the user
+        count: The number of recommendations
+        strategy: The recommendation strategy type
+        diversity: The diversity factor, 0 for regular recommendations
+        categories: The categories to filter by, or None for all categories
+        
+    Returns:
+        A list of dictionaries containing recommended item details
+    """
+    # Check if we should use diverse recommendations
+    if diversity > 0:
+        return _engine.get_diverse_recommendations(
+            user_id,
+            n=count,
+            strategy_type=strategy,
+            diversity_factor=diversity
+        )
+    
+    # Use regular recommendations
+    return _engine.recommend(
+        user_id,
+        n=count,
+        strategy_type=strategy,
+        filters={"category": categories} if categories is not None else None
+    )
+
+
+def show_browse_items_page(user: UserModel, engine: RecommendationEngine) -> None:
     """
     Display the browse items page.
     
     Args:
         user: The current user
+        engine: The recommendation engine instance
     """
     show_header("Browse Items", "Explore our catalog")
     
-    # Get all categories
-    categories = [item.category for item in ItemModel.find_all()]
-    unique_categories = list(set(categories))
+    # Get categories
+    unique_categories = _load_categories_cached()
     
     # Category filter
-    selected_category = st.selectbox("Filter by Category", ["All"] + unique_categories)
+    selected_category = st.selectbox("Filter by Category", ("All",) + unique_categories)
     
     # Search bar
     search_query = st.text_input("Search Items")
     
-    # Get items based on filters
-    if selected_category != "All":
-        items = ItemModel.find_by_category(selected_category)
-    else:
-        items = ItemModel.find_all()
-    
-    # Filter by search query if provided
-    if search_query:
-        items = [
-            item for item in items
-            if search_query.lower() in item.name.lower() or 
-               (item.description and search_query.lower() in item.description.lower())
-        ]
+    # Reason: the match is case-insensitive, so normalizing the query once
+    # lets "Dune" and "dune " share a single cached search
+    normalized_query = " ".join(search_query.lower().split())
+    
+    # Get items matching both filters in a single query
+    items = _search_items_cached(
+        selected_category if selected_category != "All" else None,
+        normalized_query or None
+    )
     
     # Display items
     if not items:
@@ -400,31 +605,7 @@ def show_browse_items_page(user: UserModel) -> None:
             st.session_state["page"] = "ItemDetail"
             st.rerun()
         
-        def rate_item(item_id, rating_value):
-            # Create or update rating
-            rating = RatingModel.find_by_user_and_item(user.id, item_id)
-            
-            if rating:
-                rating.value = rating_value
-                rating.save()
-            else:
-                rating = RatingModel(
-                    user_id=user.id,
-                    item_id=item_id,
-                    value=rating_value
-                )
-                rating.save()
-            
-            # Notify observers of rating event
-            if "activity_observer" in st.session_state:
-                observer = st.session_state["activity_observer"]
-                observer.update(None, "rating_created", {
-                    "user_id": user.id,
-                    "item_id": item_id,
-                    "rating_value": rating_value
-                })
-            
-            show_success(f"Rating saved: {rating_value}/5")
+        rate_item = partial(_rate_item, user.id, engine=engine)
         
         # Display items in a grid layout
         cols = st.columns(2)
@@ -456,23 +637,29 @@ def show_my_ratings_page(user: UserModel) -> None:
     else:
         st.markdown(f"### You have rated {len(ratings)} items")
         
+        # Load all rated items in one query
+        items_by_id = ItemModel.find_by_ids([rating.item_id for rating in ratings])
+        
+        # Use created_at for the initial rating date, updated_at would show the last time the rating was modified
+        dates_rated = [
+            rating.created_at.strftime("%Y-%m-%d") if rating.created_at else "N/A"
+            for rating in ratings
+        ]
+        
         # Create table data
-        table_data = []
-        for rating in ratings:
-            item = ItemModel.find_by_id(rating.item_id)
-            if item:
-                # Use created_at for the initial rating date, updated_at would show the last time the rating was modified
-                date_rated = rating.created_at.strftime("%Y-%m-%d") if rating.created_at else "N/A"
-                
-                table_data.append({
-                    "Item": item.name,
-                    "Category": item.category,
-                    "Your Rating": f"{rating.value}/5",
-                    "Date Rated": date_rated
-                })
+        table_data = [
+            {
+                "Item": items_by_id[rating.item_id].name,
+                "Category": items_by_id[rating.item_id].category,
+                "Your Rating": f"{rating.value}/5",
+                "Date Rated": date_rated
+            }
+            for rating, date_rated in zip(ratings, dates_rated)
+            if rating.item_id in items_by_id
+        ]
         
         # Display as a table
-        st.table(table_data)
+        st.dataframe(pd.DataFrame.from_records(table_data), use_container_width=True, hide_index=True)
         
         # Option to delete ratings
         if st.button("Clear All Ratings"):
@@ -480,18 +667,45 @@ def show_my_ratings_page(user: UserModel) -> None:
             if st.button("Yes, Delete All Ratings", key="confirm_delete"):
                 for rating in ratings:
                     rating.delete()
+                _load_counts_cached.clear()
                 
-                show_success("All ratings deleted")
+                show_toast("All ratings deleted", "✅")
                 st.rerun()
 
 
+def _pager(key: str, total: int) -> Tuple[int, int]:
+    """
+    Display page size and page number inputs for a long table.
+    
+    Args:
+        key: Widget key prefix, unique per table
+        total: The total number of rows
+        
+    Returns:
+        The (offset, limit) of the selected page
+    """
+    col1, col2 = st.columns(2)
+    with col1:
+        limit = st.selectbox("Page size", _PAGE_SIZES, key=f"{key}_page_size")
+    max_pages = max(1, -(-total // limit))
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=max_pages, value=1, step=1, key=f"{key}_page")
+    
+    st.caption(f"{total} rows, page {page} of {max_pages}")
+    return (int(page) - 1) * limit, limit
+
+
 def show_admin_page() -> None:
     """Display the admin page."""
     show_header("Admin Dashboard", "System Management")
     
-    # Check if user has admin privileges
-    user = UserModel.find_by_id(st.session_state.get("user_id"))
-    if not user or not user.preferences.get("is_admin", False):
+    # Check if user has admin privileges, once per logged in user
+    user_id = st.session_state.get("user_id")
+    cached = st.session_state.get("_is_admin")
+    if cached is None or cached[0] != user_id:
+        cached = st.session_state["_is_admin"] = (user_id, UserModel.is_admin(user_id))
+    
+    if not cached[1]:
         show_error("You do not have permission to access this page")
         return
     
@@ -500,37 +714,38 @@ def show_admin_page() -> None:
     
     with tab1:
         st.markdown("### User Management")
-        users = UserModel.find_all()
+        user_count, item_count, _ = _load_counts_cached()
+        users = _load_users_page_cached(*_pager("users", user_count))
         
         # Create table data
-        user_data = []
-        for user in users:
-            user_data.append({
+        user_data = [
+            {
                 "ID": user.id,
                 "Username": user.username,
                 "Email": user.email,
-                "Created": user.created_at.strftime("%Y-%m-%d"),
-                "Last Login": user.last_login.strftime("%Y-%m-%d %H:%M") if user.last_login else "Never"
-            })
+                "Created": user.created_at_str,
+                "Last Login": user.last_login_str
+            }
+            for user in users
+        ]
         
-        st.table(user_data)
+        st.dataframe(pd.DataFrame.from_records(user_data), use_container_width=True, hide_index=True)
     
     with tab2:
         st.markdown("### Item Management")
-        items = ItemModel.find_all()
         
-        # Create table data
-        item_data = []
-        for item in items:
-            item_data.append({
-                "ID": item.id,
-                "Name": item.name,
-                "Category": item.category,
-                "Popularity": f"{item.popularity:.2f}",
-                "Active": "Yes" if item.active else "No"
-            })
-        
-        st.table(item_data)
+        # Build the table straight from the summary tuples
+        item_data = pd.DataFrame.from_records(
+            _load_item_summaries_cached(*_pager("items", item_count)),
+            columns=["ID", "Name", "Category", "Popularity", "Active"]
+        )
+        
+        st.dataframe(
+            item_data,
+            use_container_width=True,
+            hide_index=True,
+            column_config={"Popularity": st.column_config.NumberColumn(format="%.2f")}
+        )
         
         # Add new item form
         st.markdown("### Add New Item")
@@ -551,7 +766,6 @@ def show_admin_page() -> None:
                     
                     # Parse features if provided
                     if features_json:
-                        import json
                         try:
                             features = json.loads(features_json)
                             item.features = features
@@ -561,7 +775,13 @@ def show_admin_page() -> None:
                     # Save to database
                     item.save()
                     
-                    show_success("Item added successfully")
+                    # Reload the item list and categories on the next render
+                    _search_items_cached.clear()
+                    _load_categories_cached.clear()
+                    _load_item_summaries_cached.clear()
+                    _load_counts_cached.clear()
+                    
+                    show_toast("Item added successfully", "✅")
                 except Exception as e:
                     show_error(f"Error adding item: {str(e)}")
     
@@ -569,9 +789,7 @@ def show_admin_page() -> None:
         st.markdown("### System Statistics")
         
         # Count entities
-        user_count = len(UserModel.find_all())
-        item_count = len(ItemModel.find_all())
-        rating_count = len(RatingModel.find_all())
+        user_count, item_count, rating_count = _load_counts_cached()
         
         # Display counts
         col1, col2, col3 = st.columns(3)
@@ -581,6 +799,7 @@ def show_admin_page() -> None:
         
         # Display activity counts if observer exists
         if "activity_observer" in st.session_state:
+            flush_events()
             observer = st.session_state["activity_observer"]
             
             st.markdown("### Recent Activity")
@@ -616,7 +835,64 @@ def show_item_detail_page(item_id: int, user: UserModel, engine: RecommendationE
     # Item details
     show_item_details(item)
     
-    # User rating for this item
+    # Reason: each section is a fragment, so dragging the rating slider only
+    # reruns the rating section instead of the explanation and similar items
+    _rating_fragment(item_id, user, engine)
+    
+    # Recommendation explanation
+    st.markdown("### Why was this recommended to you?")
+    
+    try:
+        st.write(_cached_explanation(engine, user.id, item_id))
+    except Exception as e:
+        logger.error(f"Error getting recommendation explanation: {str(e)}")
+        st.write("No explanation available for this item")
+    
+    _similar_items_fragment(item_id, engine)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_explanation(_engine: RecommendationEngine, user_id: int, item_id: int) -> str:
+    """
+    Get the recommendation explanation for a user and item.
+    
+    Args:
+        _engine: The recommendation engine instance (not hashed)
+        user_id: The ID of the user
+        item_id: The ID of the item
+        
+    Returns:
+        The explanation text
+    """
+    return _engine.explain_recommendation(user_id, item_id)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_similar_items(_engine: RecommendationEngine, item_id: int, n: int) -> List[Dict[str, Any]]:
+    """
+    Get the items most similar to an item.
+    
+    Args:
+        _engine: The recommendation engine instance (not hashed)
+        item_id: The ID of the item
+        n: The number of similar items to return
+        
+    Returns:
+        Similar item dictionaries
+    """
+    return _engine.get_similar_items(item_id, n=n)
+
+
+@st.fragment
+def _rating_fragment(item_id: int, user: UserModel, engine: RecommendationEngine) -> None:
+    """
+    Display the rating slider and save button for an item.
+    
+    Args:
+        item_id: The ID of the item to rate
+        user: The current user
+        engine: The recommendation engine instance
+    """
     st.markdown("### Your Rating")
     
     rating = RatingModel.find_by_user_and_item(user.id, item_id)
@@ -635,60 +911,49 @@ def show_item_detail_page(item_id: int, user: UserModel, engine: RecommendationE
     
     with col2:
         if st.button("Save Rating"):
-            if rating:
-                rating.value = new_rating
-                rating.save()
-            else:
-                rating = RatingModel(
-                    user_id=user.id,
-                    item_id=item_id,
-                    value=new_rating
-                )
-                rating.save()
-            
-            # Notify observers
-            if "activity_observer" in st.session_state:
-                observer = st.session_state["activity_observer"]
-                observer.update(None, "rating_created", {
-                    "user_id": user.id,
-                    "item_id": item_id,
-                    "rating_value": new_rating
-                })
-            
-            # Update item popularity
-            engine.update_item_popularity(item_id)
-            
-            show_success("Rating saved")
-    
-    # Recommendation explanation
-    st.markdown("### Why was this recommended to you?")
-    
-    try:
-        explanation = engine.explain_recommendation(user.id, item_id)
-        st.write(explanation)
-    except Exception as e:
-        logger.error(f"Error getting recommendation explanation: {str(e)}")
-        st.write("No explanation available for this item")
+            _rate_item(user.id, item_id, new_rating, engine)
+
+
+@st.fragment
+def _similar_items_fragment(item_id: int, engine: RecommendationEngine) -> None:
+    """
+    Display the items most similar to an item.
     
-    # Similar items
+    Args:
+        item_id: The ID of the item
+        engine: The recommendation engine instance
+    """
     st.markdown("### Similar Items")
     
     try:
-        similar_items = engine.get_similar_items(item_id, n=3)
+        similar_items = _cached_similar_items(engine, item_id, 3)
         
         if similar_items:
-            cols = st.columns(len(similar_items))
+            similar_data = pd.DataFrame.from_records(
+                [
+                    (similar_item["name"], similar_item["similarity_percent"], similar_item["category"], similar_item["item_id"])
+                    for similar_item in similar_items
+                ],
+                columns=["Name", "Similarity", "Category", "item_id"]
+            )
             
-            for i, similar_item in enumerate(similar_items):
-                with cols[i]:
-                    st.markdown(f"#### {similar_item['name']}")
-                    st.markdown(f"**Similarity:** {similar_item['similarity_percent']}")
-                    st.markdown(f"**Category:** {similar_item['category']}")
-                    
-                    if st.button("View Item", key=f"similar_{similar_item['item_id']}"):
-                        st.session_state["selected_item_id"] = similar_item['item_id']
-                        st.session_state["page"] = "ItemDetail"
-                        st.rerun()
+            # Reason: a single selectable table replaces one button per item;
+            # the key is per item so a selection isn't replayed after navigating
+            event = st.dataframe(
+                similar_data,
+                use_container_width=True,
+                hide_index=True,
+                column_config={"item_id": None},
+                on_select="rerun",
+                selection_mode="single-row",
+                key=f"similar_items_{item_id}"
+            )
+            st.caption("Select an item to view it")
+            
+            if event.selection.rows:
+                st.session_state["selected_item_id"] = int(similar_data["item_id"].iloc[event.selection.rows[0]])
+                st.session_state["page"] = "ItemDetail"
+                st.rerun()
         else:
             st.write("No similar items found")
     except Exception as e:
@@ -696,6 +961,20 @@ def show_item_detail_page(item_id: int, user: UserModel, engine: RecommendationE
         st.write("Similar items could not be loaded")
 
 
+@lru_cache(maxsize=1)
+def _strategy_list_markdown() -> str:
+    """
+    Build the home page list of strategies, once per process.
+    
+    Returns:
+        Markdown bullet list of strategy names and descriptions
+    """
+    return "\n".join(
+        f"* **{strategy_name}**: {_get_strategy_description(strategy_key)}"
+        for strategy_key, strategy_name in AVAILABLE_STRATEGIES.items()
+    )
+
+
 def _get_strategy_description(strategy_type: str) -> str:
     """
     Get a human-readable description of a recommendation strategy.
@@ -706,10 +985,4 @@ def _get_strategy_description(strategy_type: str) -> str:
     Returns:
         A description of the strategy
     """
-    descriptions = {
-        "collaborative": "Recommends items based on what similar users have liked",
-        "content-based": "Recommends items with features similar to what you've liked in the past",
-        "hybrid": "Combines multiple strategies for more balanced recommendations"
-    }
-    
-    return descriptions.get(strategy_type, "Unknown strategy type")
+    return _STRATEGY_DESCRIPTIONS.get(strategy_type, "Unknown strategy type")
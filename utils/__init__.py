@@ -6,13 +6,17 @@ This package contains utility classes and functions for the recommendation syste
 from .db_manager import DatabaseManager
 from .recommendation_factory import RecommendationFactory
 from .recommendation_engine import RecommendationEngine
-from .observer import Observer, Subject, UserActivityObserver
+from .recommendation_result import RecommendationResult
+from .observer import Activity, Observer, Subject, UserActivityObserver, wait_for_notifications
 
 __all__ = [
     'DatabaseManager', 
     'RecommendationFactory', 
     'RecommendationEngine',
+    'RecommendationResult',
+    'Activity',
     'Observer',
     'Subject',
-    'UserActivityObserver'
+    'UserActivityObserver',
+    'wait_for_notifications'
 ]
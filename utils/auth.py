@@ -3,12 +3,24 @@ Authentication Utilities Module.
 
 This module provides authentication and security functions for the recommendation system.
 """
+import asyncio
 import logging
 import hashlib
+import hmac
 import os
+import re
 import secrets
-from typing import Tuple, Optional, Dict, Any, TYPE_CHECKING
-from .config import PASSWORD_HASH_ALGORITHM, PASSWORD_SALT_LENGTH, PASSWORD_HASH_ITERATIONS
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Optional, Dict, Any, List, TYPE_CHECKING
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from .config import (
+    ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM, LEGACY_PASSWORD_HASH_ALGORITHM,
+    PASSWORD_VERIFY_CACHE_SIZE, PASSWORD_VERIFY_CACHE_TTL, REQUIRE_NATIVE_PBKDF2
+)
 
 # Type hints for better IDE support without creating circular imports
 if TYPE_CHECKING:
@@ -16,6 +28,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+def _check_native_pbkdf2() -> None:
+    """
+    Make sure legacy PBKDF2 verification runs in OpenSSL's C implementation.
+    
+    Some builds fall back to a pure Python PBKDF2 that is orders of magnitude
+    slower, which would make every legacy login stall.
+    
+    Raises:
+        RuntimeError: If PBKDF2 is not native and REQUIRE_NATIVE_PBKDF2 is set
+    """
+    if hashlib.pbkdf2_hmac.__module__ == "_hashlib":
+        return
+    
+    msg = f"hashlib.pbkdf2_hmac is provided by {hashlib.pbkdf2_hmac.__module__}, not OpenSSL"
+    if REQUIRE_NATIVE_PBKDF2:
+        logger.error(msg)
+        raise RuntimeError(msg)
+    logger.warning(f"{msg}; legacy password checks will be slow")
+
+
+_check_native_pbkdf2()
+
+# Argon2id hasher; its hashes are PHC strings carrying algorithm, parameters and salt
+_password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM
+)
+
+# Prefix of every Argon2 PHC string, legacy PBKDF2 hashes never start with it
+_ARGON2_PREFIX = "$argon2"
+
+# Legacy PBKDF2 hash format: algorithm$iterations$salt$hash.
+# Reason: the algorithm prefix is fixed, so it is baked into the pattern once
+# instead of being split out and checked on every verification
+_LEGACY_HASH_RE = re.compile(re.escape(f"{LEGACY_PASSWORD_HASH_ALGORITHM}$") + r"(\d+)\$([^$]+)\$([^$]+)")
+
+# Verification results by keyed digest of (stored hash, password), oldest first.
+# Reason: the key is secret and per process, so cached digests can't be used
+# to test password guesses without it
+_verify_cache: "OrderedDict[bytes, Tuple[float, bool]]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+_verify_cache_secret = secrets.token_bytes(32)
+
 
 class AuthenticationManager:
     """
@@ -40,32 +96,18 @@ class AuthenticationManager:
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password using PBKDF2 with a random salt.
+        Hash a password using Argon2id with a random salt.
         
         Args:
             password: The password to hash
             
         Returns:
-            The hashed password string in the format: algorithm$iterations$salt$hash
+            The hashed password as an Argon2 PHC string ($argon2id$v=19$m=...,t=...,p=...$salt$hash)
         """
         logger.debug("Hashing password")
         
         try:
-            # Generate a random salt
-            salt = secrets.token_hex(PASSWORD_SALT_LENGTH)
-            
-            # Hash the password using PBKDF2
-            password_hash = hashlib.pbkdf2_hmac(
-                'sha256',
-                password.encode('utf-8'),
-                salt.encode('utf-8'),
-                PASSWORD_HASH_ITERATIONS
-            ).hex()
-            
-            # Combine algorithm, iterations, salt, and hash
-            hashed_password = f"{PASSWORD_HASH_ALGORITHM}${PASSWORD_HASH_ITERATIONS}${salt}${password_hash}"
-            
-            return hashed_password
+            return _password_hasher.hash(password)
         except Exception as e:
             logger.error(f"Error hashing password: {str(e)}")
             raise
@@ -75,6 +117,9 @@ class AuthenticationManager:
         """
         Verify a password against a stored hash.
         
+        Accepts Argon2 hashes and legacy PBKDF2 hashes in the format
+        algorithm$iterations$salt$hash.
+        
         Args:
             stored_password: The stored password hash
             provided_password: The password to verify
@@ -85,24 +130,106 @@ class AuthenticationManager:
         logger.debug("Verifying password")
         
         try:
-            # Parse the stored hash
-            algorithm, iterations_str, salt, stored_hash = stored_password.split('$')
-            iterations = int(iterations_str)
-            
-            # Hash the provided password using the same salt and iterations
-            computed_hash = hashlib.pbkdf2_hmac(
-                'sha256',
-                provided_password.encode('utf-8'),
-                salt.encode('utf-8'),
-                iterations
-            ).hex()
-            
-            # Compare the computed hash with the stored hash
-            return computed_hash == stored_hash
+            # Repeated identical checks within the TTL skip the slow hash
+            cache_key = hmac.new(
+                _verify_cache_secret,
+                stored_password.encode('utf-8') + b"\0" + provided_password.encode('utf-8'),
+                hashlib.sha256
+            ).digest()
+            now = time.monotonic()
+            with _verify_cache_lock:
+                cached = _verify_cache.get(cache_key)
+                if cached is not None and cached[0] > now:
+                    return cached[1]
+            
+            result = AuthenticationManager._verify_password_uncached(stored_password, provided_password)
+            
+            with _verify_cache_lock:
+                _verify_cache[cache_key] = (now + PASSWORD_VERIFY_CACHE_TTL, result)
+                _verify_cache.move_to_end(cache_key)
+                while len(_verify_cache) > PASSWORD_VERIFY_CACHE_SIZE:
+                    _verify_cache.popitem(last=False)
+            return result
         except Exception as e:
             logger.error(f"Error verifying password: {str(e)}")
             return False
     
+    @staticmethod
+    def _verify_password_uncached(stored_password: str, provided_password: str) -> bool:
+        """
+        Verify a password by hashing it, without consulting the result cache.
+        
+        Args:
+            stored_password: The stored password hash
+            provided_password: The password to verify
+            
+        Returns:
+            True if the password matches, False otherwise
+            
+        Raises:
+            Exception: If the stored hash is malformed
+        """
+        if stored_password.startswith(_ARGON2_PREFIX):
+            try:
+                return _password_hasher.verify(stored_password, provided_password)
+            except VerifyMismatchError:
+                return False
+        
+        # Parse the stored legacy hash
+        match = _LEGACY_HASH_RE.fullmatch(stored_password)
+        if match is None:
+            raise ValueError("Unrecognized password hash format")
+        iterations_str, salt, stored_hash = match.groups()
+        iterations = int(iterations_str)
+        
+        # Hash the provided password using the same salt and iterations.
+        # The salt was always used as its text, not hex-decoded, so that stays
+        computed_hash = hashlib.pbkdf2_hmac(
+            'sha256',
+            provided_password.encode('utf-8'),
+            salt.encode('utf-8'),
+            iterations
+        )
+        
+        # Compare raw digests in constant time, the stored hex is decoded once
+        # instead of hex-encoding every computed digest
+        return hmac.compare_digest(computed_hash, bytes.fromhex(stored_hash))
+    
+    @classmethod
+    def verify_batch(cls, pairs: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Verify many passwords against their stored hashes in parallel.
+        
+        Args:
+            pairs: (stored password hash, provided password) pairs
+            
+        Returns:
+            Whether each password matches, in the order of pairs
+        """
+        logger.info(f"Verifying a batch of {len(pairs)} passwords")
+        if not pairs:
+            return []
+        
+        # Reason: both Argon2 and OpenSSL's PBKDF2 release the GIL while hashing,
+        # so worker threads verify on all cores at once
+        with ThreadPoolExecutor(max_workers=min(len(pairs), os.cpu_count() or 1)) as executor:
+            return list(executor.map(lambda pair: cls.verify_password(*pair), pairs))
+    
+    @staticmethod
+    def needs_rehash(stored_password: str) -> bool:
+        """
+        Check whether a stored hash should be replaced with a current one.
+        
+        Args:
+            stored_password: The stored password hash
+            
+        Returns:
+            True for legacy PBKDF2 hashes and Argon2 hashes with outdated parameters
+        """
+        if not stored_password.startswith(_ARGON2_PREFIX):
+            return True
+        return _password_hasher.check_needs_rehash(stored_password)
+    
     @classmethod
     def register_user(cls, username: str, email: str, password: str, 
                     first_name: Optional[str] = None, 
@@ -129,15 +256,12 @@ class AuthenticationManager:
             # Import here to avoid circular imports
             from models.user_model import UserModel
             
-            # Check if username already exists
-            existing_user = UserModel.find_by_username(username)
-            if existing_user:
+            # Check if the username or email already exists with one query
+            existing_users = UserModel.find_by_username_or_email(username, email)
+            if any(existing["username"] == username for existing in existing_users):
                 logger.warning(f"Username '{username}' already exists")
                 return False, "Username already exists", None
-                
-            # Check if email already exists
-            existing_user = UserModel.find_by_email(email)
-            if existing_user:
+            if existing_users:
                 logger.warning(f"Email '{email}' already exists")
                 return False, "Email already exists", None
                 
@@ -199,6 +323,12 @@ class AuthenticationManager:
                 logger.warning(f"Invalid password for user '{username_or_email}'")
                 return False, "Invalid username/email or password", None
                 
+            # Upgrade legacy or outdated hashes while the plain password is at hand,
+            # the new hash is stored by the last login save below
+            if cls.needs_rehash(user.password_hash):
+                logger.info(f"Upgrading password hash for user '{username_or_email}'")
+                user.password_hash = cls.hash_password(password)
+            
             # Update last login timestamp
             user.update_last_login()
             
@@ -207,3 +337,39 @@ class AuthenticationManager:
         except Exception as e:
             logger.error(f"Error logging in: {str(e)}")
             return False, f"Login failed: {str(e)}", None
+    
+    @classmethod
+    async def register_user_async(cls, username: str, email: str, password: str,
+                                  first_name: Optional[str] = None,
+                                  last_name: Optional[str] = None) -> Tuple[bool, str, Optional[Any]]:
+        """
+        Register a new user without blocking the event loop.
+        
+        Runs register_user on a worker thread, so the database calls and the
+        password hashing don't stall other coroutines.
+        
+        Args:
+            username: The username for the new user
+            email: The email for the new user
+            password: The password for the new user
+            first_name: The first name of the user (optional)
+            last_name: The last name of the user (optional)
+            
+        Returns:
+            The same tuple as register_user
+        """
+        return await asyncio.to_thread(cls.register_user, username, email, password, first_name, last_name)
+    
+    @classmethod
+    async def login_user_async(cls, username_or_email: str, password: str) -> Tuple[bool, str, Optional[Any]]:
+        """
+        Login a user without blocking the event loop.
+        
+        Args:
+            username_or_email: The username or email of the user
+            password: The password of the user
+            
+        Returns:
+            The same tuple as login_user
+        """
+        return await asyncio.to_thread(cls.login_user, username_or_email, password)
@@ -33,6 +33,24 @@ AVAILABLE_STRATEGIES = {
 
 # Password security
 PASSWORD_MIN_LENGTH = 8
-PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ALGORITHM = "argon2id"
+ARGON2_TIME_COST = 3
+ARGON2_MEMORY_COST = 65536  # KiB
+ARGON2_PARALLELISM = 2
+
+# Legacy PBKDF2 hashes, still accepted at login and upgraded to Argon2id
+LEGACY_PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
 PASSWORD_SALT_LENGTH = 32
 PASSWORD_HASH_ITERATIONS = 100000
+# Fail at startup instead of warning when PBKDF2 isn't backed by OpenSSL
+REQUIRE_NATIVE_PBKDF2 = os.getenv('REQUIRE_NATIVE_PBKDF2', 'false').lower() == 'true'
+
+# Recent password verification results kept in memory
+PASSWORD_VERIFY_CACHE_SIZE = 4096
+PASSWORD_VERIFY_CACHE_TTL = 60  # seconds
+
+# Activity tracking
+MAX_ACTIVITY_LOG = int(os.getenv('MAX_ACTIVITY_LOG', '100000'))
+
+# Seconds before the cached database schema is fetched again
+SCHEMA_CACHE_TTL = 60
@@ -5,16 +5,24 @@ This module implements the Singleton Pattern for managing database connections.
 """
 import os
 import logging
+import logging.handlers
 from typing import Optional
-from dotenv import load_dotenv
 from supabase import create_client, Client
 
+from .config import SUPABASE_URL, SUPABASE_KEY
+
 # Configure logging
+# Reason: records are buffered and written to the log file in batches,
+# errors are flushed straight away so nothing important waits in memory
+_log_file_handler = logging.FileHandler(os.getenv("LOG_FILE", "app.log"), mode="a", delay=True)
+_log_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename=os.getenv("LOG_FILE", "app.log"),
-    filemode="a"
+    handlers=[logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=_log_file_handler
+    )]
 )
 logger = logging.getLogger(__name__)
 
@@ -40,21 +48,16 @@ class DatabaseManager:
     def _initialize(self) -> None:
         """Initialize the Supabase client connection."""
         try:
-            # Load environment variables
-            load_dotenv()
-            
-            # Get Supabase credentials
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_KEY")
-            
-            if not supabase_url or not supabase_key:
+            # Reason: credentials are read once by the config module at import,
+            # so recreating the singleton doesn't parse .env again
+            if not SUPABASE_URL or not SUPABASE_KEY:
                 logger.error("Supabase credentials not found in environment variables")
                 raise ValueError(
                     "Missing Supabase credentials. Please set SUPABASE_URL and SUPABASE_KEY."
                 )
             
             # Initialize Supabase client
-            self._client = create_client(supabase_url, supabase_key)
+            self._client = create_client(SUPABASE_URL, SUPABASE_KEY)
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {str(e)}")
@@ -4,8 +4,9 @@ Migration Manager Module.
 This module provides functionality for database migrations using the Singleton pattern.
 """
 import os
+import mmap
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 
 # Local imports
@@ -41,49 +42,45 @@ class MigrationManager:
             True if migration was successful, False otherwise
         """
         try:
-            print(f"Applying migration: {migration_file}")
             logger.info(f"Applying migration: {migration_file}")
             
             # Check if file exists
             if not os.path.exists(migration_file):
-                error_msg = f"Migration file not found: {migration_file}"
-                print(f"ERROR: {error_msg}")
-                logger.error(error_msg)
+                logger.error(f"Migration file not found: {migration_file}")
                 return False
             
-            # Read SQL from file
-            with open(migration_file, 'r') as file:
-                sql = file.read()
-                print(f"SQL to execute: {sql}")
-            
             # Get database client
             db = DatabaseManager().client
             
+            # Skip migrations that were already recorded, without reading the file
+            migration_name = os.path.basename(migration_file)
+            existing = db.table('schema_migrations').select('name').eq('name', migration_name).execute()
+            if existing.data:
+                logger.info(f"Migration already applied: {migration_name}")
+                return True
+            
+            # Read SQL from file
+            sql = self._read_sql(migration_file)
+            logger.debug(f"SQL to execute: {sql}")
+            
             # Execute SQL migration directly using the database connection
             # We need to execute this as raw SQL since Supabase REST API doesn't support schema alterations directly
             try:
                 # This is a workaround for executing DDL in Supabase
                 # We'll use the table() method but with our custom SQL instead
                 db.table('schema_migrations').insert({
-                    'name': os.path.basename(migration_file),
+                    'name': migration_name,
                     'applied_at': 'now()',
                     'sql_executed': sql
                 }).execute()
-                
-                print("Migration recorded in database")
             except Exception as db_error:
-                error_msg = f"Database error: {str(db_error)}"
-                print(f"ERROR: {error_msg}")
-                logger.error(error_msg)
+                logger.error(f"Database error: {str(db_error)}")
                 return False
                 
-            print(f"Migration applied successfully: {migration_file}")
             logger.info(f"Migration applied successfully: {migration_file}")
             return True
         except Exception as e:
-            error_msg = f"Error applying migration {migration_file}: {str(e)}"
-            print(f"ERROR: {error_msg}")
-            logger.error(error_msg)
+            logger.error(f"Error applying migration {migration_file}: {str(e)}")
             return False
     
     def run_migrations_in_directory(self, directory: str) -> dict:
@@ -100,19 +97,86 @@ class MigrationManager:
         try:
             # Get all SQL files in the directory
             migration_files = sorted(Path(directory).glob("*.sql"))
+            if not migration_files:
+                return results
+            
+            db = DatabaseManager().client
+            applied = self._applied_migrations(db)
             
-            # Apply each migration
+            # Collect every migration that hasn't been recorded yet
+            records: List[Dict[str, Any]] = []
             for migration_file in migration_files:
-                file_path = str(migration_file)
                 file_name = migration_file.name
-                
-                success = self.apply_migration(file_path)
-                results[file_name] = success
-                
+                if file_name in applied:
+                    logger.info(f"Migration already applied: {file_name}")
+                    results[file_name] = True
+                    continue
+                try:
+                    sql = self._read_sql(str(migration_file))
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.error(f"Error reading migration {file_name}: {str(e)}")
+                    results[file_name] = False
+                    continue
+                records.append({
+                    'name': file_name,
+                    'applied_at': 'now()',
+                    'sql_executed': sql
+                })
+            
+            if not records:
+                return results
+            
+            # Reason: one insert for the whole directory instead of one
+            # round-trip per migration file
+            logger.info(f"Applying {len(records)} migrations from {directory}")
+            try:
+                db.table('schema_migrations').insert(records).execute()
+                success = True
+            except Exception as db_error:
+                logger.error(f"Database error: {str(db_error)}")
+                success = False
+            
+            for record in records:
+                results[record['name']] = success
                 if not success:
-                    logger.warning(f"Migration failed for {file_name}")
+                    logger.warning(f"Migration failed for {record['name']}")
             
             return results
         except Exception as e:
             logger.error(f"Error running migrations in directory {directory}: {str(e)}")
             return results
+    
+    @staticmethod
+    def _read_sql(migration_file: str) -> str:
+        """
+        Read the SQL of a migration file.
+        
+        The file is memory-mapped, so its contents are decoded straight from
+        the page cache instead of going through a buffered read.
+        
+        Args:
+            migration_file: Path to the SQL migration file
+            
+        Returns:
+            The SQL text
+        """
+        with open(migration_file, 'rb') as file:
+            # Reason: an empty file can't be memory-mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[:].decode('utf-8')
+    
+    @staticmethod
+    def _applied_migrations(db: Any) -> Set[str]:
+        """
+        Get the names of migrations already recorded in the database.
+        
+        Args:
+            db: The Supabase client
+            
+        Returns:
+            Set of applied migration file names
+        """
+        response = db.table('schema_migrations').select('name').execute()
+        return {row['name'] for row in response.data}
@@ -5,11 +5,122 @@ This module implements the Observer design pattern for tracking user behavior an
 """
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Set
+from collections import Counter, deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import List, Dict, Any, Set, Iterable, Tuple, Optional
 import datetime
+import queue
+import threading
+import time
+
+from .config import MAX_ACTIVITY_LOG
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of recent activities kept in each user's index
+_USER_ACTIVITY_INDEX_SIZE = 1000
+
+# Pending (observer, subject, event_type, data) notifications, handled in
+# order by a single background worker
+_NOTIFY_QUEUE_SIZE = 10000
+_notify_queue: queue.Queue = queue.Queue(maxsize=_NOTIFY_QUEUE_SIZE)
+_notify_worker: Optional[threading.Thread] = None
+_notify_worker_lock = threading.Lock()
+
+
+def _dispatch_notifications() -> None:
+    """Deliver queued notifications to their observers, forever."""
+    while True:
+        observer, subject, event_type, data = _notify_queue.get()
+        try:
+            observer.update(subject, event_type, data)
+        except Exception as e:
+            logger.error(f"Error notifying {observer.__class__.__name__} of '{event_type}': {str(e)}")
+        finally:
+            _notify_queue.task_done()
+
+
+def _ensure_notify_worker() -> None:
+    """Start the background notification worker if it isn't running."""
+    global _notify_worker
+    if _notify_worker is not None and _notify_worker.is_alive():
+        return
+    with _notify_worker_lock:
+        if _notify_worker is None or not _notify_worker.is_alive():
+            _notify_worker = threading.Thread(
+                target=_dispatch_notifications, name="observer-notify", daemon=True
+            )
+            _notify_worker.start()
+
+
+def wait_for_notifications() -> None:
+    """Block until every queued notification has been delivered."""
+    _notify_queue.join()
+
+
+def _format_ts(timestamp_ns: int) -> datetime.datetime:
+    """
+    Convert a nanosecond epoch timestamp to a UTC datetime.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch, as from time.time_ns()
+        
+    Returns:
+        Timezone-aware UTC datetime with microsecond precision
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc).replace(
+        microsecond=nanoseconds // 1000
+    )
+
+
+@dataclass(slots=True)
+class Activity:
+    """
+    A single recorded user activity.
+    
+    Stored instead of a plain dictionary so each of the many logged
+    activities carries no per-instance ``__dict__``.
+    """
+    timestamp: int  # nanoseconds since the epoch
+    event_type: str
+    user_id: Optional[int] = None
+    item_id: Optional[int] = None
+    extra: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_event(cls, event_type: str, data: Dict[str, Any], timestamp: int) -> 'Activity':
+        """
+        Create an activity from an observer event.
+        
+        Args:
+            event_type: The type of event that occurred
+            data: Additional data about the event
+            timestamp: When the event occurred, in nanoseconds since the epoch
+            
+        Returns:
+            The activity record
+        """
+        extra = {key: value for key, value in data.items() if key not in ("user_id", "item_id")}
+        return cls(timestamp, event_type, data.get("user_id"), data.get("item_id"), extra or None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the activity to the dictionary form returned to callers.
+        
+        Returns:
+            Dictionary with the timestamp, event type and event data
+        """
+        activity = {"timestamp": _format_ts(self.timestamp), "event_type": self.event_type}
+        if self.user_id is not None:
+            activity["user_id"] = self.user_id
+        if self.item_id is not None:
+            activity["item_id"] = self.item_id
+        if self.extra:
+            activity.update(self.extra)
+        return activity
+
 
 class Observer(ABC):
     """
@@ -18,6 +129,8 @@ class Observer(ABC):
     Defines the interface that all concrete observers must implement.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def update(self, subject: 'Subject', event_type: str, data: Dict[str, Any]) -> None:
         """
@@ -38,9 +151,14 @@ class Subject(ABC):
     Defines the interface that all concrete subjects must implement.
     """
     
+    __slots__ = ('_observers', '_observer_ids')
+    
     def __init__(self):
-        """Initialize the subject with an empty set of observers."""
-        self._observers: Set[Observer] = set()
+        """Initialize the subject with an empty list of observers."""
+        # Reason: notify() walks the observers on every event, a list
+        # iterates faster than a set, uniqueness is kept by the ID set
+        self._observers: List[Observer] = []
+        self._observer_ids: Set[int] = set()
         logger.debug(f"Initialized {self.__class__.__name__}")
     
     def attach(self, observer: Observer) -> None:
@@ -50,7 +168,10 @@ class Subject(ABC):
         Args:
             observer: The observer to attach
         """
-        self._observers.add(observer)
+        if id(observer) in self._observer_ids:
+            return
+        self._observers.append(observer)
+        self._observer_ids.add(id(observer))
         logger.debug(f"Observer {observer.__class__.__name__} attached to {self.__class__.__name__}")
     
     def detach(self, observer: Observer) -> None:
@@ -60,8 +181,9 @@ class Subject(ABC):
         Args:
             observer: The observer to detach
         """
-        if observer in self._observers:
+        if id(observer) in self._observer_ids:
             self._observers.remove(observer)
+            self._observer_ids.discard(id(observer))
             logger.debug(f"Observer {observer.__class__.__name__} detached from {self.__class__.__name__}")
     
     def notify(self, event_type: str, data: Dict[str, Any]) -> None:
@@ -74,8 +196,16 @@ class Subject(ABC):
         """
         logger.debug(f"Notifying observers of event '{event_type}'")
         
+        # Reason: observers run on a background worker so the caller isn't
+        # held up by analytics processing
+        _ensure_notify_worker()
         for observer in self._observers:
-            observer.update(self, event_type, data)
+            try:
+                _notify_queue.put_nowait((observer, self, event_type, data))
+            except queue.Full:
+                # Backpressure, deliver on the caller's thread instead
+                logger.warning(f"Notification queue full, notifying {observer.__class__.__name__} directly")
+                observer.update(self, event_type, data)
 
 
 class UserActivityObserver(Observer):
@@ -85,9 +215,20 @@ class UserActivityObserver(Observer):
     Implements the Observer interface to track various user interactions.
     """
     
+    __slots__ = ('_activities', '_event_counts', '_by_user', '_lock')
+    
     def __init__(self):
         """Initialize the observer with empty activity logs."""
-        self._activities: List[Dict[str, Any]] = []
+        # Reason: update() runs on the notification worker while update_many()
+        # and the getters run on script threads, so the logs are guarded together
+        self._lock = threading.Lock()
+        # Reason: a bounded ring buffer keeps memory flat in long-running
+        # processes, the oldest activities are dropped first
+        self._activities: deque[Activity] = deque(maxlen=MAX_ACTIVITY_LOG)
+        # Number of activities of each event type currently in the log
+        self._event_counts: Counter = Counter()
+        # Recent activities per user ID, newest first, only for activities still in the log
+        self._by_user: Dict[int, deque] = {}
         logger.info("Initialized UserActivityObserver")
     
     def update(self, subject: Subject, event_type: str, data: Dict[str, Any]) -> None:
@@ -99,15 +240,85 @@ class UserActivityObserver(Observer):
             event_type: The type of event that occurred
             data: Additional data about the event
         """
-        # Add timestamp to the activity data
-        activity = {
-            "timestamp": datetime.datetime.utcnow(),
-            "event_type": event_type,
-            **data
-        }
+        timestamp = time.time_ns()
+        with self._lock:
+            activity = self._store(event_type, data, timestamp)
+        self._process(activity, data)
+    
+    def update_many(self, subject: Subject, events: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Record a batch of user activity events at once.
+        
+        Args:
+            subject: The subject that triggered the updates
+            events: (event_type, data) pairs in the order they occurred
+        """
+        # Reason: one timestamp lookup per batch, events in a batch were
+        # buffered within the same script run
+        timestamp = time.time_ns()
+        events = list(events)
+        with self._lock:
+            activities = [self._store(event_type, data, timestamp) for event_type, data in events]
+        for activity, (_, data) in zip(activities, events):
+            self._process(activity, data)
+    
+    def _store(self, event_type: str, data: Dict[str, Any], timestamp: int) -> Activity:
+        """
+        Add a single activity event to the logs; the caller holds the lock.
+        
+        Args:
+            event_type: The type of event that occurred
+            data: Additional data about the event
+            timestamp: When the event occurred, in nanoseconds since the epoch
+            
+        Returns:
+            The stored activity
+        """
+        activity = Activity.from_event(event_type, data, timestamp)
+        
+        # A full ring buffer drops its oldest activity on append
+        if len(self._activities) == self._activities.maxlen:
+            self._forget(self._activities[0])
         
-        # Add activity to the log
         self._activities.append(activity)
+        self._event_counts[event_type] += 1
+        if activity.user_id is not None:
+            user_activities = self._by_user.get(activity.user_id)
+            if user_activities is None:
+                user_activities = self._by_user[activity.user_id] = deque(maxlen=_USER_ACTIVITY_INDEX_SIZE)
+            user_activities.appendleft(activity)
+        return activity
+    
+    def _forget(self, activity: Activity) -> None:
+        """
+        Remove an activity that is leaving the log from the event counts and per-user index.
+        
+        Users whose last indexed activity is removed are dropped from the index,
+        so it never holds more users than there are activities in the log.
+        
+        Args:
+            activity: The oldest activity in the log
+        """
+        self._event_counts[activity.event_type] -= 1
+        if not self._event_counts[activity.event_type]:
+            del self._event_counts[activity.event_type]
+        
+        user_activities = self._by_user.get(activity.user_id)
+        # The user's deque may have dropped it already when it hit its own limit
+        if user_activities and user_activities[-1] is activity:
+            user_activities.pop()
+            if not user_activities:
+                del self._by_user[activity.user_id]
+    
+    def _process(self, activity: Activity, data: Dict[str, Any]) -> None:
+        """
+        Log a stored activity and run the processing for its event type.
+        
+        Args:
+            activity: The stored activity
+            data: Additional data about the event
+        """
+        event_type = activity.event_type
         
         # Log the activity
         logger.info(f"User activity: {event_type} - User ID: {data.get('user_id', 'unknown')}")
@@ -182,23 +393,17 @@ class UserActivityObserver(Observer):
         Returns:
             List of user activities, most recent first
         """
-        user_activities = [
-            activity for activity in self._activities
-            if activity.get("user_id") == user_id
-        ]
-        
-        # Sort by timestamp in descending order and limit the results
-        sorted_activities = sorted(
-            user_activities,
-            key=lambda a: a["timestamp"],
-            reverse=True
-        )[:limit]
-        
-        return sorted_activities
+        # Reason: the per-user index is already newest first, so only the
+        # requested slice is read instead of scanning and sorting every activity
+        with self._lock:
+            recent = list(islice(self._by_user.get(user_id, ()), limit))
+        return [activity.to_dict() for activity in recent]
     
     def get_event_count(self, event_type: str) -> int:
         """
-        Get the count of a specific event type.
+        Get the count of a specific event type among the logged activities.
+        
+        Once the log is full, activities dropped from it are no longer counted.
         
         Args:
             event_type: The type of event to count
@@ -206,9 +411,13 @@ class UserActivityObserver(Observer):
         Returns:
             Count of events of the specified type
         """
-        return sum(1 for activity in self._activities if activity["event_type"] == event_type)
+        with self._lock:
+            return self._event_counts[event_type]
     
     def clear_activities(self) -> None:
         """Clear all stored activities."""
-        self._activities = []
+        with self._lock:
+            self._activities.clear()
+            self._event_counts.clear()
+            self._by_user.clear()
         logger.info("Cleared all user activities")
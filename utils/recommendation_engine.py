@@ -4,17 +4,102 @@ Recommendation Engine Module.
 This module implements the core recommendation engine that orchestrates the recommendation process.
 """
 import logging
-from typing import List, Dict, Any, Optional, Union
-import random
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Union, Sequence, Mapping, Callable
+import numpy as np
 from models.user_model import UserModel
 from models.item_model import ItemModel
 from models.rating_model import RatingModel
 from strategies.recommendation_strategy import RecommendationStrategy
 from .recommendation_factory import RecommendationFactory
+from .recommendation_result import RecommendationResult
 
 logger = logging.getLogger(__name__)
 
 
+def _select_diverse(scores: np.ndarray, similarity: np.ndarray, n: int, diversity_factor: float) -> np.ndarray:
+    """
+    Greedily pick candidates that balance their score against diversity.
+    
+    The first candidate is always picked. Every following pick maximizes
+    ``(1 - diversity_factor) * score + diversity_factor * (1 - avg_similarity)``,
+    where avg_similarity is the mean similarity to the candidates picked so far.
+    
+    Args:
+        scores: 1D array of candidate scores, best first
+        similarity: (C, C) array of pairwise candidate similarities
+        n: The number of candidates to pick
+        diversity_factor: How much to prioritize diversity (0.0 to 1.0)
+        
+    Returns:
+        1D array of the picked candidate indices, in pick order
+    """
+    n_candidates = len(scores)
+    n = min(n, n_candidates)
+    picks = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return picks
+    
+    picks[0] = 0
+    available = np.ones(n_candidates, dtype=bool)
+    available[0] = False
+    # Reason: a running sum of similarities to the picked set is updated
+    # with one row per pick instead of rescanning every picked candidate
+    # Reason: columns are read once per pick, so they are laid out contiguously
+    columns = np.ascontiguousarray(similarity.T, dtype=np.float64)
+    similarity_sum = columns[0].copy()
+    relevance = (1.0 - diversity_factor) * scores
+    combined = np.empty(n_candidates, dtype=np.float64)
+    argmax = np.argmax
+    
+    for count in range(1, n):
+        # The constant diversity_factor term is left out, it doesn't change the argmax
+        np.multiply(similarity_sum, -diversity_factor / count, out=combined)
+        combined += relevance
+        combined[~available] = -np.inf
+        best = int(argmax(combined))
+        picks[count] = best
+        available[best] = False
+        similarity_sum += columns[best]
+    
+    return picks
+
+
+def _make_popularity_function(
+    rating_weight: float = 0.7,
+    count_weight: float = 0.3,
+    max_rating: float = 5.0
+) -> Callable[[float, int], float]:
+    """
+    Build the popularity formula with its constants folded in.
+    
+    Popularity is ``rating_weight * avg / max_rating + count_weight * min(1, 0.1 * (1 + count) / 2)``,
+    clamped to [0, 1] and scaled back to the 0-max_rating range. Unrated items have a popularity of 0.
+    
+    Args:
+        rating_weight: Weight of the normalized average rating
+        count_weight: Weight of the normalized number of ratings
+        max_rating: The highest possible rating
+        
+    Returns:
+        Function mapping (average rating, number of ratings) to a popularity score
+    """
+    # Folded once here instead of on every call
+    rating_scale = rating_weight / max_rating
+    count_step = 0.1 / 2
+    
+    def popularity(avg_rating: float, num_ratings: int) -> float:
+        """Compute the popularity score of an item from its rating stats."""
+        if num_ratings == 0:
+            return 0.0
+        # Normalize the number of ratings so large counts don't dominate
+        norm_num_ratings = min(1.0, count_step * (1 + num_ratings))
+        return max(0.0, min(1.0, rating_scale * avg_rating + count_weight * norm_num_ratings)) * max_rating
+    
+    return popularity
+
+
 class RecommendationEngine:
     """
     Core recommendation engine that orchestrates the recommendation process.
@@ -31,8 +116,12 @@ class RecommendationEngine:
             default_strategy: The default recommendation strategy type to use
         """
         self._strategies = {}
+        # Reason: one lock per strategy type, so a slow first training of one
+        # strategy doesn't block requests for strategies that are ready
+        self._strategy_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
         self._default_strategy_type = default_strategy
         self._default_strategy = None
+        self._popularity = _make_popularity_function()
         logger.info(f"Initialized RecommendationEngine with default strategy '{default_strategy}'")
     
     def initialize(self) -> None:
@@ -47,9 +136,6 @@ class RecommendationEngine:
             # Create and train the default strategy
             self._default_strategy = self.get_strategy(self._default_strategy_type)
             
-            if not self._default_strategy.is_trained:
-                self._default_strategy.train()
-                
             logger.info("Recommendation engine initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing recommendation engine: {str(e)}")
@@ -60,7 +146,8 @@ class RecommendationEngine:
         Get a recommendation strategy of the specified type.
         
         If a strategy of this type has already been created, return the existing instance.
-        Otherwise, create a new instance.
+        Otherwise, create and train a new instance. Concurrent first requests for the
+        same type wait for a single training run instead of training twice.
         
         Args:
             strategy_type: The type of strategy to get
@@ -69,22 +156,29 @@ class RecommendationEngine:
         Returns:
             An instance of the specified strategy type
         """
-        logger.debug(f"Getting recommendation strategy of type '{strategy_type}'")
+        logger.debug("Getting recommendation strategy of type '%s'", strategy_type)
         
         # Return existing strategy if available
-        if strategy_type in self._strategies:
-            return self._strategies[strategy_type]
+        strategy = self._strategies.get(strategy_type)
+        if strategy is not None:
+            return strategy
             
-        # Create new strategy
-        strategy = RecommendationFactory.create_strategy(strategy_type, **kwargs)
-        
-        # Train the strategy
-        if not strategy.is_trained:
-            strategy.train()
+        with self._strategy_locks[strategy_type]:
+            # Another thread may have created it while we waited for the lock
+            strategy = self._strategies.get(strategy_type)
+            if strategy is not None:
+                return strategy
+                
+            # Create new strategy
+            strategy = RecommendationFactory.create_strategy(strategy_type, **kwargs)
+            
+            # Train the strategy
+            if not strategy.is_trained:
+                strategy.train()
+                
+            # Cache the strategy only once it is trained
+            self._strategies[strategy_type] = strategy
             
-        # Cache the strategy
-        self._strategies[strategy_type] = strategy
-        
         return strategy
     
     def recommend(
@@ -94,7 +188,7 @@ class RecommendationEngine:
         n: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """
         Generate recommendations for a user.
         
@@ -106,39 +200,34 @@ class RecommendationEngine:
             **kwargs: Additional parameters to pass to the strategy
             
         Returns:
-            A list of dictionaries containing recommended item details
+            A RecommendationResult, a sequence of dictionary-style recommendations
         """
-        logger.info(f"Generating recommendations for user {user_id}")
+        logger.debug("Generating recommendations for user %s", user_id)
         
         try:
             # Check if user exists
             user = UserModel.find_by_id(user_id)
             if not user:
                 logger.warning(f"User {user_id} not found")
-                return []
+                return RecommendationResult.empty()
                 
-            # Get the strategy to use
-            strategy = (
-                self.get_strategy(strategy_type) 
-                if strategy_type 
-                else self._default_strategy
-            )
-            
-            if not strategy:
-                logger.error("No strategy available")
-                return []
+            # Get the strategy to use; most calls don't override it
+            if strategy_type:
+                strategy = self.get_strategy(strategy_type)
+            else:
+                strategy = self._default_strategy or self.get_strategy(self._default_strategy_type)
                 
             # Generate recommendations
             recommendations = strategy.recommend(user_id, n=n, **kwargs)
             
-            # Apply filters if specified
-            if filters:
-                recommendations = self._apply_filters(recommendations, filters)
-                
             # Post-process recommendations (e.g., add additional information)
             recommendations = self._post_process_recommendations(recommendations)
             
-            logger.info(f"Generated {len(recommendations)} recommendations for user {user_id}")
+            # Apply filters if specified, as masks over the result columns
+            if filters:
+                recommendations = self._apply_filters(recommendations, filters)
+                
+            logger.info("Generated %d recommendations for user %s", len(recommendations), user_id)
             return recommendations
         except Exception as e:
             logger.error(f"Error generating recommendations: {str(e)}")
@@ -146,75 +235,113 @@ class RecommendationEngine:
     
     def _apply_filters(
         self, 
-        recommendations: List[Dict[str, Any]], 
+        recommendations: Union[RecommendationResult, List[Dict[str, Any]]], 
         filters: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Union[RecommendationResult, List[Dict[str, Any]]]:
         """
         Apply filters to recommendations.
         
+        A RecommendationResult is filtered with one boolean mask over its columns;
+        plain lists of recommendation dictionaries are filtered row by row.
+        
         Args:
             recommendations: The recommendations to filter
             filters: Dictionary of filters to apply
             
+        Returns:
+            Filtered recommendations, of the same type as the input
+        """
+        logger.debug("Applying filters: %s", filters)
+        
+        categories = filters.get("category")
+        if isinstance(categories, str):
+            categories = [categories]
+            
+        min_score = filters.get("min_score")
+        if not isinstance(min_score, (int, float)):
+            min_score = None
+            
+        if not isinstance(recommendations, RecommendationResult):
+            return self._apply_filters_to_records(recommendations, categories, min_score)
+            
+        mask = np.ones(len(recommendations), dtype=bool)
+        
+        # Filter by category; recommendations without one never match
+        if categories is not None:
+            item_categories = recommendations.column("category", "", dtype=str)
+            mask &= np.isin(item_categories, np.asarray(list(categories), dtype=str))
+            mask &= item_categories != ""
+            
+        # Filter by minimum score
+        if min_score is not None:
+            mask &= recommendations.scores >= float(min_score)
+            
+        # Add more filters as needed
+        
+        filtered_recs = recommendations.take(mask)
+        logger.debug("Filtered recommendations from %d to %d", len(recommendations), len(filtered_recs))
+        return filtered_recs
+    
+    def _apply_filters_to_records(
+        self,
+        recommendations: List[Dict[str, Any]],
+        categories: Optional[List[str]],
+        min_score: Optional[float]
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply filters to a plain list of recommendation dictionaries.
+        
+        Args:
+            recommendations: The recommendations to filter
+            categories: The allowed categories, or None to skip the filter
+            min_score: The minimum score, or None to skip the filter
+            
         Returns:
             Filtered recommendations
         """
-        logger.debug(f"Applying filters: {filters}")
         filtered_recs = recommendations
         
-        # Filter by category
-        if "category" in filters:
-            categories = filters["category"]
-            if isinstance(categories, str):
-                categories = [categories]
-                
+        if categories is not None:
             filtered_recs = [
                 rec for rec in filtered_recs 
                 if "category" in rec and rec["category"] in categories
             ]
             
-        # Filter by minimum score
-        if "min_score" in filters and isinstance(filters["min_score"], (int, float)):
-            min_score = float(filters["min_score"])
+        if min_score is not None:
+            min_score = float(min_score)
             filtered_recs = [
                 rec for rec in filtered_recs 
                 if "score" in rec and rec["score"] >= min_score
             ]
             
-        # Add more filters as needed
-            
-        logger.debug(f"Filtered recommendations from {len(recommendations)} to {len(filtered_recs)}")
+        logger.debug("Filtered recommendations from %d to %d", len(recommendations), len(filtered_recs))
         return filtered_recs
     
     def _post_process_recommendations(
         self, 
         recommendations: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> RecommendationResult:
         """
         Post-process recommendations to add additional information or formatting.
         
+        Duplicate items are dropped so each item is rendered (and gets widget keys) once.
+        The strategy dictionaries are kept as they are; the result fills in missing
+        scores and recommendation types and formats score_percent when it is read.
+        
         Args:
             recommendations: The recommendations to post-process
             
         Returns:
             Post-processed recommendations
         """
-        processed_recs = []
+        result = RecommendationResult.from_records(recommendations)
         
-        for rec in recommendations:
-            # Add any additional information or formatting
-            processed_rec = rec.copy()
-            
-            # Ensure all recommendations have consistent fields
-            processed_rec.setdefault("score", 0.0)
-            processed_rec.setdefault("recommendation_type", "unknown")
-            
-            # Format the score as a percentage
-            processed_rec["score_percent"] = f"{processed_rec['score'] * 100:.1f}%"
-            
-            processed_recs.append(processed_rec)
-            
-        return processed_recs
+        # Reason: strategies rarely return duplicates, so the common case keeps
+        # the result as built; otherwise the first occurrence of each item is kept
+        unique_ids, first_positions = np.unique(result.ids, return_index=True)
+        if len(unique_ids) == len(result):
+            return result
+        return result.take(np.sort(first_positions))
     
     def explain_recommendation(
         self, 
@@ -233,7 +360,7 @@ class RecommendationEngine:
         Returns:
             A human-readable explanation string
         """
-        logger.info(f"Explaining recommendation of item {item_id} to user {user_id}")
+        logger.debug("Explaining recommendation of item %s to user %s", item_id, user_id)
         
         try:
             # Get the strategy to use
@@ -250,7 +377,7 @@ class RecommendationEngine:
             # Get explanation from the strategy
             explanation = strategy.explain(user_id, item_id)
             
-            logger.info(f"Generated explanation for user {user_id}, item {item_id}")
+            logger.info("Generated explanation for user %s, item %s", user_id, item_id)
             return explanation
         except Exception as e:
             logger.error(f"Error explaining recommendation: {str(e)}")
@@ -263,40 +390,42 @@ class RecommendationEngine:
         Args:
             item_id: The ID of the item to update
         """
-        logger.info(f"Updating popularity score for item {item_id}")
+        logger.debug("Updating popularity score for item %s", item_id)
         
         try:
-            # Get the average rating for the item
-            avg_rating = RatingModel.get_average_rating_for_item(item_id)
+            # Get the average and number of ratings with a single query
+            avg_rating, num_ratings = RatingModel.get_stats_for_item(item_id)
             
-            # Get the number of ratings
-            ratings = RatingModel.find_by_item(item_id)
-            num_ratings = len(ratings)
+            # Weighted combination of average rating and number of ratings, on a 0-5 scale
+            popularity = self._popularity(avg_rating, num_ratings)
             
-            # Calculate popularity score (weighted combination of average rating and number of ratings)
-            # This is a simple formula that can be customized
-            if num_ratings == 0:
-                popularity = 0.0
-            else:
-                # Normalize number of ratings using a log scale to avoid large numbers dominating
-                norm_num_ratings = min(1.0, 0.1 * (1 + num_ratings) / 2)
-                
-                # Combine average rating and number of ratings
-                popularity = (0.7 * avg_rating / 5.0) + (0.3 * norm_num_ratings)
-                
-                # Ensure score is between 0 and 1
-                popularity = max(0.0, min(1.0, popularity))
-                
             # Update the item's popularity score
             item = ItemModel.find_by_id(item_id)
             if item:
-                item.update_popularity(popularity * 5.0)  # Scale back to 0-5 range
+                item.update_popularity(popularity)
                 
-            logger.info(f"Updated popularity score for item {item_id} to {popularity * 5.0:.2f}")
+            logger.info("Updated popularity score for item %s to %.2f", item_id, popularity)
         except Exception as e:
             logger.error(f"Error updating item popularity: {str(e)}")
             raise
     
+    def update_all_popularities(self) -> int:
+        """
+        Update the popularity score of every item in one database statement.
+        
+        Use update_item_popularity for targeted updates of single items.
+        
+        Returns:
+            The number of items updated
+        """
+        logger.info("Updating popularity scores for all items")
+        
+        try:
+            return RatingModel.recompute_all_popularities()
+        except Exception as e:
+            logger.error(f"Error updating item popularities: {str(e)}")
+            raise
+    
     def get_similar_items(
         self, 
         item_id: int, 
@@ -314,7 +443,7 @@ class RecommendationEngine:
         Returns:
             A list of dictionaries containing similar item details
         """
-        logger.info(f"Finding items similar to item {item_id}")
+        logger.debug("Finding items similar to item %s", item_id)
         
         try:
             # Get the strategy to use
@@ -328,29 +457,30 @@ class RecommendationEngine:
                 logger.error("No strategy available")
                 return []
                 
-            # Get all items
-            items = ItemModel.find_all()
-            
-            # Calculate similarity for each item
-            similarities = []
-            for item in items:
-                # Skip the same item
-                if item.id == item_id:
-                    continue
-                    
-                # Calculate similarity
-                similarity = strategy.get_similarity(item_id, item.id)
-                
-                # Add to list if similarity is positive
-                if similarity > 0:
-                    similarities.append((item, similarity))
+            # Get the IDs of all items except the item itself; only the top n are loaded in full
+            item_ids = ItemModel.all_ids()
+            item_ids = item_ids[item_ids != item_id]
+            if not len(item_ids) or n <= 0:
+                return []
+            
+            # Reason: one vectorized call scores every item instead of one
+            # get_similarity call per pair
+            similarities = strategy.get_similarity_vector(item_id, item_ids)
             
-            # Sort by similarity and take top n
-            similar_items = sorted(similarities, key=lambda x: x[1], reverse=True)[:n]
+            # Keep positive similarities and take the top n without sorting them all
+            candidates = np.flatnonzero(similarities > 0)
+            if len(candidates) > n:
+                candidates = np.sort(candidates[np.argpartition(-similarities[candidates], n - 1)[:n]])
+            top = candidates[np.argsort(-similarities[candidates], kind="stable")]
             
-            # Format results
+            # Load and format only the items that made the cut, in one batched query
+            items = ItemModel.find_by_ids(item_ids[top].tolist())
             results = []
-            for item, similarity in similar_items:
+            for index in top:
+                item = items.get(int(item_ids[index]))
+                if item is None:
+                    continue
+                similarity = float(similarities[index])
                 results.append({
                     "item_id": item.id,
                     "name": item.name,
@@ -360,7 +490,7 @@ class RecommendationEngine:
                     "similarity_percent": f"{similarity * 100:.1f}%"
                 })
                 
-            logger.info(f"Found {len(results)} items similar to item {item_id}")
+            logger.info("Found %d items similar to item %s", len(results), item_id)
             return results
         except Exception as e:
             logger.error(f"Error finding similar items: {str(e)}")
@@ -372,7 +502,7 @@ class RecommendationEngine:
         n: int = 10,
         diversity_factor: float = 0.3,
         **kwargs
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Mapping[str, Any]]:
         """
         Generate diverse recommendations for a user.
         
@@ -386,9 +516,9 @@ class RecommendationEngine:
             **kwargs: Additional parameters
             
         Returns:
-            A list of dictionaries containing recommended item details
+            A RecommendationResult, a sequence of dictionary-style recommendations
         """
-        logger.info(f"Generating diverse recommendations for user {user_id}")
+        logger.debug("Generating diverse recommendations for user %s", user_id)
         
         try:
             # Get more recommendations than needed to allow for diversification
@@ -397,49 +527,21 @@ class RecommendationEngine:
             if len(recommendations) <= n:
                 return recommendations
                 
-            # Initialize selected recommendations with the highest-scored item
-            selected = [recommendations[0]]
-            recommendations = recommendations[1:]
-            
-            # Select the remaining items
-            for _ in range(min(n - 1, len(recommendations))):
-                # Calculate diversity score for each remaining item
-                diversity_scores = []
-                
-                for i, rec in enumerate(recommendations):
-                    # Calculate average similarity to already selected items
-                    avg_similarity = 0.0
-                    for selected_rec in selected:
-                        # Use the default strategy for similarity calculation
-                        similarity = self._default_strategy.get_similarity(
-                            rec["item_id"], 
-                            selected_rec["item_id"]
-                        )
-                        avg_similarity += similarity
-                        
-                    if selected:
-                        avg_similarity /= len(selected)
-                        
-                    # Calculate diversity score (inverse of similarity)
-                    diversity = 1.0 - avg_similarity
-                    
-                    # Calculate combined score (weighted average of recommendation score and diversity)
-                    combined_score = (
-                        (1.0 - diversity_factor) * rec["score"] + 
-                        diversity_factor * diversity
-                    )
-                    
-                    diversity_scores.append((i, combined_score))
-                
-                # Select the item with the highest combined score
-                if diversity_scores:
-                    best_index, _ = max(diversity_scores, key=lambda x: x[1])
-                    selected.append(recommendations[best_index])
-                    recommendations.pop(best_index)
-                else:
-                    break
-            
-            logger.info(f"Generated {len(selected)} diverse recommendations for user {user_id}")
+            # Pairwise similarity of the candidates, one vectorized row per candidate
+            # using the default strategy (item similarity is symmetric)
+            item_ids = recommendations.ids
+            # Reason: bound once, the method isn't re-resolved for every candidate row
+            get_similarity_vector = self._default_strategy.get_similarity_vector
+            similarity = np.vstack([
+                get_similarity_vector(candidate_id, item_ids)
+                for candidate_id in item_ids.tolist()
+            ])
+            
+            # Start from the highest-scored item and add the best balance of score and diversity
+            picks = _select_diverse(recommendations.scores, similarity, n, diversity_factor)
+            selected = recommendations.take(picks)
+            
+            logger.info("Generated %d diverse recommendations for user %s", len(selected), user_id)
             return selected
         except Exception as e:
             logger.error(f"Error generating diverse recommendations: {str(e)}")
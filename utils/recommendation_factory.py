@@ -4,7 +4,9 @@ Recommendation Factory Module.
 This module implements the Factory pattern for creating recommendation strategies.
 """
 import logging
-from typing import Dict, Any, Type, Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Type, Optional, Tuple
 from strategies.recommendation_strategy import RecommendationStrategy
 from strategies.collaborative_filtering import CollaborativeFilteringStrategy
 from strategies.content_based_filtering import ContentBasedFilteringStrategy
@@ -12,6 +14,27 @@ from strategies.hybrid_filtering import HybridFilteringStrategy
 
 logger = logging.getLogger(__name__)
 
+# Serializes cache misses so concurrent callers never build the same strategy twice
+_create_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _cached_create(strategy_class: Type[RecommendationStrategy],
+                   kwargs_items: Tuple[Tuple[str, Any], ...]) -> RecommendationStrategy:
+    """
+    Create a strategy instance, memoized per class and constructor arguments.
+    
+    Args:
+        strategy_class: The strategy class to instantiate
+        kwargs_items: The constructor keyword arguments as sorted (name, value) pairs
+        
+    Returns:
+        The shared strategy instance for these arguments
+    """
+    strategy = strategy_class(**dict(kwargs_items))
+    logger.debug(f"Created {strategy.__class__.__name__}")
+    return strategy
+
 
 class RecommendationFactory:
     """
@@ -33,12 +56,16 @@ class RecommendationFactory:
         """
         Create a recommendation strategy of the specified type.
         
+        Strategies are shared per process: calls with the same type and
+        hashable arguments return the same instance. Calls with unhashable
+        arguments always get a new instance.
+        
         Args:
             strategy_type: The type of strategy to create
             **kwargs: Additional parameters to pass to the strategy constructor
             
         Returns:
-            A new instance of the specified strategy type
+            An instance of the specified strategy type
             
         Raises:
             ValueError: If the strategy type is unknown
@@ -55,14 +82,30 @@ class RecommendationFactory:
             # Get the strategy class
             strategy_class = cls._strategies[strategy_type]
             
-            # Create and return the strategy instance
-            strategy = strategy_class(**kwargs)
-            logger.debug(f"Created {strategy.__class__.__name__}")
-            return strategy
+            # Freeze the arguments into a cache key
+            kwargs_items = tuple(sorted(kwargs.items()))
+            try:
+                hash(kwargs_items)
+            except TypeError:
+                # Reason: unhashable arguments (e.g. a list of sub-strategies) can't be
+                # cached, so these callers get their own instance
+                strategy = strategy_class(**kwargs)
+                logger.debug(f"Created uncached {strategy.__class__.__name__}")
+                return strategy
+            
+            with _create_lock:
+                return _cached_create(strategy_class, kwargs_items)
         except Exception as e:
             logger.error(f"Error creating strategy: {str(e)}")
             raise
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all shared strategy instances, e.g. to start from untrained ones."""
+        with _create_lock:
+            _cached_create.cache_clear()
+        logger.info("Cleared the strategy cache")
+    
     @classmethod
     def register_strategy(cls, name: str, strategy_class: Type[RecommendationStrategy]) -> None:
         """
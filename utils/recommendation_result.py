@@ -0,0 +1,200 @@
+"""
+Recommendation Result Module.
+
+This module provides a compact, column-oriented container for post-processed recommendations.
+"""
+import logging
+from collections.abc import MutableMapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Union
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fields every recommendation exposes, whether or not the strategy provided them
+_DERIVED_FIELDS = ("item_id", "score", "recommendation_type", "score_percent")
+
+
+# Reason: the generated field-wise __eq__ would compare NumPy arrays, which have
+# no single truth value, so equality is defined below instead
+@dataclass(slots=True, eq=False)
+class RecommendationResult(Sequence):
+    """
+    Recommendations stored as parallel columns.
+
+    Item IDs and scores live in NumPy arrays, everything else a strategy
+    returned stays in its original dictionary. Indexing yields a
+    RecommendationView, so callers keep using dict-style access.
+    """
+    ids: np.ndarray
+    scores: np.ndarray
+    meta: List[Dict[str, Any]]
+
+    @classmethod
+    def empty(cls) -> 'RecommendationResult':
+        """
+        Create a result holding no recommendations.
+
+        Returns:
+            The empty result
+        """
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), [])
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'RecommendationResult':
+        """
+        Build a result from recommendation dictionaries, without copying them.
+
+        Args:
+            records: Recommendation dictionaries, each with an item_id
+
+        Returns:
+            The result holding the records
+        """
+        meta = list(records)
+        ids = np.fromiter((rec["item_id"] for rec in meta), dtype=np.int64, count=len(meta))
+        # Missing or empty scores count as 0
+        scores = np.fromiter((rec.get("score") or 0.0 for rec in meta), dtype=np.float64, count=len(meta))
+        return cls(ids, scores, meta)
+
+    def take(self, indices: Union[np.ndarray, List[int]]) -> 'RecommendationResult':
+        """
+        Select recommendations by position or boolean mask.
+
+        Args:
+            indices: Integer positions, or a boolean mask as long as the result
+
+        Returns:
+            A new result with the selected recommendations, in the given order
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        return RecommendationResult(
+            self.ids[indices], self.scores[indices], [self.meta[i] for i in indices]
+        )
+
+    def column(self, key: str, default: Any = None, dtype: Any = object) -> np.ndarray:
+        """
+        Gather one strategy-provided field of every recommendation into an array.
+
+        Args:
+            key: The field name
+            default: The value used where a recommendation lacks the field
+            dtype: The dtype of the returned array
+
+        Returns:
+            Array with one entry per recommendation
+        """
+        return np.array([rec.get(key, default) for rec in self.meta], dtype=dtype)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two results by their item IDs, scores and strategy fields."""
+        if not isinstance(other, RecommendationResult):
+            return NotImplemented
+        return (
+            np.array_equal(self.ids, other.ids)
+            and np.array_equal(self.scores, other.scores)
+            and self.meta == other.meta
+        )
+
+    # Results are mutable, so they can't be hashed
+    __hash__ = None
+
+    def __len__(self) -> int:
+        """Return the number of recommendations."""
+        return len(self.meta)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union['RecommendationView', 'RecommendationResult']:
+        """
+        Get one recommendation, or a slice of them as a new result.
+
+        Args:
+            index: The position or slice
+
+        Returns:
+            A view of the recommendation, or a result for slices
+        """
+        if isinstance(index, slice):
+            return RecommendationResult(self.ids[index], self.scores[index], self.meta[index])
+        if index < 0:
+            index += len(self.meta)
+        if not 0 <= index < len(self.meta):
+            raise IndexError("recommendation index out of range")
+        return RecommendationView(self, index)
+
+
+class RecommendationView(MutableMapping):
+    """
+    Dictionary-style view of a single recommendation in a RecommendationResult.
+
+    ``score_percent`` is formatted only when it is read.
+    """
+
+    __slots__ = ("_result", "_index")
+
+    def __init__(self, result: RecommendationResult, index: int):
+        """
+        Initialize the view.
+
+        Args:
+            result: The result holding the recommendation
+            index: The recommendation's position in the result
+        """
+        self._result = result
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a field of the recommendation."""
+        result, index = self._result, self._index
+        if key == "item_id":
+            return int(result.ids[index])
+        if key == "score":
+            return float(result.scores[index])
+
+        meta = result.meta[index]
+        if key == "score_percent":
+            return meta.get("score_percent") or f"{result.scores[index] * 100:.1f}%"
+        if key == "recommendation_type":
+            return meta.get("recommendation_type", "unknown")
+        return meta[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field of the recommendation."""
+        result, index = self._result, self._index
+        if key == "item_id":
+            result.ids[index] = value
+        elif key == "score":
+            result.scores[index] = value
+        else:
+            result.meta[index][key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a field of the recommendation; derived fields can't be removed."""
+        if key in _DERIVED_FIELDS:
+            raise KeyError(f"Field '{key}' is always present")
+        del self._result.meta[self._index][key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a field without reading it, so score_percent isn't formatted."""
+        return key in _DERIVED_FIELDS or key in self._result.meta[self._index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        yield from _DERIVED_FIELDS
+        for key in self._result.meta[self._index]:
+            if key not in _DERIVED_FIELDS:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        meta = self._result.meta[self._index]
+        return len(_DERIVED_FIELDS) + sum(1 for key in meta if key not in _DERIVED_FIELDS)
+
+    def __reduce__(self):
+        """Pickle as a plain dictionary, so cached copies don't drag the whole result along."""
+        return dict, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        """Return the dictionary representation of the recommendation."""
+        return repr(dict(self.items()))
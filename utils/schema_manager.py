@@ -5,7 +5,10 @@ This module provides functionality for tracking and managing database schema sta
 """
 import logging
 import os
+import threading
+import time
 from typing import Dict, List, Any, Optional, Set
+from .config import SCHEMA_CACHE_TTL
 from .db_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
@@ -13,22 +16,24 @@ logger = logging.getLogger(__name__)
 
 class DatabaseSchemaManager:
     """
-    Singleton class for managing database schema status and providing information
-    about field compatibility between models and database tables.
+    Manages database schema status and provides information about field
+    compatibility between models and database tables.
+    
+    The application shares one instance, obtained with get_schema_manager().
     """
-    _instance = None
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DatabaseSchemaManager, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+    __slots__ = ("db", "_table_columns", "_missing_fields", "_last_refresh", "_negative", "_lock")
     
-    def _initialize(self):
+    def __init__(self):
         """Initialize the schema manager."""
         self.db = DatabaseManager().client
         self._table_columns = {}
         self._missing_fields = {}
+        # Monotonic time of the last successful refresh
+        self._last_refresh = 0.0
+        # Tables looked up since the last refresh that don't exist
+        self._negative: Set[str] = set()
+        self._lock = threading.RLock()
         
     def refresh_schema_cache(self) -> Dict[str, List[str]]:
         """
@@ -37,8 +42,35 @@ class DatabaseSchemaManager:
         Returns:
             Dictionary mapping table names to lists of column names
         """
+        with self._lock:
+            tables_info = self._fetch_schema()
+            if tables_info:
+                self._table_columns = tables_info
+                self._last_refresh = time.monotonic()
+                # Tables that showed up since are no longer known to be missing
+                self._negative = {name for name in self._negative if name not in tables_info}
+            return tables_info
+    
+    def _fetch_schema(self) -> Dict[str, List[str]]:
+        """
+        Query the database for all tables and columns.
+        
+        Returns:
+            Dictionary mapping table names to lists of column names, empty on failure
+        """
         try:
             logger.info("Refreshing database schema cache")
+            
+            # Reason: the get_schema_columns() function aggregates the columns on the
+            # server, so one JSON object comes back instead of a row per column
+            try:
+                response = self.db.rpc("get_schema_columns").execute()
+                if isinstance(response.data, dict):
+                    logger.info(f"Schema cache refreshed, found {len(response.data)} tables")
+                    return response.data
+            except Exception as rpc_error:
+                logger.warning(f"get_schema_columns() unavailable, querying columns directly: {str(rpc_error)}")
+            
             # This is the most compatible way to get schema info from Supabase
             # Get schema for all tables
             tables_info = {}
@@ -61,7 +93,6 @@ class DatabaseSchemaManager:
                     
                     tables_info[table_name].append(column_name)
                 
-                self._table_columns = tables_info
                 logger.info(f"Schema cache refreshed, found {len(tables_info)} tables")
                 return tables_info
             else:
@@ -81,11 +112,21 @@ class DatabaseSchemaManager:
         Returns:
             List of column names
         """
-        # Refresh cache if this table isn't in our cache yet
-        if not self._table_columns or table_name not in self._table_columns:
+        with self._lock:
+            expired = time.monotonic() - self._last_refresh >= SCHEMA_CACHE_TTL
+            
+            # Reason: a table that was missing at the last refresh stays missing
+            # until the cache expires, so repeated lookups don't refetch the schema
+            if self._table_columns and not expired:
+                if table_name in self._table_columns:
+                    return self._table_columns[table_name]
+                if table_name in self._negative:
+                    return []
+            
             self.refresh_schema_cache()
-        
-        return self._table_columns.get(table_name, [])
+            if table_name not in self._table_columns:
+                self._negative.add(table_name)
+            return self._table_columns.get(table_name, [])
     
     def register_missing_field(self, table_name: str, field_name: str):
         """
@@ -154,3 +195,23 @@ class DatabaseSchemaManager:
         """
         columns = self.get_table_columns(table_name)
         return field_name in columns
+
+
+_schema_manager: Optional[DatabaseSchemaManager] = None
+_schema_manager_lock = threading.Lock()
+
+
+def get_schema_manager() -> DatabaseSchemaManager:
+    """
+    Get the shared schema manager, creating it on first use.
+    
+    Returns:
+        The shared DatabaseSchemaManager instance
+    """
+    global _schema_manager
+    # Reason: created lazily rather than at import, since creating it connects to the database
+    if _schema_manager is None:
+        with _schema_manager_lock:
+            if _schema_manager is None:
+                _schema_manager = DatabaseSchemaManager()
+    return _schema_manager